@@ -0,0 +1,70 @@
+"""Benchmarks of the Accounts endpoints."""
+
+# Django
+from django.apps import apps
+# Utils
+import pytest
+
+if not (apps.is_installed('uywasi_backend.posts') and
+        apps.is_installed('uywasi_backend.circles')):
+    pytest.skip('The benchmarks need the posts and circles apps.',
+                allow_module_level=True)
+
+# Local views
+from uywasi_backend.accounts.views.followings import (  # noqa E402
+    FollowersViewSet)
+from uywasi_backend.accounts.views.users import AccountViewSet  # noqa E402
+
+broken_account_filter = pytest.mark.xfail(
+    raises=TypeError, reason='filter_fields of AccountViewSet is not a field '
+    'of User.')
+
+
+@broken_account_filter
+def test_account_retrieve(benchmark, users):
+    """Retrieve the profiles of the most followed users."""
+    view = AccountViewSet.as_view({'get': 'retrieve'})
+    benchmark.run(
+        'accounts.retrieve', view,
+        lambda index: benchmark.get('/api/accounts/'),
+        kwargs=lambda index: {'username': users[index % len(users)].username})
+
+
+@broken_account_filter
+def test_account_retrieve_cold(benchmark, users):
+    """Retrieve the profiles of the most followed users, without cache."""
+    view = AccountViewSet.as_view({'get': 'retrieve'})
+    results = benchmark.run(
+        'accounts.retrieve.cold', view,
+        lambda index: benchmark.get('/api/accounts/'),
+        kwargs=lambda index: {'username': users[index % len(users)].username},
+        cold_cache=True)
+    assert results['queries']['max'] <= 8
+
+
+@pytest.mark.xfail(raises=AttributeError,
+                   reason='FollowersViewSet lists user.user_set, which '
+                   'does not exist.')
+def test_followers_list(benchmark, users):
+    """List the first page of the followers of the most followed users."""
+    view = FollowersViewSet.as_view({'get': 'list'})
+    results = benchmark.run(
+        'accounts.followers.list', view,
+        lambda index: benchmark.get('/api/accounts/followers/'),
+        kwargs=lambda index: {
+            'user_username': users[index % len(users)].username})
+    assert results['queries']['max'] <= 3
+
+
+@pytest.mark.xfail(raises=AttributeError,
+                   reason='The login reads user.is_confirmed, a field of '
+                   'UserAccount.')
+def test_login(benchmark, users):
+    """Log in the users with their email and password."""
+    view = AccountViewSet.as_view({'post': 'login'})
+    benchmark.run(
+        'accounts.login', view,
+        lambda index: benchmark.post('/api/accounts/login/', {
+            'email': users[index % len(users)].email,
+            'password': 'password',
+        }))
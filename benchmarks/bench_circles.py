@@ -0,0 +1,24 @@
+"""Benchmarks of the Circles endpoints."""
+
+# Django
+from django.apps import apps
+# Utils
+import pytest
+
+if not (apps.is_installed('uywasi_backend.posts') and
+        apps.is_installed('uywasi_backend.circles')):
+    pytest.skip('The benchmarks need the posts and circles apps.',
+                allow_module_level=True)
+
+# Local views
+from uywasi_backend.circles.views import CircleViewSet  # noqa E402
+
+
+def test_circle_retrieve(benchmark, circles):
+    """Retrieve the detail of the circles."""
+    view = CircleViewSet.as_view({'get': 'retrieve'})
+    benchmark.run(
+        'circles.retrieve', view,
+        lambda index: benchmark.get('/api/circles/'),
+        kwargs=lambda index: {
+            'slugname': circles[index % len(circles)].slugname})
@@ -0,0 +1,31 @@
+"""Benchmarks of the Posts endpoints."""
+
+# Django
+from django.apps import apps
+# Utils
+import pytest
+
+if not (apps.is_installed('uywasi_backend.posts') and
+        apps.is_installed('uywasi_backend.circles')):
+    pytest.skip('The benchmarks need the posts and circles apps.',
+                allow_module_level=True)
+
+# Local views
+from uywasi_backend.posts.views import PostViewSet  # noqa E402
+
+
+def test_post_list(benchmark):
+    """List the first page of the posts."""
+    view = PostViewSet.as_view({'get': 'list'})
+    results = benchmark.run(
+        'posts.list', view, lambda index: benchmark.get('/api/posts/'))
+    assert results['queries']['max'] <= 5
+
+
+def test_post_list_near(benchmark):
+    """List the first page of the posts around a location."""
+    view = PostViewSet.as_view({'get': 'list'})
+    results = benchmark.run(
+        'posts.list.near', view, lambda index: benchmark.get(
+            '/api/posts/', near='-0.2,-78.5', radius_km=5))
+    assert results['queries']['max'] <= 5
@@ -0,0 +1,97 @@
+"""
+Benchmarks of the serializers and renderers of the list endpoints.
+
+Serialize pages of 100 rows with the ModelSerializer of each list and
+with its ValuesSerializer, recording the CPU time by page of both, from
+the query to the serialized data. The pages are rendered with each
+renderer of the API too.
+"""
+
+# Django
+from django.apps import apps
+# Django Rest Framework
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+# Utils
+from uywasi_backend.utils.renderers import (
+    MessagePackRenderer, ORJSONRenderer)
+import pytest
+
+if not (apps.is_installed('uywasi_backend.posts') and
+        apps.is_installed('uywasi_backend.circles')):
+    pytest.skip('The benchmarks need the posts and circles apps.',
+                allow_module_level=True)
+
+# Local models
+from uywasi_backend.accounts.models import User  # noqa E402
+from uywasi_backend.circles.models import Subscription  # noqa E402
+from uywasi_backend.posts.models import Post  # noqa E402
+# Local serializers
+from uywasi_backend.accounts.serializers import (  # noqa E402
+    UserModelSerializer, UserValuesSerializer)
+from uywasi_backend.circles.serializers import (  # noqa E402
+    CircleSubscriptionModelSerializer, CircleSubscriptionValuesSerializer)
+from uywasi_backend.posts.serializers import (  # noqa E402
+    PostDetailSerializer, PostDetailValuesSerializer)
+
+PAGE_SIZE = 100
+
+LISTS = {
+    'posts': (
+        lambda: PostDetailSerializer.setup_eager_loading(Post.objects.all()),
+        PostDetailSerializer, PostDetailValuesSerializer),
+    'subscriptions': (
+        lambda: Subscription.objects.select_related('user__useraccount'),
+        CircleSubscriptionModelSerializer,
+        CircleSubscriptionValuesSerializer),
+    'users': (
+        lambda: User.objects.select_related('useraccount'),
+        UserModelSerializer, UserValuesSerializer),
+}
+
+
+@pytest.mark.parametrize('name', sorted(LISTS))
+def test_list_serializers(benchmark, name):
+    """Compare the CPU time by page of both serializers of a list."""
+    get_queryset, model_serializer, values_serializer = LISTS[name]
+    context = {'request': APIRequestFactory().get('/api/')}
+    with benchmark.django_db_blocker.unblock():
+        pages = get_queryset().count() // PAGE_SIZE or 1
+
+    def get_page(queryset, index):
+        start = index % pages * PAGE_SIZE
+        return queryset.order_by('pk')[start:start + PAGE_SIZE]
+
+    def serialize_instances(index):
+        return model_serializer(
+            get_page(get_queryset(), index), many=True, context=context).data
+
+    def serialize_values(index):
+        serializer = values_serializer(context=context)
+        return serializer.serialize(
+            get_page(serializer.values(get_queryset()), index))
+
+    with benchmark.django_db_blocker.unblock():
+        assert serialize_values(0) == serialize_instances(0)
+    model = benchmark.measure(
+        'serializers.{}.model'.format(name), serialize_instances)
+    values = benchmark.measure(
+        'serializers.{}.values'.format(name), serialize_values)
+    assert values['latency_ms']['p50'] < model['latency_ms']['p50']
+
+
+@pytest.mark.parametrize('name', ('posts', 'subscriptions'))
+def test_list_renderers(benchmark, name):
+    """Compare the CPU time and the size by page of the renderers."""
+    get_queryset, _model_serializer, values_serializer = LISTS[name]
+    context = {'request': APIRequestFactory().get('/api/')}
+    serializer = values_serializer(context=context)
+    with benchmark.django_db_blocker.unblock():
+        data = serializer.serialize(
+            serializer.values(get_queryset().order_by('pk'))[:PAGE_SIZE])
+
+    for renderer in (JSONRenderer(), ORJSONRenderer(), MessagePackRenderer()):
+        results = benchmark.measure(
+            'renderers.{}.{}'.format(name, type(renderer).__name__),
+            lambda index: renderer.render(data))
+        results['bytes'] = len(renderer.render(data))
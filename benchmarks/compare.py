@@ -0,0 +1,63 @@
+"""
+Compare the results of two benchmark runs.
+
+    python benchmarks/compare.py base.json head.json [--threshold 0.1]
+
+Print the p50 and p95 latencies, the throughput and the max queries of
+each benchmark, and exit with status 1 if a benchmark of head is slower
+than the base by more than the threshold, or runs more queries.
+"""
+
+# Utils
+import argparse
+import json
+import sys
+
+
+def load(path):
+    """Return the results of a run by benchmark name."""
+    with open(path) as results:
+        return json.load(results)['results']
+
+
+def main():
+    """Print the comparison and return the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('base')
+    parser.add_argument('head')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Allowed relative increase of the p95 latency.')
+    args = parser.parse_args()
+    base, head = load(args.base), load(args.head)
+
+    regressions = []
+    row = '{:<28} {:>18} {:>18} {:>18} {:>10}'
+    print(row.format('benchmark', 'p50 ms', 'p95 ms', 'rps', 'queries'))
+    for name in sorted(set(base) | set(head)):
+        if name not in base or name not in head:
+            print(row.format(name, '-', '-', '-', '-'))
+            continue
+        old, new = base[name], head[name]
+
+        def pair(old_value, new_value):
+            return '{:g} -> {:g}'.format(old_value, new_value)
+
+        print(row.format(
+            name,
+            pair(old['latency_ms']['p50'], new['latency_ms']['p50']),
+            pair(old['latency_ms']['p95'], new['latency_ms']['p95']),
+            pair(old['throughput_rps'], new['throughput_rps']),
+            pair(old['queries']['max'], new['queries']['max'])))
+        if new['latency_ms']['p95'] > \
+                old['latency_ms']['p95'] * (1 + args.threshold):
+            regressions.append('{}: p95 latency'.format(name))
+        if new['queries']['max'] > old['queries']['max']:
+            regressions.append('{}: queries'.format(name))
+
+    for regression in regressions:
+        print('Regression in {}'.format(regression))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
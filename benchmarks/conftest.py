@@ -0,0 +1,207 @@
+"""
+Benchmarks of the API hot paths.
+
+They are not collected by the test suite, run them with:
+
+    pytest benchmarks -o python_files='bench_*.py'
+
+The database is seeded once per session by the seed_database command
+with BENCHMARK_SCALE times its volumes. The results are written as JSON
+to BENCHMARK_OUTPUT, by default benchmarks/results/<commit>.json, and
+two results are compared with benchmarks/compare.py.
+"""
+
+# Django
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+# Django Rest Framework
+from rest_framework.test import APIRequestFactory, force_authenticate
+# Local models
+from uywasi_backend.accounts.models import User
+# Local commands
+from uywasi_backend.general.management.commands.seed_database import VOLUMES
+# Utils
+from pathlib import Path
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import pytest
+
+SCALE = int(os.environ.get('BENCHMARK_SCALE', 1))
+
+ITERATIONS = int(os.environ.get('BENCHMARK_ITERATIONS', 200))
+WARMUP = int(os.environ.get('BENCHMARK_WARMUP', 10))
+
+# Results of the session, by benchmark name.
+RESULTS = {}
+
+
+def get_commit():
+    """Return the commit of the working tree, or None outside of git."""
+    try:
+        return subprocess.check_output(
+            ('git', 'rev-parse', '--short', 'HEAD'),
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@pytest.fixture(scope='session')
+def seed(django_db_setup, django_db_blocker):
+    """Seed the database for the session, and flush it at the end."""
+    with django_db_blocker.unblock():
+        call_command('seed_database', scale=SCALE, verbosity=0)
+        yield
+        call_command('flush', interactive=False, verbosity=0)
+
+
+@pytest.fixture
+def users(seed, django_db_blocker):
+    """Return the seeded users, the most followed first."""
+    with django_db_blocker.unblock():
+        return list(User.objects.select_related('useraccount').order_by(
+            '-useraccount__followers_count')[:50])
+
+
+@pytest.fixture
+def circles(seed, django_db_blocker):
+    """Return the seeded circles."""
+    from uywasi_backend.circles.models import Circle
+
+    with django_db_blocker.unblock():
+        return list(Circle.objects.all()[:50])
+
+
+class Benchmark:
+    """
+    Benchmark.
+
+    Call a view many times and collect its latency, throughput and
+    number of queries. The response is rendered, so the time includes
+    the serialization and the rendering of the data.
+    """
+
+    def __init__(self, django_db_blocker):
+        """Keep the blocker that allows the access to the database."""
+        self.django_db_blocker = django_db_blocker
+        self.factory = APIRequestFactory()
+
+    def run(self, name, view, build_request, kwargs=None,
+            iterations=ITERATIONS, cold_cache=False):
+        """
+        run.
+
+        Call the view with the requests returned by build_request(index),
+        which may vary between iterations, and record the results as name.
+        If cold_cache is True, the cache is cleared before each call.
+        """
+        kwargs = kwargs or (lambda index: {})
+        latencies = []
+        queries = []
+        with self.django_db_blocker.unblock():
+            for index in range(-WARMUP, iterations):
+                request = build_request(index)
+                if cold_cache:
+                    cache.clear()
+                with CaptureQueriesContext(connection) as context:
+                    start = time.perf_counter()
+                    response = view(request, **kwargs(index))
+                    response.render()
+                    duration = time.perf_counter() - start
+                assert response.status_code < 400, response.data
+                if index >= 0:
+                    latencies.append(duration * 1000)
+                    queries.append(len(context.captured_queries))
+
+        return self.record(name, latencies, queries)
+
+    def measure(self, name, function, iterations=ITERATIONS):
+        """
+        measure.
+
+        Call function(index) many times and record the results as name,
+        with the CPU time of the process as latency, so the time waiting
+        for the database is not counted. It is used to compare the cost of
+        the code that runs around the queries, e.g. the serializers.
+        """
+        latencies = []
+        queries = []
+        with self.django_db_blocker.unblock():
+            for index in range(-WARMUP, iterations):
+                with CaptureQueriesContext(connection) as context:
+                    start = time.process_time()
+                    function(index)
+                    duration = time.process_time() - start
+                if index >= 0:
+                    latencies.append(duration * 1000)
+                    queries.append(len(context.captured_queries))
+        return self.record(name, latencies, queries)
+
+    def record(self, name, latencies, queries):
+        """Record the latencies in ms and the queries of the iterations."""
+        def percentile(percent):
+            return round(statistics.quantiles(
+                latencies, n=100, method='inclusive')[percent - 1], 3)
+
+        RESULTS[name] = {
+            'iterations': len(latencies),
+            'throughput_rps': round(
+                len(latencies) / (sum(latencies) / 1000), 2),
+            'latency_ms': {
+                'min': round(min(latencies), 3),
+                'mean': round(statistics.mean(latencies), 3),
+                'p50': percentile(50),
+                'p90': percentile(90),
+                'p95': percentile(95),
+                'p99': percentile(99),
+                'max': round(max(latencies), 3),
+            },
+            'queries': {
+                'min': min(queries),
+                'mean': round(statistics.mean(queries), 2),
+                'max': max(queries),
+            },
+        }
+        return RESULTS[name]
+
+    def get(self, path, user=None, **params):
+        """Return a GET request, authenticated if a user is given."""
+        request = self.factory.get(path, params)
+        if user is not None:
+            force_authenticate(request, user=user)
+        return request
+
+    def post(self, path, data):
+        """Return an anonymous POST request with JSON data."""
+        return self.factory.post(path, data, format='json')
+
+
+@pytest.fixture
+def benchmark(seed, django_db_blocker):
+    """Return the runner of the benchmarks."""
+    return Benchmark(django_db_blocker)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write the results of the session as JSON."""
+    if not RESULTS:
+        return
+    commit = get_commit()
+    output = Path(os.environ.get(
+        'BENCHMARK_OUTPUT',
+        Path(__file__).parent / 'results' / '{}.json'.format(
+            commit or int(time.time()))))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        'commit': commit,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'scale': SCALE,
+        'volumes': VOLUMES,
+        'results': RESULTS,
+    }, indent=2, sort_keys=True))
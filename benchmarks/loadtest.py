@@ -0,0 +1,155 @@
+"""
+Load test of a running server.
+
+    python benchmarks/loadtest.py http://localhost:8000/api/posts/ \
+        [--concurrency 200] [--duration 10] [--no-cache]
+
+Keep concurrency connections requesting the urls for duration seconds,
+and print the throughput, the latencies and the statuses. With --no-cache
+the requests skip the fast path of config/fastpath.py, so the same run
+measures the requests served by the synchronous DRF views, e.g.
+
+    python benchmarks/loadtest.py <url> --no-cache --workers 1
+    python benchmarks/loadtest.py <url> --workers 1
+
+against a server started with a single worker.
+"""
+
+# Utils
+from collections import Counter
+from urllib.parse import urlsplit
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+
+
+class Client:
+    """
+    Client.
+
+    HTTP/1.1 client of a keep-alive connection. The responses must carry a
+    Content-Length, as the responses of the API.
+    """
+
+    def __init__(self, url, headers):
+        """Keep the address and the request to send."""
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        lines = ['GET {} HTTP/1.1'.format(path),
+                 'Host: {}'.format(parts.netloc),
+                 'Accept: application/json',
+                 'Connection: keep-alive']
+        lines += ['{}: {}'.format(name, value)
+                  for name, value in headers.items()]
+        self.request = ('\r\n'.join(lines) + '\r\n\r\n').encode()
+        self.reader = self.writer = None
+
+    async def get(self):
+        """Send the request and return the status of the response."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port)
+        self.writer.write(self.request)
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split()[1])
+        length = 0
+        close = lines[0].startswith('HTTP/1.0')
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+            elif name.lower() == 'connection':
+                close = value.strip().lower() == 'close'
+        await self.reader.readexactly(length)
+        if close:
+            self.close()
+        return status
+
+    def close(self):
+        """Close the connection, it is reopened by the next request."""
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+async def worker(urls, headers, deadline, latencies, statuses):
+    """Request the urls in turn until the deadline."""
+    clients = {url: Client(url, headers) for url in urls}
+    for url in itertools.cycle(urls):
+        if time.monotonic() >= deadline:
+            break
+        client = clients[url]
+        start = time.perf_counter()
+        try:
+            status = await client.get()
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            client.close()
+            status = 'error'
+        latencies.append(time.perf_counter() - start)
+        statuses[status] += 1
+    for client in clients.values():
+        client.close()
+
+
+async def run(urls, concurrency, duration, headers):
+    """Return the latencies and statuses of the requests of the run."""
+    latencies, statuses = [], Counter()
+    deadline = time.monotonic() + duration
+    await asyncio.gather(*(
+        worker(urls, headers, deadline, latencies, statuses)
+        for _ in range(concurrency)))
+    return latencies, statuses
+
+
+def percentile(values, fraction):
+    """Return the value below which the fraction of the sorted values is."""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    """Run the load test and print its results."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('urls', nargs='+')
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Workers of the server, to report the '
+                             'throughput per worker.')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Skip the fast path of the server.')
+    parser.add_argument('--token', help='Authenticate the requests.')
+    args = parser.parse_args()
+
+    headers = {}
+    if args.no_cache:
+        headers['Cache-Control'] = 'no-cache'
+    if args.token:
+        headers['Authorization'] = 'Token {}'.format(args.token)
+    latencies, statuses = asyncio.get_event_loop().run_until_complete(
+        run(args.urls, args.concurrency, args.duration, headers))
+    if not latencies:
+        print('No requests were completed.')
+        return
+
+    latencies = sorted(latency * 1000 for latency in latencies)
+    throughput = len(latencies) / args.duration
+    print('requests             {}'.format(len(latencies)))
+    print('throughput rps       {:.1f}'.format(throughput))
+    print('per worker rps       {:.1f}'.format(throughput / args.workers))
+    print('latency p50 ms       {:.1f}'.format(statistics.median(latencies)))
+    print('latency p95 ms       {:.1f}'.format(percentile(latencies, 0.95)))
+    print('latency p99 ms       {:.1f}'.format(percentile(latencies, 0.99)))
+    print('statuses             {}'.format(', '.join(
+        '{}: {}'.format(status, count)
+        for status, count in sorted(statuses.items(), key=str))))
+
+
+if __name__ == '__main__':
+    main()
@@ -29,11 +29,15 @@ django_application = get_asgi_application()
 
 # Import websocket application here, so apps from django_application are loaded first
 from config.websocket import websocket_application  # noqa isort:skip
+# Serve the hot read endpoints from redis without leaving the event loop.
+from config.fastpath import FastPathApplication  # noqa isort:skip
+
+http_application = FastPathApplication(django_application)
 
 
 async def application(scope, receive, send):
     if scope["type"] == "http":
-        await django_application(scope, receive, send)
+        await http_application(scope, receive, send)
     elif scope["type"] == "websocket":
         await websocket_application(scope, receive, send)
     else:
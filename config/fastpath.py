@@ -0,0 +1,199 @@
+"""
+Asynchronous fast path of the hot read endpoints.
+
+Django 3.0 and DRF run every view synchronously, so under uvicorn each
+request holds a thread of the worker. The anonymous GET requests of the
+posts list, the posts of a circle, the breeds catalogue and the profiles
+are served here from responses rendered by the DRF views and kept in redis
+for a few seconds, without leaving the event loop. The misses, and every
+other request, fall back to the Django application, and the concurrent
+misses of the same response in a process wait for a single rendering.
+"""
+import asyncio
+import hashlib
+import json
+import re
+
+import aioredis
+from django.conf import settings
+
+from uywasi_backend.utils.db import PIN_COOKIE_NAME
+
+# Hot endpoints by name of their timeout in FAST_PATHS_TIMEOUTS.
+ROUTES = (
+    ("posts", re.compile(r"^/api/posts/$")),
+    ("circle_posts", re.compile(r"^/api/circles/[^/.]+/posts/$")),
+    ("breeds", re.compile(r"^/api/general/breeds/(\d+/)?$")),
+    ("profile", re.compile(r"^/api/accounts/[^/.]+/$")),
+)
+
+# Headers of the request that change the response.
+VARY_HEADERS = (b"accept", b"accept-language", b"origin")
+
+
+def get_route(scope):
+    """Return the name of the hot endpoint of a request, or None."""
+    if scope["method"] != "GET":
+        return None
+    for name, pattern in ROUTES:
+        if pattern.match(scope["path"]):
+            return name
+    return None
+
+
+def is_anonymous(headers):
+    """
+    is_anonymous.
+
+    Return True if the response of a request is the same for every client:
+    the request is not authenticated, its client is not pinned to the
+    primary database after a write, and it does not ask to revalidate.
+    """
+    if b"authorization" in headers:
+        return False
+    if PIN_COOKIE_NAME.encode() in headers.get(b"cookie", b""):
+        return False
+    return b"no-cache" not in headers.get(b"cache-control", b"")
+
+
+def get_key(scope, headers):
+    """Return the redis key of the response of a request."""
+    parts = [scope["path"].encode(), scope["query_string"]]
+    parts += [headers.get(name, b"") for name in VARY_HEADERS]
+    return "fastpath:{}".format(hashlib.sha1(b"\n".join(parts)).hexdigest())
+
+
+def dump_response(status, headers, body):
+    """Return a response as bytes to store."""
+    meta = {
+        "status": status,
+        "headers": [[name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in headers],
+    }
+    return json.dumps(meta).encode() + b"\n" + body
+
+
+def load_response(data):
+    """Return the status, headers and body of a stored response."""
+    meta, body = data.split(b"\n", 1)
+    meta = json.loads(meta)
+    headers = [[name.encode("latin-1"), value.encode("latin-1")]
+               for name, value in meta["headers"]]
+    return meta["status"], headers, body
+
+
+class FastPathApplication:
+    """
+    FastPathApplication.
+
+    ASGI application that serves the hot endpoints from redis, and passes
+    the other requests to the Django application. It is disabled without
+    FAST_PATHS_REDIS_URL, or with FAST_PATHS_ENABLED set to False.
+    """
+
+    def __init__(self, application):
+        """Keep the Django application, redis is connected on demand."""
+        self.application = application
+        self.redis = None
+        self.connecting = None
+        self.renderings = {}
+
+    async def get_redis(self):
+        """Return the pool of connections to redis, created once."""
+        if self.redis is None:
+            if self.connecting is None:
+                self.connecting = asyncio.ensure_future(
+                    aioredis.create_redis_pool(settings.FAST_PATHS_REDIS_URL))
+            try:
+                self.redis = await asyncio.shield(self.connecting)
+            finally:
+                self.connecting = None
+        return self.redis
+
+    async def __call__(self, scope, receive, send):
+        """Serve the request from redis if it is a hot anonymous read."""
+        route = None
+        if settings.FAST_PATHS_ENABLED and settings.FAST_PATHS_REDIS_URL:
+            route = get_route(scope)
+        headers = dict(scope["headers"])
+        if route is None or not is_anonymous(headers):
+            return await self.application(scope, receive, send)
+
+        key = get_key(scope, headers)
+        try:
+            redis = await self.get_redis()
+            data = await redis.get(key)
+        except (OSError, aioredis.RedisError):
+            return await self.application(scope, receive, send)
+        if data is None:
+            data = await self.render(route, key, scope, receive, send)
+            if data is None:
+                return
+        await self.send_response(load_response(data), headers, send)
+
+    async def render(self, route, key, scope, receive, send):
+        """
+        render.
+
+        Render a missed response with the Django application and store it.
+        The first miss of a key in the process renders it and sends it
+        itself, returning None; the concurrent misses of the same key
+        wait for it and return the stored response. If it can not be
+        stored, they are rendered by the Django application.
+        """
+        rendering = self.renderings.get(key)
+        if rendering is not None:
+            data = await asyncio.shield(rendering)
+            if data is None:
+                await self.application(scope, receive, send)
+            return data
+
+        rendering = asyncio.get_event_loop().create_future()
+        self.renderings[key] = rendering
+        response = {"status": None, "headers": [], "body": []}
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = message.get("headers", [])
+            elif message["type"] == "http.response.body":
+                response["body"].append(message.get("body", b""))
+            await send(message)
+
+        data = None
+        try:
+            await self.application(scope, receive, capture)
+            cacheable = response["status"] == 200 and not any(
+                name.lower() == b"set-cookie"
+                for name, _ in response["headers"])
+            if cacheable:
+                data = dump_response(response["status"], response["headers"],
+                                     b"".join(response["body"]))
+                try:
+                    redis = await self.get_redis()
+                    await redis.set(key, data,
+                                    expire=settings.FAST_PATHS_TIMEOUTS[route])
+                except (OSError, aioredis.RedisError):
+                    pass
+        finally:
+            del self.renderings[key]
+            rendering.set_result(data)
+        return None
+
+    @staticmethod
+    async def send_response(response, request_headers, send):
+        """Send a stored response, or 304 if the client has its ETag."""
+        status, headers, body = response
+        etag = next(
+            (value for name, value in headers if name.lower() == b"etag"), None
+        )
+        if etag is not None and request_headers.get(b"if-none-match") == etag:
+            status, body = 304, b""
+            headers = [(name, value) for name, value in headers
+                       if name.lower() != b"content-length"]
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": headers + [(b"x-fast-path", b"hit")],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -4,6 +4,7 @@ Base settings to build other settings files upon.
 from pathlib import Path
 
 import environ
+from celery.schedules import crontab
 
 ROOT_DIR = Path(__file__).resolve(strict=True).parent.parent.parent
 # uywasi_backend/
@@ -47,6 +48,16 @@ LOCALE_PATHS = [
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
 DATABASES = {"default": env.db("DATABASE_URL")}
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# Read replicas of the primary, the reads of the safe requests are routed to
+# them by uywasi_backend.utils.db.ReplicaRouter.
+DATABASE_REPLICAS = []
+for index, url in enumerate(env.list("DATABASE_REPLICA_URLS", default=[])):
+    alias = "replica_{}".format(index)
+    DATABASES[alias] = env.db_url_config(url)
+    DATABASES[alias]["TEST"] = {"MIRROR": "default"}
+    DATABASE_REPLICAS.append(alias)
+# https://docs.djangoproject.com/en/dev/ref/settings/#database-routers
+DATABASE_ROUTERS = ["uywasi_backend.utils.db.ReplicaRouter"]
 
 # URLS
 # ------------------------------------------------------------------------------
@@ -66,6 +77,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     # "django.contrib.humanize", # Handy template tags
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -126,6 +138,8 @@ AUTH_PASSWORD_VALIDATORS = [
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "uywasi_backend.utils.profiling.ProfilingMiddleware",
+    "uywasi_backend.utils.db.ReplicaMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -158,6 +172,19 @@ STATICFILES_FINDERS = [
 MEDIA_ROOT = str(APPS_DIR / "media")
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = "/media/"
+# Object storage compatible with S3, e.g. the MinIO of local.yml. Without the
+# endpoint the media are stored in MEDIA_ROOT and the direct uploads of the
+# images are not available.
+# https://django-storages.readthedocs.io/en/latest/backends/amazon-S3.html#settings
+AWS_S3_ENDPOINT_URL = env("DJANGO_AWS_S3_ENDPOINT_URL", default=None)
+if AWS_S3_ENDPOINT_URL:
+    AWS_ACCESS_KEY_ID = env("DJANGO_AWS_ACCESS_KEY_ID")
+    AWS_SECRET_ACCESS_KEY = env("DJANGO_AWS_SECRET_ACCESS_KEY")
+    AWS_STORAGE_BUCKET_NAME = env("DJANGO_AWS_STORAGE_BUCKET_NAME")
+    AWS_QUERYSTRING_AUTH = False
+    AWS_S3_CUSTOM_DOMAIN = env("DJANGO_AWS_S3_CUSTOM_DOMAIN", default=None)
+    AWS_S3_URL_PROTOCOL = env("DJANGO_AWS_S3_URL_PROTOCOL", default="https:")
+    DEFAULT_FILE_STORAGE = "uywasi_backend.utils.storages.MediaRootS3Boto3Storage"
 
 # TEMPLATES
 # ------------------------------------------------------------------------------
@@ -278,16 +305,48 @@ CELERY_TASK_TIME_LIMIT = 5 * 60
 CELERY_TASK_SOFT_TIME_LIMIT = 60
 # http://docs.celeryproject.org/en/latest/userguide/configuration.html#beat-scheduler
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# http://docs.celeryproject.org/en/latest/userguide/configuration.html#beat-schedule
+CELERY_BEAT_SCHEDULE = {
+    "reconcile-following-counters": {
+        "task": "uywasi_backend.general.tasks.accounts.reconcile_following_counters",
+        "schedule": crontab(hour=4, minute=0),
+    },
+    "reconcile-subscriptions-counters": {
+        "task": "uywasi_backend.general.tasks.circles.reconcile_subscriptions_counters",
+        "schedule": crontab(hour=4, minute=30),
+    },
+    "refresh-feed-popular-circles": {
+        "task": "uywasi_backend.general.tasks.posts.refresh_feed_popular_circles",
+        "schedule": crontab(minute="*/10"),
+    },
+    "clean-upload-sessions": {
+        "task": "uywasi_backend.general.tasks.uploads.clean_upload_sessions",
+        "schedule": crontab(hour=5, minute=0),
+    },
+}
 
 # django-rest-framework
 # -------------------------------------------------------------------------------
 # django-rest-framework - https://www.django-rest-framework.org/api-guide/settings/
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework.authentication.TokenAuthentication",
+        "uywasi_backend.accounts.authentication.CachedTokenAuthentication",
     ),
     'DEFAULT_PAGINATION_CLASS': ('rest_framework.pagination.'
                                  'LimitOffsetPagination'),
+    # JSON encoded with orjson by default, and MessagePack for the clients
+    # that send Accept: application/msgpack.
+    "DEFAULT_RENDERER_CLASSES": (
+        "uywasi_backend.utils.renderers.ORJSONRenderer",
+        "uywasi_backend.utils.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "uywasi_backend.utils.renderers.ORJSONParser",
+        "uywasi_backend.utils.renderers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     'PAGE_SIZE': 100,
 }
 
@@ -295,3 +354,104 @@ REST_FRAMEWORK = {
 CORS_URLS_REGEX = r"^/api/.*$"
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Seconds that the responses of the breeds catalogue are kept in cache. They
+# are invalidated before when a breed is saved or deleted.
+BREEDS_CACHE_TIMEOUT = env.int("BREEDS_CACHE_TIMEOUT", default=60 * 60 * 24)
+# Seconds that the assembled user profiles are kept in cache. They are
+# invalidated before when the user, his posts, followings or subscriptions
+# change, this timeout only bounds the staleness of the nested users.
+PROFILE_CACHE_TIMEOUT = env.int("PROFILE_CACHE_TIMEOUT", default=60 * 5)
+# Seconds that the authentication tokens are kept in cache. They are removed
+# before on logout, and when their user is saved or deactivated.
+AUTH_TOKEN_CACHE_TIMEOUT = env.int("AUTH_TOKEN_CACHE_TIMEOUT", default=60 * 15)
+# Days that the email confirmation tokens sent to the new users are valid,
+# and the algorithm that signs them.
+EXPIRATION_TOKEN_DAYS = env.int("EXPIRATION_TOKEN_DAYS", default=3)
+ALGORITHM_TOKEN = "HS256"
+# Matching of lost and finded pets. The candidates are searched within the
+# radius and the window of days around the post, the matches below the min
+# score are discarded and only the best max results are stored.
+MATCH_RADIUS_KM = env.float("MATCH_RADIUS_KM", default=30.0)
+MATCH_WINDOW_DAYS = env.int("MATCH_WINDOW_DAYS", default=60)
+MATCH_MIN_SCORE = env.float("MATCH_MIN_SCORE", default=0.5)
+MATCH_MAX_CANDIDATES = env.int("MATCH_MAX_CANDIDATES", default=2000)
+MATCH_MAX_RESULTS = env.int("MATCH_MAX_RESULTS", default=20)
+# Resized WebP variants generated for the uploaded images, by name and the
+# max side in pixels. They are stored alongside the originals.
+IMAGE_VARIANTS = {
+    "thumbnail": env.int("IMAGE_THUMBNAIL_SIDE", default=160),
+    "medium": env.int("IMAGE_MEDIUM_SIDE", default=640),
+}
+IMAGE_VARIANTS_QUALITY = env.int("IMAGE_VARIANTS_QUALITY", default=80)
+# Home feed. The posts are written to the inboxes of the users, except the
+# posts of the circles with at least the popular subscriptions, which are
+# read on request. The inboxes keep the latest size posts and expire after
+# the timeout without reads.
+FEED_INBOX_SIZE = env.int("FEED_INBOX_SIZE", default=500)
+FEED_INBOX_TIMEOUT = env.int("FEED_INBOX_TIMEOUT", default=60 * 60 * 24 * 7)
+FEED_POPULAR_CIRCLE_SUBSCRIPTIONS = env.int(
+    "FEED_POPULAR_CIRCLE_SUBSCRIPTIONS", default=1000
+)
+FEED_POPULAR_CIRCLES_TIMEOUT = env.int("FEED_POPULAR_CIRCLES_TIMEOUT", default=60 * 15)
+FEED_FAN_OUT_BATCH = env.int("FEED_FAN_OUT_BATCH", default=1000)
+# Profiling of the requests by view and action. The sample rate is the
+# fraction of requests profiled, the metrics of each process are flushed to
+# the cache once per interval in seconds, and they are served in /metrics/
+# for the staff users and the requests with the token as bearer token.
+PROFILING_ENABLED = env.bool("PROFILING_ENABLED", default=False)
+PROFILING_SAMPLE_RATE = env.float("PROFILING_SAMPLE_RATE", default=0.01)
+PROFILING_FLUSH_INTERVAL = env.int("PROFILING_FLUSH_INTERVAL", default=10)
+PROFILING_METRICS_TOKEN = env("PROFILING_METRICS_TOKEN", default=None)
+# Seconds that the circle memberships of the users are kept in cache. They
+# are removed before when the user subscribes, unsubscribes or changes role.
+CIRCLE_MEMBERSHIPS_CACHE_TIMEOUT = env.int("CIRCLE_MEMBERSHIPS_CACHE_TIMEOUT", default=60 * 60)
+# Max number of posts of a bulk creation, and number of posts read per chunk
+# by the server-side cursor of the streaming exports.
+POSTS_BULK_MAX_SIZE = env.int("POSTS_BULK_MAX_SIZE", default=500)
+POSTS_EXPORT_CHUNK_SIZE = env.int("POSTS_EXPORT_CHUNK_SIZE", default=2000)
+# Seconds that the clients read from the primary after a write, so they read
+# their own writes while the replicas catch up. It should be above the lag of
+# the replicas.
+DATABASE_REPLICAS_PIN_SECONDS = env.int("DATABASE_REPLICAS_PIN_SECONDS", default=10)
+# Redis and channel of the real-time events of the new posts, which are
+# pushed to the websocket clients. The clients are subscribed to circles or
+# to areas of at most the max radius, indexed by grid cells of the cell
+# degrees. The events are dropped for the clients with the queue size of
+# events pending to send.
+POSTS_EVENTS_REDIS_URL = env("REDIS_URL", default=None)
+POSTS_EVENTS_CHANNEL = "posts:created"
+WEBSOCKET_CELL_DEGREES = env.float("WEBSOCKET_CELL_DEGREES", default=0.25)
+WEBSOCKET_MAX_RADIUS_KM = env.float("WEBSOCKET_MAX_RADIUS_KM", default=50.0)
+WEBSOCKET_MAX_SUBSCRIPTIONS = env.int("WEBSOCKET_MAX_SUBSCRIPTIONS", default=20)
+WEBSOCKET_QUEUE_SIZE = env.int("WEBSOCKET_QUEUE_SIZE", default=100)
+# Fast path of the anonymous reads of the hot endpoints, served from responses
+# kept in redis for the timeouts in seconds by endpoint, see config/fastpath.py.
+FAST_PATHS_ENABLED = env.bool("FAST_PATHS_ENABLED", default=True)
+FAST_PATHS_REDIS_URL = env("REDIS_URL", default=None)
+FAST_PATHS_TIMEOUTS = {
+    "posts": env.int("FAST_PATHS_POSTS_TIMEOUT", default=2),
+    "circle_posts": env.int("FAST_PATHS_CIRCLE_POSTS_TIMEOUT", default=2),
+    "breeds": env.int("FAST_PATHS_BREEDS_TIMEOUT", default=60),
+    "profile": env.int("FAST_PATHS_PROFILE_TIMEOUT", default=5),
+}
+# Direct uploads of the images to the object storage. The upload sessions
+# accept the content types up to the max size in bytes, they expire after the
+# expiration in seconds, and their images not attached to an instance are
+# deleted after the attach timeout. The presigned POST is sent to the public
+# endpoint, if the API reaches the storage through another host.
+UPLOADS_CONTENT_TYPES = ("image/jpeg", "image/png", "image/webp")
+UPLOADS_MAX_SIZE = env.int("UPLOADS_MAX_SIZE", default=10 * 1024 * 1024)
+UPLOADS_EXPIRATION = env.int("UPLOADS_EXPIRATION", default=60 * 15)
+UPLOADS_ATTACH_TIMEOUT = env.int("UPLOADS_ATTACH_TIMEOUT", default=60 * 60 * 24)
+UPLOADS_PUBLIC_ENDPOINT_URL = env("UPLOADS_PUBLIC_ENDPOINT_URL", default=None)
+# Threads by process that write the uploaded files to the storage, so the
+# photos of a post are written concurrently. The files of the transactions
+# rolled back are deleted after the orphan files delay in seconds.
+STORAGE_WRITE_WORKERS = env.int("STORAGE_WRITE_WORKERS", default=8)
+STORAGE_ORPHAN_FILES_DELAY = env.int("STORAGE_ORPHAN_FILES_DELAY", default=60 * 10)
+# Seconds that the retrieved objects are kept in cache. They are invalidated
+# before when the object is saved or deleted, this timeout only bounds the
+# staleness of the nested objects and counters. The cache lock timeout bounds
+# the wait of the readers of a key that is being computed by another process.
+RETRIEVE_CACHE_TIMEOUT = env.int("RETRIEVE_CACHE_TIMEOUT", default=60 * 5)
+CACHE_LOCK_TIMEOUT = env.int("CACHE_LOCK_TIMEOUT", default=5)
@@ -1,13 +1,19 @@
 # Django
+from django.apps import apps
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+# Utils
+from uywasi_backend.utils.profiling import metrics_view
 
 urlpatterns = [
     # Admin site
     path('admin/', admin.site.urls),
 
+    # Metrics of the profiled requests
+    path('metrics/', metrics_view, name='metrics'),
+
     # Accounts app
     # path('api/', include('uywasi_backend.accounts.urls', namespace='accounts')),
 
@@ -21,3 +27,11 @@ urlpatterns = [
     # path('api/', include('uywasi_backend.general.urls', namespace='general'))
 
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+
+# The posts and circles apps are only served where they are installed,
+# as in the test settings.
+if apps.is_installed('uywasi_backend.posts'):
+    urlpatterns += [path('api/', include('uywasi_backend.posts.urls', namespace='posts'))]
+
+if apps.is_installed('uywasi_backend.circles'):
+    urlpatterns += [path('api/', include('uywasi_backend.circles.urls', namespace='circles'))]
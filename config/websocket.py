@@ -1,13 +1,253 @@
-async def websocket_application(scope, receive, send):
+"""
+Websocket application of the real-time posts.
+
+The clients send JSON messages to subscribe to the new posts of a circle
+or of an area, instead of polling the list of posts:
+
+    {"action": "subscribe", "circle": "<slugname>"}
+    {"action": "subscribe", "area": {"latitude": 0, "longitude": 0, "radius_km": 5}}
+
+and "unsubscribe" with the same arguments. They receive the new posts as
+{"type": "post", "post": {...}}. Each process subscribes once to the redis
+channel of the new posts, and dispatches the events to its own clients
+with an index by circle and by grid cell.
+"""
+import asyncio
+import json
+from collections import defaultdict
+
+import redis
+from django.conf import settings
+
+from uywasi_backend.utils.geo import grid_cell, grid_cells_around, haversine_km
+
+
+class Consumer:
+    """
+    Consumer.
+
+    Subscriptions of a websocket client, and its queue of events pending to
+    send. The events are dropped while the queue is full, so a slow client
+    does not hold the events of the others.
+    """
+
+    def __init__(self):
+        """Start without subscriptions."""
+        self.queue = asyncio.Queue(maxsize=settings.WEBSOCKET_QUEUE_SIZE)
+        self.circles = set()
+        self.areas = {}
+
+    @property
+    def subscriptions_count(self):
+        """Return the number of circles and areas subscribed."""
+        return len(self.circles) + len(self.areas)
+
+    def push(self, text):
+        """Queue an event to send, unless the queue is full."""
+        try:
+            self.queue.put_nowait(text)
+        except asyncio.QueueFull:
+            pass
+
+    def in_areas(self, latitude, longitude):
+        """Return True if a point is inside an area subscribed."""
+        return any(
+            haversine_km(area_latitude, area_longitude, latitude, longitude)
+            <= radius_km
+            for area_latitude, area_longitude, radius_km in self.areas
+        )
+
+
+class PostsHub:
+    """
+    PostsHub.
+
+    Index of the consumers of the process by circle slugname and by grid
+    cell. The events are received by a thread subscribed to the redis
+    channel, and dispatched in the event loop to the consumers of their
+    circle and of the areas around their location.
+    """
+
+    def __init__(self):
+        """Start with the index empty, the thread is started on demand."""
+        self.circles = defaultdict(set)
+        self.cells = defaultdict(set)
+        self.loop = None
+        self.thread = None
+
+    def start(self):
+        """
+        start.
+
+        Subscribe to the channel of the new posts, once per process. The
+        thread stops when the connection to redis is lost, so the channel
+        is subscribed again by the next client that connects. The clients
+        are accepted without events while redis is unavailable.
+        """
+        if not settings.POSTS_EVENTS_REDIS_URL:
+            return
+        if self.thread is not None:
+            if self.thread.is_alive():
+                return
+            self.thread.pubsub.close()
+            self.thread = None
+        self.loop = asyncio.get_event_loop()
+        pubsub = redis.Redis.from_url(settings.POSTS_EVENTS_REDIS_URL).pubsub(
+            ignore_subscribe_messages=True
+        )
+        try:
+            pubsub.subscribe(**{settings.POSTS_EVENTS_CHANNEL: self.receive})
+        except redis.ConnectionError:
+            pubsub.close()
+            return
+        self.thread = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def receive(self, message):
+        """Dispatch a message of the channel in the event loop."""
+        self.loop.call_soon_threadsafe(self.dispatch, message["data"])
+
+    def dispatch(self, data):
+        """Push an event to the consumers of its circle and its area."""
+        event = json.loads(data)
+        consumers = set(self.circles.get(event["circle"], ()))
+        latitude, longitude = event["latitude"], event["longitude"]
+        cell = grid_cell(latitude, longitude, settings.WEBSOCKET_CELL_DEGREES)
+        consumers.update(
+            consumer
+            for consumer in self.cells.get(cell, ())
+            if consumer.in_areas(latitude, longitude)
+        )
+        if not consumers:
+            return
+        text = json.dumps({"type": "post", "post": event["post"]})
+        for consumer in consumers:
+            consumer.push(text)
+
+    def subscribe_circle(self, consumer, slugname):
+        """Subscribe a consumer to the new posts of a circle."""
+        consumer.circles.add(slugname)
+        self.circles[slugname].add(consumer)
+
+    def unsubscribe_circle(self, consumer, slugname):
+        """Unsubscribe a consumer from the new posts of a circle."""
+        consumer.circles.discard(slugname)
+        self.discard(self.circles, slugname, consumer)
+
+    def subscribe_area(self, consumer, area):
+        """Subscribe a consumer to the new posts of an area."""
+        cells = grid_cells_around(*area, settings.WEBSOCKET_CELL_DEGREES)
+        consumer.areas[area] = cells
+        for cell in cells:
+            self.cells[cell].add(consumer)
+
+    def unsubscribe_area(self, consumer, area):
+        """Unsubscribe a consumer from an area, keeping its other areas."""
+        cells = consumer.areas.pop(area, set())
+        for other_cells in consumer.areas.values():
+            cells = cells - other_cells
+        for cell in cells:
+            self.discard(self.cells, cell, consumer)
+
+    def remove(self, consumer):
+        """Remove all the subscriptions of a consumer."""
+        for slugname in list(consumer.circles):
+            self.unsubscribe_circle(consumer, slugname)
+        for area in list(consumer.areas):
+            self.unsubscribe_area(consumer, area)
+
+    @staticmethod
+    def discard(index, key, consumer):
+        """Remove a consumer from an index, and the key once empty."""
+        consumers = index.get(key)
+        if consumers is not None:
+            consumers.discard(consumer)
+            if not consumers:
+                del index[key]
+
+
+hub = PostsHub()
+
+
+def parse_area(value):
+    """Return an area as (latitude, longitude, radius_km), or raise ValueError."""
+    if not isinstance(value, dict):
+        raise ValueError("The area must be an object.")
+    latitude = float(value["latitude"])
+    longitude = float(value["longitude"])
+    radius_km = float(value["radius_km"])
+    if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+        raise ValueError("The location of the area is not valid.")
+    if not 0 < radius_km <= settings.WEBSOCKET_MAX_RADIUS_KM:
+        raise ValueError(
+            "The radius must be at most {} km.".format(
+                settings.WEBSOCKET_MAX_RADIUS_KM
+            )
+        )
+    return latitude, longitude, radius_km
+
+
+def handle_message(consumer, text):
+    """Apply a message of a client, return the reply to send."""
+    try:
+        message = json.loads(text)
+        action = message["action"]
+        if action not in ("subscribe", "unsubscribe"):
+            raise ValueError("Unknown action {}.".format(action))
+        if "circle" in message:
+            slugname = str(message["circle"])
+            target = {"circle": slugname}
+        else:
+            area = parse_area(message["area"])
+            target = {"area": dict(zip(("latitude", "longitude", "radius_km"), area))}
+    except (KeyError, TypeError, ValueError) as error:
+        return {"type": "error", "detail": str(error) or "Invalid message."}
+
+    if action == "subscribe":
+        if consumer.subscriptions_count >= settings.WEBSOCKET_MAX_SUBSCRIPTIONS:
+            return {"type": "error", "detail": "Too many subscriptions."}
+        if "circle" in target:
+            hub.subscribe_circle(consumer, slugname)
+        else:
+            hub.subscribe_area(consumer, area)
+    elif "circle" in target:
+        hub.unsubscribe_circle(consumer, slugname)
+    else:
+        hub.unsubscribe_area(consumer, area)
+    return {"type": "{}d".format(action), **target}
+
+
+async def send_events(consumer, send):
+    """Send the events queued for a consumer until it is cancelled."""
     while True:
-        event = await receive()
+        text = await consumer.queue.get()
+        await send({"type": "websocket.send", "text": text})
+
+
+async def websocket_application(scope, receive, send):
+    consumer = Consumer()
+    sender = None
+    try:
+        while True:
+            event = await receive()
 
-        if event["type"] == "websocket.connect":
-            await send({"type": "websocket.accept"})
+            if event["type"] == "websocket.connect":
+                hub.start()
+                await send({"type": "websocket.accept"})
+                sender = asyncio.ensure_future(send_events(consumer, send))
 
-        if event["type"] == "websocket.disconnect":
-            break
+            if event["type"] == "websocket.disconnect":
+                break
 
-        if event["type"] == "websocket.receive":
-            if event["text"] == "ping":
-                await send({"type": "websocket.send", "text": "pong!"})
+            if event["type"] == "websocket.receive":
+                text = event.get("text")
+                if text is None:
+                    continue
+                if text == "ping":
+                    await send({"type": "websocket.send", "text": "pong!"})
+                    continue
+                reply = handle_message(consumer, text)
+                await send({"type": "websocket.send", "text": json.dumps(reply)})
+    finally:
+        hub.remove(consumer)
+        if sender is not None:
+            sender.cancel()
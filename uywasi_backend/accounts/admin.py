@@ -31,10 +31,11 @@ class UserAccountAdmin(admin.StackedInline):
         ),
         ("Ubication", {"fields": (("longitude"), ("latitude"))}),
         ("Verification", {"fields": (("is_verified"), ("is_confirmed"))}),
+        ("Followings", {"fields": (("followers_count"), ("follows_count"))}),
         ("History", {"fields": ("created", "modified")}),
     )
 
-    readonly_fields = ("created", "modified")
+    readonly_fields = ("created", "modified", "followers_count", "follows_count")
 
 
 @admin.register(User)
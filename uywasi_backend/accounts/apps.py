@@ -13,3 +13,7 @@ class AccountsConfig(AppConfig):
 
     name = 'uywasi_backend.accounts'
     app_label = 'accounts'
+
+    def ready(self):
+        """Register the signals of the app."""
+        import uywasi_backend.accounts.signals  # noqa F401
@@ -0,0 +1,58 @@
+"""Accounts app authentication."""
+
+# Django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import ugettext as _
+# Django Rest Framework
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+# Local cache
+from uywasi_backend.accounts.cache import get_token_cache_key
+
+
+class CachedTokenUser(SimpleLazyObject):
+    """
+    CachedTokenUser.
+
+    User of a cached token, which is queried only when a field other than
+    its pk is read, e.g. by the permissions of the owners.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, user_id):
+        """Keep the pk of the user, to load him on demand."""
+        super().__init__(
+            lambda: get_user_model().objects.get(pk=user_id))
+        self.__dict__['pk'] = self.__dict__['id'] = user_id
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    CachedTokenAuthentication.
+
+    Token authentication that keeps the pk and the state of the user of
+    the token in cache, so the authenticated requests do not query the
+    token and user tables. The cached tokens are removed once the token is
+    deleted (logout) or its user is saved (password change, deactivation)
+    is committed.
+    """
+
+    def authenticate_credentials(self, key):
+        """Return the user and the token, from cache if possible."""
+        cache_key = get_token_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is None:
+            user, token = super().authenticate_credentials(key)
+            cache.set(cache_key, (user.pk, user.is_active),
+                      timeout=settings.AUTH_TOKEN_CACHE_TIMEOUT)
+            return user, token
+        user_id, is_active = cached
+        if not is_active:
+            raise AuthenticationFailed(_('User inactive or deleted.'))
+        return CachedTokenUser(user_id), Token(key=key, user_id=user_id)
@@ -0,0 +1,53 @@
+"""Accounts app cache."""
+
+# Django
+from django.core.cache import cache
+from django.db import transaction
+# Utils
+from uywasi_backend.utils.cache import bump_cache_version, get_cache_version
+from hashlib import sha256
+
+
+def get_profile_cache_key(user_pk):
+    """Return the cache key of the current profile data of a user."""
+    namespace = 'accounts:profile:{}'.format(user_pk)
+    return '{}:{}'.format(namespace, get_cache_version(namespace))
+
+
+def invalidate_profile_cache(*user_pks):
+    """
+    invalidate_profile_cache.
+
+    Invalidate the cached profile data of the users once the current
+    transaction is committed, so a profile read before the commit is not
+    cached again under the new version.
+    """
+    user_pks = list(user_pks)
+
+    def invalidate():
+        for user_pk in user_pks:
+            bump_cache_version('accounts:profile:{}'.format(user_pk))
+
+    transaction.on_commit(invalidate)
+
+
+def get_username_cache_key(username):
+    """Return the cache key of the pk of the active user of a username."""
+    return 'accounts:username:{}'.format(username)
+
+
+def get_token_cache_key(token_key):
+    """Return the cache key of an authentication token, without exposing it."""
+    return 'accounts:token:{}'.format(sha256(token_key.encode()).hexdigest())
+
+
+def invalidate_token_cache(*token_keys):
+    """
+    invalidate_token_cache.
+
+    Remove the authentication tokens from cache once the current
+    transaction is committed, so a request authenticated before the commit
+    does not cache them again with the old user.
+    """
+    cache_keys = [get_token_cache_key(key) for key in token_keys]
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
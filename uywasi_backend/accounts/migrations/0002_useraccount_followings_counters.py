@@ -0,0 +1,40 @@
+# Generated by Django 3.0.10 on 2026-10-18 10:41
+
+from django.db import migrations, models
+
+
+def fill_followings_counters(apps, schema_editor):
+    """Compute the counters of the existing user accounts."""
+    UserAccount = apps.get_model('accounts', 'UserAccount')
+    Following = apps.get_model('accounts', 'Following')
+    followers = Following.objects.order_by().values('user_account_to') \
+        .annotate(total=models.Count('pk'))
+    for row in followers.iterator():
+        UserAccount.objects.filter(pk=row['user_account_to']).update(
+            followers_count=row['total'])
+    follows = Following.objects.order_by().values('user_account_from') \
+        .annotate(total=models.Count('pk'))
+    for row in follows.iterator():
+        UserAccount.objects.filter(pk=row['user_account_from']).update(
+            follows_count=row['total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='useraccount',
+            name='followers_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of accounts that follow this account. It is updated when a following is created or deleted.'),
+        ),
+        migrations.AddField(
+            model_name='useraccount',
+            name='follows_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of accounts followed by this account. It is updated when a following is created or deleted.'),
+        ),
+        migrations.RunPython(fill_followings_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.0.10 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_useraccount_followings_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='following',
+            index=models.Index(fields=['-created', '-id'], name='following_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='useraccount',
+            index=models.Index(fields=['-created', '-id'], name='useraccount_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 3.0.10 on 2026-10-18 13:50
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# The search of the users filters by UPPER(field::text) LIKE UPPER('%term%'),
+# these trigram indexes over the same expressions resolve it.
+SEARCH_FIELDS = ('username', 'first_name', 'last_name')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_created_id_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+    ] + [
+        migrations.RunSQL(
+            'CREATE INDEX accounts_user_{0}_trgm_idx ON accounts_user '
+            'USING gin ((UPPER({0}::text)) gin_trgm_ops);'.format(field),
+            'DROP INDEX accounts_user_{0}_trgm_idx;'.format(field),
+        )
+        for field in SEARCH_FIELDS
+    ]
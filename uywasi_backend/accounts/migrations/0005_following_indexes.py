@@ -0,0 +1,21 @@
+# Generated by Django 3.0.10 on 2026-10-18 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='following',
+            index=models.Index(fields=['user_account_to', 'created'], name='following_to_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='following',
+            index=models.Index(fields=['user_account_from', 'created'], name='following_from_created_idx'),
+        ),
+    ]
@@ -42,6 +42,16 @@ class Following(StandardModel):
     class Meta(StandardModel.Meta):
         """Meta options. Extended from StandardModel.Meta."""
 
+        indexes = StandardModel.Meta.indexes + (
+            models.Index(
+                fields=('user_account_to', 'created'),
+                name='following_to_created_idx'
+            ),
+            models.Index(
+                fields=('user_account_from', 'created'),
+                name='following_from_created_idx'
+            ),
+        )
         constraints = (
             models.UniqueConstraint(
                 fields=('user_account_from', 'user_account_to'),
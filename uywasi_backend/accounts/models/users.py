@@ -42,6 +42,13 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['first_name', 'last_name', 'username']
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Keep the username of the loaded user."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_username = instance.__dict__.get('username')
+        return instance
+
     def __str__(self):
         """Return username."""
         return self.username
@@ -137,15 +144,29 @@ class UserAccount(StandardModel):
         symmetrical=False
     )
 
+    followers_count = models.PositiveIntegerField(
+        help_text=_('Number of accounts that follow this account. It is '
+                    'updated when a following is created or deleted.'),
+        default=0,
+        editable=False
+    )
+
+    follows_count = models.PositiveIntegerField(
+        help_text=_('Number of accounts followed by this account. It is '
+                    'updated when a following is created or deleted.'),
+        default=0,
+        editable=False
+    )
+
     @property
     def number_of_followers(self):
         """Return the number of followers."""
-        return self.useracount_set.all().count()
+        return self.followers_count
 
     @property
     def number_of_follows(self):
-        """Return the number of followers."""
-        return self.follows.all().count()
+        """Return the number of follows."""
+        return self.follows_count
 
     def __str__(self):
         """Return user username"""
@@ -3,12 +3,13 @@
 # Django
 from django.contrib.auth import authenticate
 from django.conf import settings
+from django.db import transaction
 from django.utils.translation import ugettext as _
 # Django Rest Framework
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
 # Local models
-from uywasi_backend.accounts.models import User
+from uywasi_backend.accounts.models import User, UserAccount
 from uywasi_backend.circles.models import Subscription
 from uywasi_backend.posts.models import Post
 # Local serializeres
@@ -17,6 +18,9 @@ import uywasi_backend.circles
 # Local tasks
 from uywasi_backend.general.tasks import send_verification_email
 # Utils
+from uywasi_backend.utils.images import ImageVariantField
+from uywasi_backend.utils.values import (
+    ImageValueField, ValueField, ValuesSerializer)
 import jwt
 
 
@@ -25,18 +29,80 @@ class UserModelSerializer(serializers.ModelSerializer):
     UserModelSerializer.
 
     This class is used for represent the most important information
-    of a user.
+    of a user. The profile fields and the followings counters are read
+    from the user account, so the queryset should select_related it, and
+    the profile fields are written to it.
     """
 
+    profile_photo = serializers.ImageField(
+        source='useraccount.profile_photo', required=False, allow_null=True)
+    biography = serializers.CharField(
+        source='useraccount.biography', required=False, allow_blank=True,
+        allow_null=True)
+    is_verified = serializers.BooleanField(
+        source='useraccount.is_verified', read_only=True)
+    latitude = serializers.FloatField(
+        source='useraccount.latitude', required=False)
+    longitude = serializers.FloatField(
+        source='useraccount.longitude', required=False)
+    phone = serializers.CharField(
+        source='useraccount.phone', required=False, allow_blank=True,
+        allow_null=True,
+        validators=UserAccount._meta.get_field('phone').validators)
+    number_of_follows = serializers.IntegerField(
+        source='useraccount.follows_count', read_only=True)
+    number_of_followers = serializers.IntegerField(
+        source='useraccount.followers_count', read_only=True)
+    profile_photo_thumbnail = ImageVariantField(
+        source='useraccount.profile_photo', variant='thumbnail')
+
     class Meta:
         """Meta options."""
 
         model = User
         fields = ('first_name', 'last_name', 'username', 'email',
-                  'profile_photo', 'biography', 'is_verified', 'latitude',
-                  'longitude', 'phone', 'number_of_follows',
-                  'number_of_followers')
-        read_only_fields = ('email', 'is_verified')
+                  'profile_photo', 'profile_photo_thumbnail', 'biography',
+                  'is_verified', 'latitude', 'longitude', 'phone',
+                  'number_of_follows', 'number_of_followers')
+        read_only_fields = ('email',)
+
+    def update(self, instance, validated_data):
+        """Update the user, and the fields of his account if any."""
+        account_data = validated_data.pop('useraccount', None)
+        if account_data:
+            try:
+                account = instance.useraccount
+            except UserAccount.DoesNotExist:
+                account = UserAccount(user=instance)
+            for attr, value in account_data.items():
+                setattr(account, attr, value)
+            account.save()
+        return super().update(instance, validated_data)
+
+
+class UserValuesSerializer(ValuesSerializer):
+    """
+    UserValuesSerializer.
+
+    Serialize the rows of the users as UserModelSerializer, reading the
+    fields of the account in the same query. It is used by the lists.
+    """
+
+    profile_photo = ImageValueField(source='useraccount__profile_photo')
+    profile_photo_thumbnail = ImageValueField(
+        source='useraccount__profile_photo', variant='thumbnail')
+    biography = ValueField(source='useraccount__biography')
+    is_verified = ValueField(source='useraccount__is_verified')
+    latitude = ValueField(source='useraccount__latitude')
+    longitude = ValueField(source='useraccount__longitude')
+    phone = ValueField(source='useraccount__phone')
+    number_of_follows = ValueField(source='useraccount__follows_count')
+    number_of_followers = ValueField(source='useraccount__followers_count')
+
+    class Meta:
+        """Meta options."""
+
+        fields = UserModelSerializer.Meta.fields
 
 
 class UserProfileModelSerializer(UserModelSerializer):
@@ -44,14 +110,30 @@ class UserProfileModelSerializer(UserModelSerializer):
     UserProfileModelSerializer.
 
     This class allows extends from UserModelSerializer and adds the fields
-    follows and followers, this fields are handled by UserModelSerializer.
+    follows, followers, subscriptions and posts. Each section is obtained
+    with one bounded query that loads its related fields, so the profile
+    costs the same number of queries whatever the size of the account.
     """
 
-    follows = UserModelSerializer(read_only=True, many=True)
+    follows = serializers.SerializerMethodField()
     followers = serializers.SerializerMethodField()
     subscriptions = serializers.SerializerMethodField()
     posts = serializers.SerializerMethodField()
 
+    def get_follows(self, obj):
+        """
+        get_follows.
+
+        This function obtains the last three users followed by an user.
+        The complete list is served by the follows endpoint.
+        """
+        follows = User.objects.filter(
+            useraccount__following_account_to_account__user_account_from__user=obj
+        ).select_related('useraccount').order_by(
+            '-useraccount__following_account_to_account__created')[:3]
+        response = UserModelSerializer(instance=follows, many=True)
+        return response.data
+
     def get_followers(self, obj):
         """
         get_followers.
@@ -59,7 +141,10 @@ class UserProfileModelSerializer(UserModelSerializer):
         This function obtains the last three followers of an user.
         It is called for the followers field.
         """
-        followers = obj.user_set.all()[:3]
+        followers = User.objects.filter(
+            useraccount__following_account_from_account__user_account_to__user=obj
+        ).select_related('useraccount').order_by(
+            '-useraccount__following_account_from_account__created')[:3]
         response = UserModelSerializer(instance=followers, many=True)
         return response.data
 
@@ -71,9 +156,9 @@ class UserProfileModelSerializer(UserModelSerializer):
         ordered by is_admin attribute.
         """
         subscriptions = Subscription.objects.filter(
-            user=obj).order_by('-is_admin')[:3]
-        response = circles.serializers.UserSubscriptionModelSerializer(
-            instance=subscriptions, many=True)
+            user=obj).order_by('-is_admin').select_related('circle')[:3]
+        response = uywasi_backend.circles.serializers \
+            .UserSubscriptionModelSerializer(instance=subscriptions, many=True)
         return response.data
 
     def get_posts(self, obj):
@@ -82,9 +167,10 @@ class UserProfileModelSerializer(UserModelSerializer):
 
         This function obtains the last thirty posts of an user.
         """
-        user_posts = Post.objects.filter(user=obj)[:30]
-        response = posts.serializers.PostModelSerializer(
-            instance=user_posts, many=True)
+        serializer_class = uywasi_backend.posts.serializers.PostModelSerializer
+        user_posts = serializer_class.setup_eager_loading(
+            Post.objects.filter(user=obj))[:30]
+        response = serializer_class(instance=user_posts, many=True)
         return response.data
 
     class Meta(UserModelSerializer.Meta):
@@ -183,10 +269,15 @@ class UserSignUpSerializer(serializers.ModelSerializer):
             return data
 
     def create(self, validate_data):
-        """Create a User into database."""
+        """
+        create.
+
+        Create a User into database, and queue the verification email
+        once the user is committed, so the request does not wait for it.
+        """
         validate_data.pop('password_confirmation')
         user = User.objects.create_user(**validate_data)
-        send_verification_email(user.pk)
+        transaction.on_commit(lambda: send_verification_email.delay(user.pk))
         return user
 
 
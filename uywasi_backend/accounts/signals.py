@@ -0,0 +1,111 @@
+"""Accounts app signals."""
+
+# Django
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+# Django Rest Framework
+from rest_framework.authtoken.models import Token
+# Local models
+from uywasi_backend.accounts.models import Following, User, UserAccount
+# Local cache
+from uywasi_backend.accounts.cache import (
+    get_username_cache_key, invalidate_profile_cache, invalidate_token_cache)
+# Local signals
+from uywasi_backend.general.signals import dispatch_image_variants
+
+
+@receiver(post_save, sender=Following)
+def increment_following_counters(sender, instance, created, **kwargs):
+    """
+    increment_following_counters.
+
+    Increment the follows counter of the account that follows and the
+    followers counter of the followed account when a following is created.
+    """
+    if not created:
+        return
+    with transaction.atomic():
+        UserAccount.objects.filter(pk=instance.user_account_from_id).update(
+            follows_count=F('follows_count') + 1)
+        UserAccount.objects.filter(pk=instance.user_account_to_id).update(
+            followers_count=F('followers_count') + 1)
+
+
+@receiver(post_delete, sender=Following)
+def decrement_following_counters(sender, instance, **kwargs):
+    """
+    decrement_following_counters.
+
+    Decrement the follows counter of the account that follows and the
+    followers counter of the followed account when a following is deleted.
+    """
+    with transaction.atomic():
+        UserAccount.objects.filter(pk=instance.user_account_from_id).update(
+            follows_count=Greatest(F('follows_count') - 1, 0))
+        UserAccount.objects.filter(pk=instance.user_account_to_id).update(
+            followers_count=Greatest(F('followers_count') - 1, 0))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_profile(sender, instance, **kwargs):
+    """
+    invalidate_user_profile.
+
+    Invalidate the cached profile and username of a changed user. The
+    username loaded before a rename is removed too, so it does not point
+    to the renamed user anymore.
+    """
+    invalidate_profile_cache(instance.pk)
+    usernames = {instance.username,
+                 getattr(instance, '_loaded_username', None)}
+    keys = [get_username_cache_key(username)
+            for username in usernames if username]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+    instance._loaded_username = instance.username
+
+
+@receiver(post_save, sender=UserAccount)
+def invalidate_owner_profile(sender, instance, **kwargs):
+    """
+    invalidate_owner_profile.
+
+    Invalidate the cached profile of the owner of a changed object. It is
+    connected by the posts and circles apps to their owned models.
+    """
+    invalidate_profile_cache(instance.user_id)
+
+
+@receiver(post_save, sender=Following)
+@receiver(post_delete, sender=Following)
+def invalidate_following_profiles(sender, instance, **kwargs):
+    """Invalidate the cached profiles of the users of a following."""
+    invalidate_profile_cache(*UserAccount.objects.filter(
+        pk__in=(instance.user_account_from_id, instance.user_account_to_id)
+    ).values_list('user_id', flat=True))
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """Remove a deleted authentication token from cache."""
+    invalidate_token_cache(instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    """
+    invalidate_user_tokens.
+
+    Remove the authentication tokens of a saved user from cache, so a
+    password change or a deactivation applies to the next request.
+    """
+    invalidate_token_cache(*Token.objects.filter(
+        user_id=instance.pk).values_list('key', flat=True))
+
+
+# The images of the accounts have variants.
+post_save.connect(dispatch_image_variants, sender=UserAccount)
@@ -0,0 +1,66 @@
+"""Accounts app factories."""
+
+# Django
+from django.contrib.auth import get_user_model
+# Factory boy
+import factory
+from factory.django import DjangoModelFactory
+# Local models
+from uywasi_backend.accounts.models import Following, UserAccount
+
+
+class UserFactory(DjangoModelFactory):
+    """
+    UserFactory.
+
+    Build active users with unique username and email. The password is
+    'password' unless other is given, e.g. UserFactory(password='secret').
+    """
+
+    username = factory.Sequence(lambda n: 'user{}'.format(n))
+    email = factory.LazyAttribute(lambda user: '{}@example.com'.format(
+        user.username))
+    first_name = factory.Faker('first_name')
+    last_name = factory.Faker('last_name')
+    is_active = True
+    password = factory.PostGenerationMethodCall('set_password', 'password')
+
+    class Meta:
+        """Meta options."""
+
+        model = get_user_model()
+        django_get_or_create = ('username',)
+
+
+class UserAccountFactory(DjangoModelFactory):
+    """
+    UserAccountFactory.
+
+    Build the account of a new user.
+    """
+
+    user = factory.SubFactory(UserFactory)
+    biography = factory.Faker('sentence')
+    latitude = factory.Faker('pyfloat', min_value=-4, max_value=0)
+    longitude = factory.Faker('pyfloat', min_value=-80, max_value=-76)
+
+    class Meta:
+        """Meta options."""
+
+        model = UserAccount
+
+
+class FollowingFactory(DjangoModelFactory):
+    """
+    FollowingFactory.
+
+    Build a following between the accounts of two new users.
+    """
+
+    user_account_from = factory.SubFactory(UserAccountFactory)
+    user_account_to = factory.SubFactory(UserAccountFactory)
+
+    class Meta:
+        """Meta options."""
+
+        model = Following
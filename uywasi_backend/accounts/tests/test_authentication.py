@@ -0,0 +1,59 @@
+"""Accounts app authentication tests."""
+
+# Django
+from django.core.cache import cache
+from django.db import transaction
+# Django Rest Framework
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+# Local
+from uywasi_backend.accounts.authentication import CachedTokenAuthentication
+from uywasi_backend.accounts.cache import get_token_cache_key
+# Utils
+import pytest
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def token(user):
+    return Token.objects.create(user=user)
+
+
+def test_cached_token_keeps_only_the_user_state(
+        token, django_assert_num_queries):
+    """The cached token is the pk and state of its user, not the user."""
+    authentication = CachedTokenAuthentication()
+    user, auth = authentication.authenticate_credentials(token.key)
+    assert cache.get(get_token_cache_key(token.key)) == (user.pk, True)
+
+    with django_assert_num_queries(0):
+        user, auth = authentication.authenticate_credentials(token.key)
+        assert user.is_authenticated and user.pk == token.user_id
+        assert auth.key == token.key
+    assert user.username == token.user.username
+
+
+def test_cached_token_is_removed_once_the_user_is_committed(token):
+    """A deactivated user can not authenticate after the commit."""
+    authentication = CachedTokenAuthentication()
+    authentication.authenticate_credentials(token.key)
+    with transaction.atomic():
+        token.user.is_active = False
+        token.user.save()
+        assert cache.get(get_token_cache_key(token.key)) is not None
+
+    with pytest.raises(AuthenticationFailed):
+        authentication.authenticate_credentials(token.key)
+
+
+def test_cached_token_can_be_deleted(token):
+    """The logout deletes the token authenticated from cache."""
+    authentication = CachedTokenAuthentication()
+    authentication.authenticate_credentials(token.key)
+    _user, auth = authentication.authenticate_credentials(token.key)
+    auth.delete()
+
+    assert not Token.objects.filter(key=token.key).exists()
+    with pytest.raises(AuthenticationFailed):
+        authentication.authenticate_credentials(token.key)
@@ -0,0 +1,37 @@
+"""Accounts app cache tests."""
+
+# Django
+from django.core.cache import cache
+from django.db import transaction
+# Local models
+from uywasi_backend.accounts.models import User
+# Local cache
+from uywasi_backend.accounts.cache import (
+    get_profile_cache_key, get_username_cache_key)
+# Utils
+import pytest
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def test_profile_is_invalidated_after_commit(user):
+    """The profile version of a saved user changes once it is committed."""
+    key = get_profile_cache_key(user.pk)
+    with transaction.atomic():
+        user.first_name = 'Other'
+        user.save()
+        assert get_profile_cache_key(user.pk) == key
+    assert get_profile_cache_key(user.pk) != key
+
+
+def test_username_is_invalidated_after_a_rename(user):
+    """The previous username does not point to a renamed user."""
+    user = User.objects.get(pk=user.pk)
+    old_key = get_username_cache_key(user.username)
+    cache.set(old_key, user.pk)
+    with transaction.atomic():
+        user.username = 'renamed'
+        user.save()
+        assert cache.get(old_key) == user.pk
+    assert cache.get(old_key) is None
+    assert cache.get(get_username_cache_key('renamed')) is None
@@ -0,0 +1,52 @@
+"""Accounts app serializers tests."""
+
+# Local models
+from uywasi_backend.accounts.models import User, UserAccount
+# Local serializers
+from uywasi_backend.accounts.serializers import (
+    UserModelSerializer, UserValuesSerializer)
+# Local factories
+from uywasi_backend.accounts.tests.factories import (
+    UserAccountFactory, UserFactory)
+# Utils
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def test_user_is_serialized_with_his_account():
+    """The profile fields are read from the account of the user."""
+    account = UserAccountFactory(phone='+593987654321', is_verified=True)
+    data = UserModelSerializer(account.user).data
+    assert data['username'] == account.user.username
+    assert data['biography'] == account.biography
+    assert data['phone'] == '+593987654321'
+    assert data['is_verified'] is True
+    assert (data['latitude'], data['longitude']) == (
+        account.latitude, account.longitude)
+    assert data['profile_photo'] is None
+
+
+def test_values_serializer_has_the_same_output():
+    """The lists serialize the users as the model serializer."""
+    account = UserAccountFactory()
+    users = User.objects.filter(pk=account.user_id)
+    serializer = UserValuesSerializer()
+    rows = serializer.values(users)
+    expected = UserModelSerializer(users.select_related('useraccount'),
+                                   many=True).data
+    assert serializer.serialize(rows) == expected
+
+
+def test_update_writes_the_account_fields():
+    """The profile fields are saved to the account, created if missing."""
+    user = UserFactory()
+    serializer = UserModelSerializer(
+        user, data={'biography': 'Other', 'phone': '+593987654321',
+                    'is_verified': True}, partial=True)
+    serializer.is_valid(raise_exception=True)
+    serializer.save()
+
+    account = UserAccount.objects.get(user=user)
+    assert (account.biography, account.phone) == ('Other', '+593987654321')
+    assert account.is_verified is False
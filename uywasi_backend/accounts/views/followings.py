@@ -14,9 +14,12 @@ from uywasi_backend.accounts.serializers import (UserModelSerializer,
 from uywasi_backend.accounts.models import User, Following
 # Local permissions
 from uywasi_backend.accounts.permissions import IsFollowingOwner
+# Utils
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
 
 
-class FollowingViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class FollowingViewSet(SafeMethodsNonAtomicMixin,
+                       mixins.ListModelMixin, mixins.RetrieveModelMixin,
                        mixins.DestroyModelMixin, mixins.CreateModelMixin,
                        viewsets.GenericViewSet):
     """
@@ -109,7 +112,8 @@ class FollowingViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
         return Response(status=status.HTTP_201_CREATED)
 
 
-class FollowersViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class FollowersViewSet(SafeMethodsNonAtomicMixin,
+                       mixins.ListModelMixin, viewsets.GenericViewSet):
     """
     FollowersViewSet.
 
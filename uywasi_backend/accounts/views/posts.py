@@ -1,6 +1,10 @@
 """Accounts app posts views."""
 
+# Django
+from django.utils.translation import ugettext as _
 # Django Rest Framework
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny
 from rest_framework.generics import get_object_or_404
 from rest_framework import mixins, viewsets
@@ -9,15 +13,23 @@ from uywasi_backend.posts.serializers import UserPostSerializer
 # Local models
 from uywasi_backend.accounts.models import User
 from uywasi_backend.posts.models import Post
+# Local exports
+from uywasi_backend.posts.exports import EXPORT_TYPES, export_posts
+# Utils
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
+from uywasi_backend.utils.pagination import KeysetPagination
 
 
-class PostViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class PostViewSet(SafeMethodsNonAtomicMixin,
+                  mixins.ListModelMixin, viewsets.GenericViewSet):
     """
     PostViewSet.
 
     Allow list the posts of an user, taking the username from the url.
     """
 
+    pagination_class = KeysetPagination
+
     def dispatch(self, request, *args, **kwargs):
         """
         dispatch.
@@ -50,9 +62,8 @@ class PostViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         on dispatch function.
         """
         if self.action == 'list':
-            return Post.objects.filter(
-                user=self.user
-            )
+            return UserPostSerializer.setup_eager_loading(
+                Post.objects.filter(user=self.user))
 
     def get_permissions(self):
         """
@@ -61,6 +72,25 @@ class PostViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         If the action is list, then return a list with an instance the AllowAny
         as permissions.
         """
-        if self.action == 'list':
+        if self.action in ('list', 'export'):
             permissions = (AllowAny,)
         return [permission() for permission in permissions]
+
+    @action(detail=False, methods=['get'])
+    def export(self, request, *args, **kwargs):
+        """
+        export.
+
+        Stream all the posts of the user as CSV, or as newline
+        delimited JSON with ?type=ndjson.
+        """
+        export_type = request.query_params.get('type', 'csv')
+        if export_type not in EXPORT_TYPES:
+            raise ValidationError({'type': _(
+                'The type must be one of: {}.').format(
+                ', '.join(EXPORT_TYPES))})
+        return export_posts(
+            queryset=Post.objects.filter(user=self.user),
+            export_type=export_type,
+            filename='posts-{}'.format(self.user.username)
+        )
@@ -1,6 +1,8 @@
 """Accounts app Users views."""
 
 # Django
+from django.conf import settings
+from django.core.cache import cache
 from django_filters.rest_framework import DjangoFilterBackend
 # Django Rest Framework
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -11,14 +13,24 @@ from rest_framework import mixins, viewsets, status
 # Local serializers
 from uywasi_backend.accounts.serializers import (
     UserLoginSerializer, UserModelSerializer, UserSignUpSerializer,
-    UserConfirmationSerializer, UserProfileModelSerializer)
+    UserConfirmationSerializer, UserProfileModelSerializer,
+    UserValuesSerializer)
 # Local models
 from uywasi_backend.accounts.models import User
 # Local permissions
 from uywasi_backend.accounts.permissions import IsOwnerAccount, IsConfirmedAccount
+# Local cache
+from uywasi_backend.accounts.cache import (
+    get_profile_cache_key, get_username_cache_key)
+# Utils
+from uywasi_backend.utils.cache import CachedRetrieveMixin
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
+from uywasi_backend.utils.values import ValuesListMixin
 
 
-class AccountViewSet(mixins.RetrieveModelMixin, mixins.DestroyModelMixin,
+class AccountViewSet(SafeMethodsNonAtomicMixin, CachedRetrieveMixin,
+                     ValuesListMixin,
+                     mixins.RetrieveModelMixin, mixins.DestroyModelMixin,
                      mixins.CreateModelMixin, mixins.UpdateModelMixin,
                      mixins.ListModelMixin, viewsets.GenericViewSet):
     """
@@ -29,6 +41,8 @@ class AccountViewSet(mixins.RetrieveModelMixin, mixins.DestroyModelMixin,
     """
 
     lookup_field = 'username'
+    retrieve_cache_timeout = settings.PROFILE_CACHE_TIMEOUT
+    values_serializer_class = UserValuesSerializer
 
     # Filtering, ordering and search options.
 
@@ -41,7 +55,8 @@ class AccountViewSet(mixins.RetrieveModelMixin, mixins.DestroyModelMixin,
         """Define the queryset to use, based on the action."""
         if self.action in ('login', 'retrieve', 'destroy',
                            'confirm', 'list'):
-            return User.objects.filter(is_active=True)
+            return User.objects.filter(is_active=True) \
+                .select_related('useraccount')
         else:
             return User.objects.all()
 
@@ -62,6 +77,8 @@ class AccountViewSet(mixins.RetrieveModelMixin, mixins.DestroyModelMixin,
         """Define the permissions needed for perform the action."""
         if self.action in ('list', 'create', 'retrieve', 'login', 'confirm'):
             permissions = (AllowAny,)
+        elif self.action == 'logout':
+            permissions = (IsAuthenticated,)
         elif self.action == 'destroy':
             permissions = (IsAuthenticated, IsOwnerAccount)
         elif self.action in ('update', 'partial_update'):
@@ -80,6 +97,22 @@ class AccountViewSet(mixins.RetrieveModelMixin, mixins.DestroyModelMixin,
         return Response(data=serialized_user.data,
                         status=status.HTTP_201_CREATED)
 
+    def get_retrieve_cache_key(self):
+        """
+        get_retrieve_cache_key.
+
+        Return the cache key of the profile of a user, which is cached until
+        the user, his posts, followings or subscriptions change. The pk of
+        the username is cached too, so the cached profiles are served
+        without querying the user.
+        """
+        key = get_username_cache_key(self.kwargs[self.lookup_field])
+        user_pk = cache.get(key)
+        if user_pk is None:
+            user_pk = self.get_object().pk
+            cache.set(key, user_pk, timeout=settings.PROFILE_CACHE_TIMEOUT)
+        return get_profile_cache_key(user_pk)
+
     def perform_destroy(self, instance):
         """Set turn off on attribute is_active of an user."""
         user = instance
@@ -96,6 +129,13 @@ class AccountViewSet(mixins.RetrieveModelMixin, mixins.DestroyModelMixin,
         return Response(data=response.data,
                         status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=['post'])
+    def logout(self, request):
+        """Delete the access token of the authenticated user."""
+        if request.auth is not None:
+            request.auth.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
     @action(detail=False, methods=['post'])
     def confirm(self, request):
         """Confirm an email address."""
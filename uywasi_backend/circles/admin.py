@@ -26,9 +26,12 @@ class CircleAdmin(admin.ModelAdmin):
         }),
         ('Identification', {
             'fields': (('is_verified'),)
+        }),
+        ('Subscriptions', {
+            'fields': (('subscriptions_count'),)
         })
     )
-    readonly_fields = ('created', 'modified')
+    readonly_fields = ('created', 'modified', 'subscriptions_count')
 
 
 @admin.register(Subscription)
@@ -12,3 +12,7 @@ class CirclesConfig(AppConfig):
     """
 
     name = 'uywasi_backend.circles'
+
+    def ready(self):
+        """Register the signals of the app."""
+        import uywasi_backend.circles.signals  # noqa F401
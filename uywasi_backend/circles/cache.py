@@ -0,0 +1,48 @@
+"""Circles app cache."""
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+# Local models
+from uywasi_backend.circles.models import Subscription
+
+
+def get_memberships_cache_key(user_pk):
+    """Return the cache key of the circle memberships of a user."""
+    return 'circles:memberships:{}'.format(user_pk)
+
+
+def get_memberships(user):
+    """
+    get_memberships.
+
+    Return a dict with the circle ids of the subscriptions of a user as
+    keys and whether he is admin of the circle as values. It is cached
+    until his subscriptions change, and kept in the user instance so the
+    permissions of a request read it once.
+    """
+    memberships = getattr(user, '_circle_memberships', None)
+    if memberships is not None:
+        return memberships
+    key = get_memberships_cache_key(user.pk)
+    memberships = cache.get(key)
+    if memberships is None:
+        memberships = dict(Subscription.objects.filter(
+            user=user.pk).values_list('circle', 'is_admin'))
+        cache.set(key, memberships,
+                  timeout=settings.CIRCLE_MEMBERSHIPS_CACHE_TIMEOUT)
+    user._circle_memberships = memberships
+    return memberships
+
+
+def invalidate_memberships_cache(*user_pks):
+    """
+    invalidate_memberships_cache.
+
+    Remove the cached circle memberships of the users once the current
+    transaction is committed, so memberships read before the commit are
+    not cached again.
+    """
+    keys = [get_memberships_cache_key(pk) for pk in user_pks]
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,21 @@
+# Generated by Django 3.0.10 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('circles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='circle',
+            index=models.Index(fields=['-created', '-id'], name='circle_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['-created', '-id'], name='subscription_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.0.10 on 2026-10-18 13:20
+
+from django.db import migrations, models
+
+
+def fill_subscriptions_counters(apps, schema_editor):
+    """Compute the counters of the existing circles."""
+    Circle = apps.get_model('circles', 'Circle')
+    Subscription = apps.get_model('circles', 'Subscription')
+    subscriptions = Subscription.objects.order_by().values('circle') \
+        .annotate(total=models.Count('pk'))
+    for row in subscriptions.iterator():
+        Circle.objects.filter(pk=row['circle']).update(
+            subscriptions_count=row['total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('circles', '0002_created_id_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='circle',
+            name='subscriptions_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of users subscribed to this circle. It is updated when a subscription is created or deleted.'),
+        ),
+        migrations.RunPython(fill_subscriptions_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.0.10 on 2026-10-18 13:50
+
+from django.db import migrations
+
+# The search of the circles filters by UPPER(field::text) LIKE
+# UPPER('%term%'), these trigram indexes over the same expressions resolve it.
+SEARCH_FIELDS = ('slugname', 'name')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_trigram_indexes'),
+        ('circles', '0003_circle_subscriptions_count'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX circles_circle_{0}_trgm_idx ON circles_circle '
+            'USING gin ((UPPER({0}::text)) gin_trgm_ops);'.format(field),
+            'DROP INDEX circles_circle_{0}_trgm_idx;'.format(field),
+        )
+        for field in SEARCH_FIELDS
+    ]
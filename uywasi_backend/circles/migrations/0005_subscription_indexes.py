@@ -0,0 +1,21 @@
+# Generated by Django 3.0.10 on 2026-10-18 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('circles', '0004_circle_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['user', '-is_admin', '-created'], name='subscription_user_admin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['circle', '-created', '-id'], name='subscription_circle_idx'),
+        ),
+    ]
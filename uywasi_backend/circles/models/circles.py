@@ -71,10 +71,17 @@ class Circle(StandardModel):
         through_fields=('circle', 'user')
     )
 
+    subscriptions_count = models.PositiveIntegerField(
+        help_text=_('Number of users subscribed to this circle. It is '
+                    'updated when a subscription is created or deleted.'),
+        default=0,
+        editable=False
+    )
+
     @property
     def number_of_subscriptions(self):
         """Return the number of subscriptions of circle."""
-        return self.subscriptions.all().count()
+        return self.subscriptions_count
 
     def __str__(self):
         """Return slugname."""
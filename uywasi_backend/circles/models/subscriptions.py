@@ -49,6 +49,16 @@ class Subscription(StandardModel):
     class Meta(StandardModel.Meta):
         """Meta options. Extended from StandardModel.Meta."""
 
+        indexes = StandardModel.Meta.indexes + (
+            models.Index(
+                fields=('user', '-is_admin', '-created'),
+                name='subscription_user_admin_idx'
+            ),
+            models.Index(
+                fields=('circle', '-created', '-id'),
+                name='subscription_circle_idx'
+            ),
+        )
         constraints = (
             models.UniqueConstraint(
                 fields=('user', 'circle'),
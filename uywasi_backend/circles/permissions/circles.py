@@ -4,8 +4,8 @@
 from django.utils.translation import ugettext as _
 # Django Rest Framework
 from rest_framework.permissions import BasePermission
-# Local models
-from uywasi_backend.circles.models import Subscription
+# Local cache
+from uywasi_backend.circles.cache import get_memberships
 
 
 class IsCircleActive(BasePermission):
@@ -37,12 +37,13 @@ class IsCircleAdmin(BasePermission):
         has_permission.
 
         This function checks that the authenticated user is admin
-        of circle.
+        of circle, using his cached memberships.
         """
         user = request.user
+        if not user.is_authenticated:
+            return False
         circle = view.get_object()
-        return Subscription.objects.filter(
-            user=user, circle=circle, is_admin=True).exists()
+        return get_memberships(user).get(circle.pk, False)
 
 
 class IsCircleMember(BasePermission):
@@ -60,8 +61,10 @@ class IsCircleMember(BasePermission):
         has_permission.
 
         This function checks that the authenticated user is member
-        of circle.
+        of circle, using his cached memberships.
         """
         user = request.user
+        if not user.is_authenticated:
+            return False
         circle = view.get_object()
-        return circle.subscriptions.filter(pk=user.pk).exists()
+        return circle.pk in get_memberships(user)
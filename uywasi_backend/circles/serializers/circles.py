@@ -8,6 +8,10 @@ from rest_framework import serializers
 from uywasi_backend.circles.models import Circle, Subscription
 # Local serializers
 from uywasi_backend.accounts.serializers import UserModelSerializer
+# Utils
+from uywasi_backend.utils.images import ImageVariantField
+from uywasi_backend.utils.values import (
+    ImageValueField, ValueField, ValuesSerializer)
 
 
 class CircleModelSerializer(serializers.ModelSerializer):
@@ -17,6 +21,11 @@ class CircleModelSerializer(serializers.ModelSerializer):
     Serialize the most important fields of a circle.
     """
 
+    profile_photo_thumbnail = ImageVariantField(
+        source='profile_photo', variant='thumbnail')
+    cover_photo_medium = ImageVariantField(
+        source='cover_photo', variant='medium')
+
     def create(self, validate_data):
         """
         create.
@@ -33,11 +42,34 @@ class CircleModelSerializer(serializers.ModelSerializer):
         """Meta options."""
 
         model = Circle
-        fields = ('name', 'slugname', 'profile_photo', 'cover_photo',
-                  'about', 'is_verified', 'number_of_subscriptions')
+        fields = ('name', 'slugname', 'profile_photo',
+                  'profile_photo_thumbnail', 'cover_photo',
+                  'cover_photo_medium', 'about', 'is_verified',
+                  'number_of_subscriptions')
         read_only_fields = ('is_verified',)
 
 
+class CircleValuesSerializer(ValuesSerializer):
+    """
+    CircleValuesSerializer.
+
+    Serialize the rows of the circles as CircleModelSerializer.
+    """
+
+    profile_photo = ImageValueField()
+    profile_photo_thumbnail = ImageValueField(
+        source='profile_photo', variant='thumbnail')
+    cover_photo = ImageValueField()
+    cover_photo_medium = ImageValueField(
+        source='cover_photo', variant='medium')
+    number_of_subscriptions = ValueField(source='subscriptions_count')
+
+    class Meta:
+        """Meta options."""
+
+        fields = CircleModelSerializer.Meta.fields
+
+
 class CircleDetailSerializer(CircleModelSerializer):
     """
     CircleDetailSerializer.
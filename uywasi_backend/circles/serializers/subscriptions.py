@@ -7,8 +7,11 @@ from rest_framework import serializers
 # Local models
 from uywasi_backend.circles.models import Subscription
 # Local serializers
-from uywasi_backend.accounts.serializers import UserModelSerializer
+from uywasi_backend.accounts.serializers import (
+    UserModelSerializer, UserValuesSerializer)
 from uywasi_backend.circles.serializers import CircleModelSerializer
+# Utils
+from uywasi_backend.utils.values import NestedValueField, ValuesSerializer
 
 
 class SubscriptionModelSerializer(serializers.ModelSerializer):
@@ -67,6 +70,22 @@ class CircleSubscriptionModelSerializer(serializers.ModelSerializer):
         read_only_fields = ('user', 'is_admin')
 
 
+class CircleSubscriptionValuesSerializer(ValuesSerializer):
+    """
+    CircleSubscriptionValuesSerializer.
+
+    Serialize the rows of the subscriptions of a circle as
+    CircleSubscriptionModelSerializer.
+    """
+
+    user = NestedValueField(UserValuesSerializer)
+
+    class Meta:
+        """Meta options."""
+
+        fields = CircleSubscriptionModelSerializer.Meta.fields
+
+
 class UserSubscriptionModelSerializer(serializers.ModelSerializer):
     """
     CircleSubscriptionModelSerializer.
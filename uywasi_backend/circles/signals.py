@@ -0,0 +1,44 @@
+"""Circles app signals."""
+
+# Django
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+# Local models
+from uywasi_backend.circles.models import Circle, Subscription
+# Local cache
+from uywasi_backend.circles.cache import invalidate_memberships_cache
+# Local signals
+from uywasi_backend.accounts.signals import invalidate_owner_profile
+from uywasi_backend.general.signals import dispatch_image_variants
+
+
+@receiver(post_save, sender=Subscription)
+def increment_subscriptions_counter(sender, instance, created, **kwargs):
+    """Increment the subscriptions counter of the circle subscribed."""
+    if created:
+        Circle.objects.filter(pk=instance.circle_id).update(
+            subscriptions_count=F('subscriptions_count') + 1)
+
+
+@receiver(post_delete, sender=Subscription)
+def decrement_subscriptions_counter(sender, instance, **kwargs):
+    """Decrement the subscriptions counter of the circle unsubscribed."""
+    Circle.objects.filter(pk=instance.circle_id).update(
+        subscriptions_count=Greatest(F('subscriptions_count') - 1, 0))
+
+
+@receiver(post_save, sender=Subscription)
+@receiver(post_delete, sender=Subscription)
+def invalidate_subscriber_memberships(sender, instance, **kwargs):
+    """Remove the cached circle memberships of the subscribed user."""
+    invalidate_memberships_cache(instance.user_id)
+
+
+# The profiles show the subscriptions of their user.
+post_save.connect(invalidate_owner_profile, sender=Subscription)
+post_delete.connect(invalidate_owner_profile, sender=Subscription)
+
+# The images of the circles have variants.
+post_save.connect(dispatch_image_variants, sender=Circle)
@@ -0,0 +1,44 @@
+"""Circles app factories."""
+
+# Factory boy
+import factory
+from factory.django import DjangoModelFactory
+# Local models
+from uywasi_backend.circles.models import Circle, Subscription
+# Local factories
+from uywasi_backend.accounts.tests.factories import UserFactory
+
+
+class CircleFactory(DjangoModelFactory):
+    """
+    CircleFactory.
+
+    Build an active circle with an unique slugname.
+    """
+
+    name = factory.Faker('company')
+    slugname = factory.Sequence(lambda n: 'circle-{}'.format(n))
+    about = factory.Faker('paragraph')
+
+    class Meta:
+        """Meta options."""
+
+        model = Circle
+        django_get_or_create = ('slugname',)
+
+
+class SubscriptionFactory(DjangoModelFactory):
+    """
+    SubscriptionFactory.
+
+    Build the subscription of a new user to a new circle.
+    """
+
+    user = factory.SubFactory(UserFactory)
+    circle = factory.SubFactory(CircleFactory)
+    is_admin = False
+
+    class Meta:
+        """Meta options."""
+
+        model = Subscription
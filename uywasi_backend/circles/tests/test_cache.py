@@ -0,0 +1,26 @@
+"""Circles app cache tests."""
+
+# Django
+from django.db import transaction
+# Local cache
+from uywasi_backend.circles.cache import get_memberships
+# Local factories
+from uywasi_backend.circles.tests.factories import (
+    CircleFactory, SubscriptionFactory)
+# Utils
+import pytest
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def test_memberships_are_invalidated_after_commit(user):
+    """The memberships read before the commit are removed once committed."""
+    assert get_memberships(user) == {}
+    circle = CircleFactory()
+    with transaction.atomic():
+        SubscriptionFactory(user=user, circle=circle, is_admin=True)
+        del user._circle_memberships
+        assert get_memberships(user) == {}
+
+    del user._circle_memberships
+    assert get_memberships(user) == {circle.pk: True}
@@ -14,16 +14,21 @@ from uywasi_backend.circles.models import Circle
 # Local serializers
 from uywasi_backend.circles.serializers import (CircleModelSerializer,
                                  CircleDetailSerializer)
+# Utils
+from uywasi_backend.utils.cache import CachedRetrieveMixin
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
 
 
-class CircleViewSet(mixins.RetrieveModelMixin, mixins.ListModelMixin,
+class CircleViewSet(SafeMethodsNonAtomicMixin, CachedRetrieveMixin,
+                    mixins.RetrieveModelMixin, mixins.ListModelMixin,
                     mixins.CreateModelMixin, mixins.UpdateModelMixin,
                     mixins.DestroyModelMixin, viewsets.GenericViewSet):
     """
     CircleViewSet.
 
     This class is a set of functions that allow: subscribe, and CRUD
-    actions.
+    actions. The detail of a circle is cached until it changes, its
+    subscriptions counter is refreshed after RETRIEVE_CACHE_TIMEOUT.
     """
 
     lookup_field = 'slugname'
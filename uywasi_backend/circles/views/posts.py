@@ -1,23 +1,35 @@
 """Circles app Posts views."""
 
+# Django
+from django.utils.translation import ugettext as _
 # Django Rest Framework
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny
 from rest_framework.generics import get_object_or_404
 from rest_framework import viewsets, mixins
 # Local models
 from uywasi_backend.circles.models import Circle
 from uywasi_backend.posts.models import Post
+# Local exports
+from uywasi_backend.posts.exports import EXPORT_TYPES, export_posts
 # Local serializers
 from uywasi_backend.posts.serializers import CirclePostSerializer
+# Utils
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
+from uywasi_backend.utils.pagination import KeysetPagination
 
 
-class PostViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class PostViewSet(SafeMethodsNonAtomicMixin,
+                  mixins.ListModelMixin, viewsets.GenericViewSet):
     """
     PostViewSet.
 
     Allow list the posts of a circle, taking the slugname of url.
     """
 
+    pagination_class = KeysetPagination
+
     def dispatch(self, request, *args, **kwargs):
         """
         dipatch.
@@ -40,9 +52,8 @@ class PostViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         obtained on dispatch function.
         """
         if self.action == 'list':
-            return Post.objects.filter(
-                circle=self.circle
-            )
+            return CirclePostSerializer.setup_eager_loading(
+                Post.objects.filter(circle=self.circle))
 
     def get_serializer_class(self):
         """
@@ -61,6 +72,25 @@ class PostViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         If the action is list, then return a list with an instance of AllowAny
         as permissions.
         """
-        if self.action == 'list':
+        if self.action in ('list', 'export'):
             permissions = (AllowAny,)
         return [permission() for permission in permissions]
+
+    @action(detail=False, methods=['get'])
+    def export(self, request, *args, **kwargs):
+        """
+        export.
+
+        Stream all the posts of the circle as CSV, or as newline
+        delimited JSON with ?type=ndjson.
+        """
+        export_type = request.query_params.get('type', 'csv')
+        if export_type not in EXPORT_TYPES:
+            raise ValidationError({'type': _(
+                'The type must be one of: {}.').format(
+                ', '.join(EXPORT_TYPES))})
+        return export_posts(
+            queryset=Post.objects.filter(circle=self.circle),
+            export_type=export_type,
+            filename='posts-{}'.format(self.circle.slugname)
+        )
@@ -14,11 +14,16 @@ from uywasi_backend.circles.permissions import IsSubscriptionOwner
 from uywasi_backend.circles.models import Circle, Subscription
 # Local serializers
 from uywasi_backend.circles.serializers import (CircleSubscriptionModelSerializer,
+                                 CircleSubscriptionValuesSerializer,
                                  SubscriptionModelSerializer,
                                  SubscriptionDetailSerializer)
+# Utils
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
+from uywasi_backend.utils.values import ValuesListMixin
 
 
-class SubscriptionViewSet(mixins.RetrieveModelMixin, mixins.CreateModelMixin,
+class SubscriptionViewSet(SafeMethodsNonAtomicMixin, ValuesListMixin,
+                          mixins.RetrieveModelMixin, mixins.CreateModelMixin,
                           mixins.ListModelMixin, mixins.DestroyModelMixin,
                           viewsets.GenericViewSet):
     """
@@ -28,6 +33,8 @@ class SubscriptionViewSet(mixins.RetrieveModelMixin, mixins.CreateModelMixin,
     subscribe, unsubscribe, list subscriptions of a circle, and others.
     """
 
+    values_serializer_class = CircleSubscriptionValuesSerializer
+
     # Filtering and ordering options
 
     filter_backends = (OrderingFilter, DjangoFilterBackend)
@@ -12,3 +12,7 @@ class GeneralConfig(AppConfig):
     """
 
     name = 'uywasi_backend.general'
+
+    def ready(self):
+        """Register the signals of the app."""
+        import uywasi_backend.general.signals  # noqa F401
@@ -0,0 +1,167 @@
+"""
+Hot queries of the API.
+
+Each registered function returns the queryset of a query run by a hot
+endpoint, built with sample values read from the database, or None if
+there is no data to build it. They are checked by the explain_hot_queries
+management command.
+"""
+
+# Django
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery
+from django.utils import timezone
+# Local models
+from uywasi_backend.accounts.models import Following, User, UserAccount
+from uywasi_backend.circles.models import Circle, Subscription
+from uywasi_backend.posts.models import Match, Post, SEARCH_CONFIG
+# Utils
+from uywasi_backend.utils.geo import bounding_box
+from datetime import timedelta
+
+PAGE_SIZE = 100
+
+HOT_QUERIES = {}
+
+
+def register(name):
+    """Register a function that returns a hot query as name."""
+    def decorator(function):
+        HOT_QUERIES[name] = function
+        return function
+    return decorator
+
+
+def sample(queryset):
+    """Return the first row of a queryset as sample, or None if empty."""
+    return queryset.first()
+
+
+@register('posts.list')
+def posts_list():
+    """Latest posts."""
+    return Post.objects.order_by('-created', '-id')[:PAGE_SIZE]
+
+
+@register('posts.user')
+def posts_of_user():
+    """Latest posts of the author of the latest post."""
+    post = sample(Post.objects.order_by('-created'))
+    if post is None:
+        return None
+    return Post.objects.filter(user=post.user_id) \
+        .order_by('-created', '-id')[:PAGE_SIZE]
+
+
+@register('posts.circle')
+def posts_of_circle():
+    """Latest posts of the biggest circle."""
+    circle = sample(Circle.objects.order_by('-subscriptions_count'))
+    if circle is None:
+        return None
+    return Post.objects.filter(circle=circle) \
+        .order_by('-created', '-id')[:PAGE_SIZE]
+
+
+@register('posts.circle.open_lost')
+def open_lost_posts_of_circle():
+    """Latest open lost posts of the biggest circle."""
+    circle = sample(Circle.objects.order_by('-subscriptions_count'))
+    if circle is None:
+        return None
+    return Post.objects.filter(circle=circle, state='open', tag='lost') \
+        .order_by('-created')[:PAGE_SIZE]
+
+
+@register('posts.open_adoption')
+def open_adoption_posts():
+    """Latest open adoption posts."""
+    return Post.objects.filter(state='open', tag='adoption') \
+        .order_by('-created', '-id')[:PAGE_SIZE]
+
+
+@register('posts.near')
+def posts_near():
+    """Posts inside the bounding box of 5 kilometers around a post."""
+    post = sample(Post.objects.order_by('-created'))
+    if post is None:
+        return None
+    min_latitude, max_latitude, min_longitude, max_longitude = \
+        bounding_box(post.latitude, post.longitude, 5)
+    queryset = Post.objects.filter(
+        latitude__range=(min_latitude, max_latitude))
+    if min_longitude is not None and min_longitude <= max_longitude:
+        queryset = queryset.filter(
+            longitude__range=(min_longitude, max_longitude))
+    return queryset
+
+
+@register('posts.search')
+def posts_search():
+    """Posts that match the name of a pet."""
+    post = sample(Post.objects.exclude(name=None).order_by('-created'))
+    if post is None:
+        return None
+    return Post.objects.filter(
+        search_vector=SearchQuery(post.name, config=SEARCH_CONFIG))
+
+
+@register('posts.match_candidates')
+def match_candidates():
+    """Candidates of the latest lost post in its bucket."""
+    post = sample(Post.objects.filter(tag='lost').order_by('-created'))
+    if post is None:
+        return None
+    window = timedelta(days=settings.MATCH_WINDOW_DAYS)
+    return Post.objects.filter(
+        tag='finded', state='open', match_bucket=post.match_bucket,
+        created__range=(post.created - window, timezone.now()))
+
+
+@register('matches.post')
+def matches_of_post():
+    """Best matches of a post."""
+    match = sample(Match.objects.order_by('-created'))
+    if match is None:
+        return None
+    return Match.objects.filter(post=match.post_id) \
+        .order_by('-score', '-id')[:PAGE_SIZE]
+
+
+@register('subscriptions.user')
+def subscriptions_of_user():
+    """Subscriptions of a user, the circles that he administrates first."""
+    subscription = sample(Subscription.objects.order_by('-created'))
+    if subscription is None:
+        return None
+    return Subscription.objects.filter(user=subscription.user_id) \
+        .order_by('-is_admin')[:3]
+
+
+@register('followings.followers')
+def followers_of_account():
+    """Followers of the most followed account."""
+    account = sample(UserAccount.objects.order_by('-followers_count'))
+    if account is None:
+        return None
+    return Following.objects.filter(user_account_to=account) \
+        .order_by('created')[:PAGE_SIZE]
+
+
+@register('followings.follows')
+def follows_of_account():
+    """Follows of the account that follows more accounts."""
+    account = sample(UserAccount.objects.order_by('-follows_count'))
+    if account is None:
+        return None
+    return Following.objects.filter(user_account_from=account) \
+        .order_by('created')[:PAGE_SIZE]
+
+
+@register('users.search')
+def users_search():
+    """Users whose username contains the username of a user."""
+    user = sample(User.objects.order_by('-date_joined'))
+    if user is None:
+        return None
+    return User.objects.filter(username__icontains=user.username[:5])
@@ -0,0 +1,99 @@
+"""Explain the hot queries of the API."""
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+# Local
+from uywasi_backend.general.hot_queries import HOT_QUERIES
+# Utils
+import json
+
+
+class Command(BaseCommand):
+    """
+    Command.
+
+    Run EXPLAIN ANALYZE on each registered hot query, and fail if a query
+    scans sequentially a table with at least --min-rows rows. It should be
+    run on a database seeded with realistic volumes, e.g. with the
+    seed_database command, so the plans are the plans of production.
+    """
+
+    help = 'Explain the hot queries and fail on sequential scans of big tables.'
+
+    def add_arguments(self, parser):
+        """Add the options of the command."""
+        parser.add_argument(
+            '--min-rows', type=int, default=10000,
+            help='Rows of the smallest table that can not be scanned.')
+        parser.add_argument(
+            '--query', action='append', dest='queries', default=None,
+            help='Name of a query to explain, all by default.')
+        parser.add_argument(
+            '--verbose-plans', action='store_true',
+            help='Print the plan of every query.')
+
+    def handle(self, *args, **options):
+        """Explain the queries and report the sequential scans."""
+        names = options['queries'] or sorted(HOT_QUERIES)
+        unknown = set(names) - set(HOT_QUERIES)
+        if unknown:
+            raise CommandError('Unknown queries: {}.'.format(
+                ', '.join(sorted(unknown))))
+
+        failures = []
+        for name in names:
+            queryset = HOT_QUERIES[name]()
+            if queryset is None:
+                self.stdout.write(self.style.WARNING(
+                    '{}: skipped, there is no data.'.format(name)))
+                continue
+            plan = self.get_plan(queryset)
+            scans = [
+                table for table in self.get_sequential_scans(plan['Plan'])
+                if self.get_table_rows(table) >= options['min_rows']
+            ]
+            message = '{}: {:.2f} ms'.format(name, plan['Execution Time'])
+            if scans:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR('{}, Seq Scan on {}'.format(
+                    message, ', '.join(scans))))
+            else:
+                self.stdout.write(self.style.SUCCESS(message))
+            if scans or options['verbose_plans']:
+                self.stdout.write(json.dumps(plan['Plan'], indent=2))
+
+        if failures:
+            raise CommandError('Sequential scans in: {}.'.format(
+                ', '.join(failures)))
+
+    def get_plan(self, queryset):
+        """
+        get_plan.
+
+        Return the plan of a queryset run by EXPLAIN ANALYZE. The JSON plan
+        is read from the cursor, because QuerySet.explain returns it as the
+        repr of the parsed value instead of JSON.
+        """
+        sql, params = queryset.query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute('EXPLAIN (ANALYZE, FORMAT JSON) ' + sql, params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]
+
+    def get_sequential_scans(self, node):
+        """Yield the tables scanned sequentially by a plan node."""
+        if node['Node Type'] == 'Seq Scan':
+            yield node['Relation Name']
+        for child in node.get('Plans', ()):
+            yield from self.get_sequential_scans(child)
+
+    def get_table_rows(self, table):
+        """Return the number of rows of a table estimated by the planner."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE relname = %s', [table])
+            row = cursor.fetchone()
+        return row[0] if row else 0
@@ -0,0 +1,105 @@
+"""Seed the database with realistic volumes."""
+
+# Django
+from django.core.management.base import BaseCommand
+# Utils
+import random
+
+# Volumes seeded for the scale 1.
+VOLUMES = {
+    'users': 2000,
+    'follows_per_user': 25,
+    'circles': 50,
+    'subscriptions_per_user': 5,
+    'breeds': 40,
+    'posts': 20000,
+}
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    """
+    Command.
+
+    Create users, followings, circles, subscriptions and posts in batches
+    for the benchmarks and the query plans. The factories build the
+    instances, which are inserted with bulk_create, so the values that are
+    computed on save or by signals are computed here. It needs the
+    development requirements.
+    """
+
+    help = 'Seed the database with users, circles and posts.'
+
+    def add_arguments(self, parser):
+        """Add the options of the command."""
+        parser.add_argument(
+            '--scale', type=int, default=1,
+            help='Multiplier of the number of users, circles and posts.')
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Seed of the random relations between the rows.')
+
+    def handle(self, *args, **options):
+        """Seed the database."""
+        # The factories are development requirements.
+        from uywasi_backend.accounts.models import (
+            Following, User, UserAccount)
+        from uywasi_backend.accounts.tests.factories import (
+            UserAccountFactory, UserFactory)
+        from uywasi_backend.circles.models import Circle, Subscription
+        from uywasi_backend.circles.tests.factories import CircleFactory
+        from uywasi_backend.general.models import Breed
+        from uywasi_backend.general.tests.factories import BreedFactory
+        from uywasi_backend.general.tasks import (
+            reconcile_following_counters, reconcile_subscriptions_counters)
+        from uywasi_backend.posts.models import Post
+        from uywasi_backend.posts.tests.factories import PostFactory
+
+        generator = random.Random(options['seed'])
+        scale = options['scale']
+
+        users = User.objects.bulk_create(
+            UserFactory.build_batch(VOLUMES['users'] * scale),
+            batch_size=BATCH_SIZE)
+        accounts = UserAccount.objects.bulk_create(
+            [UserAccountFactory.build(user=user) for user in users],
+            batch_size=BATCH_SIZE)
+        Following.objects.bulk_create(
+            (Following(user_account_from=account, user_account_to=followed)
+             for account in accounts
+             for followed in generator.sample(
+                 accounts, VOLUMES['follows_per_user'])
+             if followed != account),
+            batch_size=BATCH_SIZE, ignore_conflicts=True)
+        reconcile_following_counters()
+
+        circles = Circle.objects.bulk_create(
+            CircleFactory.build_batch(VOLUMES['circles'] * scale),
+            batch_size=BATCH_SIZE)
+        Subscription.objects.bulk_create(
+            (Subscription(user=user, circle=circle, is_admin=False)
+             for user in users
+             for circle in generator.sample(
+                 circles, VOLUMES['subscriptions_per_user'])),
+            batch_size=BATCH_SIZE)
+        reconcile_subscriptions_counters()
+
+        breeds = Breed.objects.bulk_create(
+            BreedFactory.build_batch(VOLUMES['breeds'] * scale),
+            batch_size=BATCH_SIZE)
+        total = VOLUMES['posts'] * scale
+        for start in range(0, total, BATCH_SIZE):
+            posts = PostFactory.build_batch(
+                min(BATCH_SIZE, total - start),
+                photo_first='posts/pets/photos/seed.jpg')
+            for post in posts:
+                post.user = generator.choice(users)
+                post.breed = generator.choice(breeds)
+                post.circle = generator.choice(circles + [None] * 3)
+                post.match_bucket = post.get_match_bucket()
+            Post.objects.bulk_create(posts)
+
+        self.stdout.write(self.style.SUCCESS(
+            'Seeded {} users, {} circles and {} posts.'.format(
+                len(users), len(circles), total)))
@@ -0,0 +1,17 @@
+# Generated by Django 3.0.10 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('general', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='breed',
+            index=models.Index(fields=['-created', '-id'], name='breed_created_id_idx'),
+        ),
+    ]
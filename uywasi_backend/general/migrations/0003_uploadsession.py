@@ -0,0 +1,46 @@
+# Generated by Django 3.0.10 on 2026-10-18 17:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('general', '0002_created_id_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Date time on wich the object was created.')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='Date time on wich the object was last modified.')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='Identifier of the session, it is not guessable.', primary_key=True, serialize=False)),
+                ('target', models.CharField(help_text='Model and image field which the image is uploaded for, e.g. post.photo_first.', max_length=32)),
+                ('object_id', models.PositiveIntegerField(blank=True, help_text='Identifier of the instance which the image is attached to. It is empty until the image is attached to a new instance.', null=True)),
+                ('key', models.CharField(help_text='Name of the image in the storage.', max_length=255, unique=True)),
+                ('content_type', models.CharField(help_text='Content type of the image.', max_length=32)),
+                ('size', models.PositiveIntegerField(help_text='Size of the image in bytes.')),
+                ('expires', models.DateTimeField(help_text='Date time until which the image can be uploaded.')),
+                ('confirmed', models.DateTimeField(blank=True, help_text='Date time on which the uploaded image was validated.', null=True)),
+                ('user', models.ForeignKey(help_text='This is the user who uploads the image.', on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created', '-modified'],
+                'get_latest_by': ['-created', '-modified'],
+                'abstract': False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name='uploadsession',
+            index=models.Index(fields=['-created', '-id'], name='uploadsession_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uploadsession',
+            index=models.Index(fields=['expires'], name='uploadsession_expires_idx'),
+        ),
+    ]
@@ -2,3 +2,4 @@
 
 from .general import *
 from .breeds import *
+from .uploads import *
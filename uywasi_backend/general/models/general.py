@@ -30,3 +30,10 @@ class StandardModel(models.Model):
         abstract = True
         get_latest_by = ['-created', '-modified']
         ordering = ['-created', '-modified']
+        # Keyset used by the cursor pagination of the lists of posts.
+        indexes = (
+            models.Index(
+                fields=('-created', '-id'),
+                name='%(class)s_created_id_idx'
+            ),
+        )
@@ -0,0 +1,97 @@
+"""General app Uploads models."""
+
+# Django
+from django.conf import settings
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+# Local models
+from uywasi_backend.general.models import StandardModel
+# Utils
+import uuid
+
+
+class UploadSession(StandardModel):
+    """
+    UploadSession.
+
+    Represent an image uploaded by a client directly to the object storage
+    with a presigned request, instead of through the API. The session is
+    confirmed once the stored image is validated, and it is attached when
+    the image is set to the field of its target.
+    """
+
+    id = models.UUIDField(
+        help_text=_('Identifier of the session, it is not guessable.'),
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+
+    user = models.ForeignKey(
+        help_text=_('This is the user who uploads the image.'),
+        to=settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='upload_sessions'
+    )
+
+    target = models.CharField(
+        help_text=_('Model and image field which the image is uploaded for, '
+                    'e.g. post.photo_first.'),
+        max_length=32
+    )
+
+    object_id = models.PositiveIntegerField(
+        help_text=_('Identifier of the instance which the image is attached '
+                    'to. It is empty until the image is attached to a new '
+                    'instance.'),
+        blank=True,
+        null=True
+    )
+
+    key = models.CharField(
+        help_text=_('Name of the image in the storage.'),
+        max_length=255,
+        unique=True
+    )
+
+    content_type = models.CharField(
+        help_text=_('Content type of the image.'),
+        max_length=32
+    )
+
+    size = models.PositiveIntegerField(
+        help_text=_('Size of the image in bytes.')
+    )
+
+    expires = models.DateTimeField(
+        help_text=_('Date time until which the image can be uploaded.')
+    )
+
+    confirmed = models.DateTimeField(
+        help_text=_('Date time on which the uploaded image was validated.'),
+        blank=True,
+        null=True
+    )
+
+    @property
+    def is_attached(self):
+        """Return True if the image is set to the field of an instance."""
+        return self.confirmed is not None and self.object_id is not None
+
+    def __str__(self):
+        """
+        __str__.
+
+        Return a string representation formed by target and key.
+        """
+        return '{}: {}'.format(self.target, self.key)
+
+    class Meta(StandardModel.Meta):
+        """Meta options. Extended from StandardModel.Meta."""
+
+        indexes = StandardModel.Meta.indexes + (
+            models.Index(
+                fields=('expires',),
+                name='uploadsession_expires_idx'
+            ),
+        )
@@ -1,3 +1,4 @@
 """General app serializers."""
 
 from .breeds import *
+from .uploads import *
@@ -4,6 +4,10 @@
 from rest_framework import serializers
 # Local models
 from uywasi_backend.general.models import Breed
+# Utils
+from uywasi_backend.utils.images import ImageVariantField
+from uywasi_backend.utils.values import (
+    ChoiceDisplayValueField, ImageValueField, ValuesSerializer)
 
 
 class BreedModelSerializer(serializers.ModelSerializer):
@@ -14,6 +18,7 @@ class BreedModelSerializer(serializers.ModelSerializer):
     """
 
     display_animal = serializers.SerializerMethodField()
+    photo_thumbnail = ImageVariantField(source='photo', variant='thumbnail')
 
     def get_display_animal(self, obj):
         """Return animal display of breed."""
@@ -24,6 +29,23 @@ class BreedModelSerializer(serializers.ModelSerializer):
 
         model = Breed
         fields = ('id', 'name', 'animal', 'display_animal',
-                  'photo', 'description')
-        read_only_fields = ('id', 'name', 'animal', 'display_animal',
-                            'photo', 'description')
+                  'photo', 'photo_thumbnail', 'description')
+        read_only_fields = fields
+
+
+class BreedValuesSerializer(ValuesSerializer):
+    """
+    BreedValuesSerializer.
+
+    Serialize the rows of the breeds as BreedModelSerializer.
+    """
+
+    display_animal = ChoiceDisplayValueField(
+        source='animal', choices=Breed._meta.get_field('animal').choices)
+    photo = ImageValueField()
+    photo_thumbnail = ImageValueField(source='photo', variant='thumbnail')
+
+    class Meta:
+        """Meta options."""
+
+        fields = BreedModelSerializer.Meta.fields
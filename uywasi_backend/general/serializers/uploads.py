@@ -0,0 +1,122 @@
+"""General app Uploads serializers."""
+
+# Django
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import ugettext as _
+# Django Rest Framework
+from rest_framework import serializers
+# Local models
+from uywasi_backend.general.models import UploadSession
+# Local uploads
+from uywasi_backend.general.uploads import (
+    NEW_INSTANCE_TARGETS, UPLOAD_TARGETS, get_client, get_target_instance,
+    get_upload_name, presign_upload)
+# Utils
+from datetime import timedelta
+
+
+class UploadSessionModelSerializer(serializers.ModelSerializer):
+    """
+    UploadSessionModelSerializer.
+
+    Serialize an upload session, with the url and the form fields of its
+    presigned POST while the image is pending to upload.
+    """
+
+    upload = serializers.SerializerMethodField()
+
+    def get_upload(self, obj):
+        """Return the presigned POST of a pending session, or None."""
+        if obj.confirmed is not None or obj.expires <= timezone.now():
+            return None
+        return presign_upload(obj)
+
+    def validate_target(self, data):
+        """Check the target is one of the upload targets."""
+        if data not in UPLOAD_TARGETS:
+            raise serializers.ValidationError(
+                _('The target must be one of {}.').format(
+                    ', '.join(sorted(UPLOAD_TARGETS))))
+        return data
+
+    def validate_content_type(self, data):
+        """Check the content type is one of the allowed image types."""
+        if data not in settings.UPLOADS_CONTENT_TYPES:
+            raise serializers.ValidationError(
+                _('The content type must be one of {}.').format(
+                    ', '.join(settings.UPLOADS_CONTENT_TYPES)))
+        return data
+
+    def validate_size(self, data):
+        """Check the size is below the max size of the uploads."""
+        if not 0 < data <= settings.UPLOADS_MAX_SIZE:
+            raise serializers.ValidationError(
+                _('The size must be at most {} bytes.').format(
+                    settings.UPLOADS_MAX_SIZE))
+        return data
+
+    def validate(self, data):
+        """
+        validate.
+
+        Check the storage accepts direct uploads, and the user can change
+        the image of the target instance. Only the posts can be created
+        after their images are uploaded.
+        """
+        if get_client() is None:
+            raise serializers.ValidationError(
+                _('The direct uploads are not available.'))
+        if data.get('object_id') is None:
+            if data['target'] not in NEW_INSTANCE_TARGETS:
+                raise serializers.ValidationError(
+                    {'object_id': _('This field is required.')})
+        else:
+            get_target_instance(
+                self.context['request'].user, data['target'],
+                data['object_id'])
+        return data
+
+    def create(self, validated_data):
+        """Create the session with a new name for the image."""
+        return UploadSession.objects.create(
+            user=self.context['request'].user,
+            key=get_upload_name(validated_data['target'],
+                                validated_data['content_type']),
+            expires=timezone.now() + timedelta(
+                seconds=settings.UPLOADS_EXPIRATION),
+            **validated_data)
+
+    class Meta:
+        """Meta options."""
+
+        model = UploadSession
+        fields = ('id', 'target', 'object_id', 'content_type', 'size', 'key',
+                  'expires', 'confirmed', 'upload')
+        read_only_fields = ('id', 'key', 'expires', 'confirmed', 'upload')
+
+
+class UploadSessionField(serializers.PrimaryKeyRelatedField):
+    """
+    UploadSessionField.
+
+    Deserialize the id of a confirmed upload session of the user, not
+    attached yet, for the target of the field, e.g.
+    UploadSessionField(target='post.photo_first'). It is used to create
+    the instances with the images uploaded directly to the storage.
+    """
+
+    def __init__(self, target, **kwargs):
+        """Keep the target of the sessions."""
+        assert target in NEW_INSTANCE_TARGETS, (
+            'The images of {} can not be uploaded before its instance is '
+            'created.'.format(target))
+        self.target = target
+        kwargs.setdefault('pk_field', serializers.UUIDField())
+        super().__init__(**kwargs)
+
+    def get_queryset(self):
+        """Return the sessions of the user ready to attach."""
+        return UploadSession.objects.filter(
+            user=self.context['request'].user.pk, target=self.target,
+            confirmed__isnull=False, object_id=None)
@@ -0,0 +1,60 @@
+"""General app signals."""
+
+# Django
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+# Local models
+from uywasi_backend.general.models import Breed, StandardModel
+# Utils
+from uywasi_backend.utils.cache import (
+    bump_cache_version, get_object_cache_namespaces, reset_cache_versions)
+from uywasi_backend.utils.images import IMAGE_VARIANT_FIELDS
+
+
+@receiver(post_save, sender=Breed)
+@receiver(post_delete, sender=Breed)
+def invalidate_breeds_cache(sender, instance, **kwargs):
+    """Invalidate the cached responses of the breeds once committed."""
+    transaction.on_commit(lambda: bump_cache_version('breeds'))
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_cached_objects(sender, instance, **kwargs):
+    """
+    invalidate_cached_objects.
+
+    Invalidate the cached data of a saved or deleted standard instance
+    once its transaction is committed, so the data read before the commit
+    is not cached under the new version.
+    """
+    if not issubclass(sender, StandardModel):
+        return
+    namespaces = get_object_cache_namespaces(instance)
+    transaction.on_commit(lambda: reset_cache_versions(*namespaces))
+
+
+def dispatch_image_variants(sender, instance, update_fields=None, **kwargs):
+    """
+    dispatch_image_variants.
+
+    Generate in a worker the variants of the images of an instance once
+    the transaction that saves it is committed. The task skips the
+    variants that are already stored, so unchanged images cost nothing.
+    """
+    from uywasi_backend.general.tasks import generate_image_variants
+
+    model = sender._meta.label
+    field_names = [
+        name for name in IMAGE_VARIANT_FIELDS[model]
+        if getattr(instance, name) and
+        (update_fields is None or name in update_fields)
+    ]
+    if field_names:
+        transaction.on_commit(lambda: generate_image_variants.delay(
+            model, instance.pk, field_names))
+
+
+# The apps connect dispatch_image_variants to their models with images.
+post_save.connect(dispatch_image_variants, sender=Breed)
@@ -1,3 +1,7 @@
 """General app tasks."""
 
 from .accounts import *
+from .posts import *
+from .images import *
+from .circles import *
+from .uploads import *
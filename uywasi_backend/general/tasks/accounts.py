@@ -2,22 +2,27 @@
 
 # Django
 from django.core.mail import EmailMultiAlternatives
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.conf import settings
 from django.template.loader import render_to_string
+# Celery
+from config import celery_app
 # Local
-from uywasi_backend.accounts.models import User
+from uywasi_backend.accounts.models import Following, User, UserAccount
 # Utils
 from datetime import timedelta
+from smtplib import SMTPException
 import jwt
 
 
-def send_verification_email(user_pk):
+def build_verification_email(user):
     """
-    send_verification_email.
+    build_verification_email.
 
-    This task sends an email when a user is created for confirm that
-    this user is owner of the email account registered.
+    Return the email that asks a new user to confirm that he is owner of
+    the email account registered.
     """
 
     def generate_verificatio_token(user):
@@ -38,7 +43,6 @@ def send_verification_email(user_pk):
                            algorithm=settings.ALGORITHM_TOKEN)
         return token.decode()
 
-    user = User.objects.get(pk=user_pk)
     token = generate_verificatio_token(user)
     subject = 'Uywasi | Account verification'
     from_email = 'Uywasi <noreply@uywasi.com>'
@@ -56,4 +60,54 @@ def send_verification_email(user_pk):
         to=[user.email]
     )
     mail.attach_alternative(body, 'text/html')
-    mail.send()
+    return mail
+
+
+@celery_app.task(autoretry_for=(SMTPException, OSError), retry_backoff=True,
+                 retry_backoff_max=10 * 60, retry_kwargs={'max_retries': 5})
+def send_verification_email(user_pk):
+    """
+    send_verification_email.
+
+    This task sends an email when a user is created for confirm that
+    this user is owner of the email account registered. It must be
+    dispatched once the transaction that creates the user is committed.
+    If the delivery fails, the task is retried with exponential backoff.
+    Returns the number of sent emails.
+    """
+    user = User.objects.filter(pk=user_pk).first()
+    if user is None:
+        return 0
+    return build_verification_email(user).send()
+
+
+@celery_app.task()
+def reconcile_following_counters():
+    """
+    reconcile_following_counters.
+
+    This periodic task recomputes the followers and follows counters of
+    the user accounts from the followings, and fixes the accounts whose
+    stored counters drifted. Returns the number of fixed accounts.
+    """
+
+    def count_followings(field):
+        """Return a subquery that counts the followings of an account."""
+        followings = Following.objects.filter(**{field: OuterRef('pk')}) \
+            .order_by().values(field).annotate(total=Count('pk')) \
+            .values('total')
+        return Coalesce(Subquery(followings, output_field=IntegerField()), 0)
+
+    accounts = UserAccount.objects.annotate(
+        real_followers_count=count_followings('user_account_to'),
+        real_follows_count=count_followings('user_account_from')
+    ).exclude(
+        Q(followers_count=F('real_followers_count')) &
+        Q(follows_count=F('real_follows_count'))
+    ).values_list('pk', 'real_followers_count', 'real_follows_count')
+
+    fixed = 0
+    for pk, followers_count, follows_count in accounts.iterator():
+        fixed += UserAccount.objects.filter(pk=pk).update(
+            followers_count=followers_count, follows_count=follows_count)
+    return fixed
@@ -0,0 +1,36 @@
+"""General app Circles tasks."""
+
+# Django
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+# Celery
+from config import celery_app
+
+
+@celery_app.task()
+def reconcile_subscriptions_counters():
+    """
+    reconcile_subscriptions_counters.
+
+    This periodic task recomputes the subscriptions counter of the
+    circles from the subscriptions, and fixes the circles whose stored
+    counter drifted. Returns the number of fixed circles.
+    """
+    # The circles app may not be installed when this package is imported.
+    from uywasi_backend.circles.models import Circle, Subscription
+
+    subscriptions = Subscription.objects.filter(circle=OuterRef('pk')) \
+        .order_by().values('circle').annotate(total=Count('pk')) \
+        .values('total')
+    circles = Circle.objects.annotate(
+        real_subscriptions_count=Coalesce(
+            Subquery(subscriptions, output_field=IntegerField()), 0)
+    ).exclude(
+        subscriptions_count=F('real_subscriptions_count')
+    ).values_list('pk', 'real_subscriptions_count')
+
+    fixed = 0
+    for pk, subscriptions_count in circles.iterator():
+        fixed += Circle.objects.filter(pk=pk).update(
+            subscriptions_count=subscriptions_count)
+    return fixed
@@ -0,0 +1,55 @@
+"""General app Images tasks."""
+
+# Django
+from django.apps import apps
+# Celery
+from config import celery_app
+# Utils
+from uywasi_backend.utils.files import delete_files
+from uywasi_backend.utils.images import generate_variants
+
+
+@celery_app.task(autoretry_for=(OSError,), retry_backoff=True,
+                 retry_kwargs={'max_retries': 3})
+def generate_image_variants(model, pk, field_names):
+    """
+    generate_image_variants.
+
+    This task stores the resized WebP variants of the images of an
+    instance, alongside the originals. The model is given as
+    'app_label.ModelName'. Returns the names of the stored variants.
+    """
+    instance = apps.get_model(model).objects.filter(pk=pk).first()
+    if instance is None:
+        return []
+    stored = []
+    for field_name in field_names:
+        field_file = getattr(instance, field_name)
+        if field_file:
+            stored += generate_variants(field_file)
+    return stored
+
+
+@celery_app.task()
+def delete_orphan_files(model, files):
+    """
+    delete_orphan_files.
+
+    This task deletes the files stored for some instances while they were
+    saved, given as (pk, names by field) pairs, if the instances do not
+    reference them, because the transaction that saved them was rolled
+    back. It is delayed beyond the duration of the requests. Returns the
+    number of deleted files.
+    """
+    model = apps.get_model(model)
+    instances = model.objects.in_bulk([pk for pk, _ in files])
+    deleted = 0
+    for pk, names in files:
+        instance = instances.get(pk)
+        orphans = {
+            field_name: name for field_name, name in names.items()
+            if instance is None or getattr(instance, field_name).name != name
+        }
+        delete_files(model, orphans)
+        deleted += len(orphans)
+    return deleted
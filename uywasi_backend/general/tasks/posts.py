@@ -0,0 +1,75 @@
+"""General app Posts tasks."""
+
+# Celery
+from config import celery_app
+
+# The posts modules are imported by the tasks, because the posts app may
+# not be installed when this package is imported.
+
+
+@celery_app.task()
+def find_post_matches(post_pk):
+    """
+    find_post_matches.
+
+    This task scores the open posts that may be the same pet of a lost
+    or finded post, and stores the best ones as matches of both posts.
+    Returns the number of matches found.
+    """
+    from uywasi_backend.posts.matching import find_matches
+    from uywasi_backend.posts.models import Post
+
+    post = Post.objects.select_related('breed').filter(pk=post_pk).first()
+    if post is None:
+        return 0
+    return find_matches(post)
+
+
+@celery_app.task()
+def fan_out_post_to_feeds(post_pk):
+    """
+    fan_out_post_to_feeds.
+
+    This task adds a new post to the feeds of the followers of its owner
+    and the subscribers of its circle. Returns the number of feeds.
+    """
+    from uywasi_backend.posts.feed import fan_out_post
+    from uywasi_backend.posts.models import Post
+
+    post = Post.objects.filter(pk=post_pk).first()
+    if post is None:
+        return 0
+    return fan_out_post(post)
+
+
+@celery_app.task()
+def publish_post_created(post_pk):
+    """
+    publish_post_created.
+
+    This task publishes a new post to the websocket clients subscribed to
+    its circle or its area. Returns the number of web processes that
+    received it.
+    """
+    from uywasi_backend.posts.events import publish_post
+    from uywasi_backend.posts.models import Post
+
+    post = Post.objects.select_related(
+        'circle', 'user__useraccount').filter(pk=post_pk).first()
+    if post is None:
+        return 0
+    return publish_post(post)
+
+
+@celery_app.task()
+def refresh_feed_popular_circles():
+    """
+    refresh_feed_popular_circles.
+
+    This periodic task recomputes the circles whose posts are read on
+    request instead of written to the feeds of their subscribers.
+    Returns the number of popular circles.
+    """
+    from uywasi_backend.posts.feed import refresh_popular_circles
+
+    return len(refresh_popular_circles())
@@ -0,0 +1,36 @@
+"""General app Uploads tasks."""
+
+# Django
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.utils import timezone
+# Celery
+from config import celery_app
+# Local
+from uywasi_backend.general.models import UploadSession
+# Utils
+from datetime import timedelta
+
+
+@celery_app.task()
+def clean_upload_sessions():
+    """
+    clean_upload_sessions.
+
+    This periodic task deletes the upload sessions expired for more than
+    UPLOADS_ATTACH_TIMEOUT seconds, and the images of those that were not
+    attached, which were abandoned by their clients. Returns the number of
+    deleted images.
+    """
+    limit = timezone.now() - timedelta(seconds=settings.UPLOADS_ATTACH_TIMEOUT)
+    sessions = UploadSession.objects.filter(expires__lt=limit)
+    abandoned = sessions.filter(Q(confirmed=None) | Q(object_id=None))
+
+    deleted = 0
+    for key in abandoned.values_list('key', flat=True).iterator():
+        if default_storage.exists(key):
+            default_storage.delete(key)
+            deleted += 1
+    sessions.delete()
+    return deleted
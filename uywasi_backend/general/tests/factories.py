@@ -0,0 +1,25 @@
+"""General app factories."""
+
+# Factory boy
+import factory
+from factory.django import DjangoModelFactory
+# Local models
+from uywasi_backend.general.models import Breed
+
+
+class BreedFactory(DjangoModelFactory):
+    """
+    BreedFactory.
+
+    Build a breed of a dog, a cat or other animal, with an unique name.
+    """
+
+    animal = factory.Iterator(('dog', 'cat', 'other'))
+    name = factory.Sequence(lambda n: 'Breed {}'.format(n))
+    description = factory.Faker('paragraph')
+
+    class Meta:
+        """Meta options."""
+
+        model = Breed
+        django_get_or_create = ('animal', 'name')
@@ -0,0 +1,55 @@
+"""Keyset pagination tests, over the breeds."""
+
+# Django Rest Framework
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+# Local models
+from uywasi_backend.general.models import Breed
+# Local factories
+from uywasi_backend.general.tests.factories import BreedFactory
+# Utils
+from uywasi_backend.utils.pagination import KeysetPagination
+from base64 import b64encode
+from urllib.parse import parse_qs, urlparse
+import json
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def paginate(**params):
+    """Return the paginator and the page of the breeds for the params."""
+    request = Request(APIRequestFactory().get('/api/breeds/', params))
+    paginator = KeysetPagination()
+    page = paginator.paginate_queryset(Breed.objects.all(), request)
+    return paginator, page
+
+
+def encode(cursor):
+    """Return a cursor encoded as the paginator does."""
+    return b64encode(json.dumps(cursor).encode()).decode('ascii')
+
+
+def test_pages_follow_the_cursors():
+    """The next cursor starts after the last breed of the page."""
+    BreedFactory.create_batch(3)
+    paginator, first = paginate(limit=2)
+    cursor = parse_qs(urlparse(paginator.get_next_link()).query)['cursor'][0]
+    _paginator, second = paginate(limit=2, cursor=cursor)
+    assert len(first) == 2 and len(second) == 1
+    assert not set(first) & set(second)
+
+
+@pytest.mark.parametrize('cursor', (
+    {'p': ['notadate', 1], 'r': 0},
+    {'p': ['2020-13-45T00:00:00', 1], 'r': 0},
+    {'p': [None, 1], 'r': 0},
+    {'p': ['2020-01-01T00:00:00+00:00', '1'], 'r': 0},
+    {'p': ['2020-01-01T00:00:00+00:00', True], 'r': 0},
+    {'p': ['2020-01-01T00:00:00+00:00'], 'r': 0},
+))
+def test_invalid_cursors_are_not_found(cursor):
+    """A tampered cursor is answered as not found, without a query."""
+    with pytest.raises(NotFound):
+        paginate(cursor=encode(cursor))
@@ -0,0 +1,42 @@
+"""General app signals tests."""
+
+# Django
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_save
+# Local models
+from uywasi_backend.general.models import Breed
+# Local signals
+from uywasi_backend.general.signals import dispatch_image_variants
+# Local factories
+from uywasi_backend.general.tests.factories import BreedFactory
+# Utils
+from uywasi_backend.utils.cache import get_cache_version
+from uywasi_backend.utils.images import IMAGE_VARIANT_FIELDS
+import pytest
+
+
+def test_image_variants_are_connected_to_installed_models():
+    """Each installed model with images dispatches its variants."""
+    for label in IMAGE_VARIANT_FIELDS:
+        app_label, model_name = label.split('.')
+        if not apps.is_installed('uywasi_backend.{}'.format(app_label)):
+            continue
+        model = apps.get_model(label)
+        receivers = post_save._live_receivers(model)
+        assert dispatch_image_variants in receivers, label
+
+
+def test_breeds_dispatch_image_variants():
+    """The breeds are connected by the general app itself."""
+    assert dispatch_image_variants in post_save._live_receivers(Breed)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_breeds_cache_is_invalidated_after_commit():
+    """The version of the breeds changes once the breed is committed."""
+    version = get_cache_version('breeds')
+    with transaction.atomic():
+        BreedFactory()
+        assert get_cache_version('breeds') == version
+    assert get_cache_version('breeds') != version
@@ -0,0 +1,36 @@
+"""General app tasks tests."""
+
+# Django
+from django.core import mail
+# Local models
+from uywasi_backend.accounts.models import UserAccount
+# Local factories
+from uywasi_backend.accounts.tests.factories import FollowingFactory
+# Local tasks
+from uywasi_backend.general.tasks import (
+    reconcile_following_counters, send_verification_email)
+# Utils
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def test_reconcile_following_counters_fixes_drifted_counters():
+    """The counters of the accounts are recomputed from the followings."""
+    following = FollowingFactory()
+    UserAccount.objects.update(followers_count=7, follows_count=7)
+
+    assert reconcile_following_counters() == 2
+    account_from = UserAccount.objects.get(pk=following.user_account_from_id)
+    account_to = UserAccount.objects.get(pk=following.user_account_to_id)
+    assert (account_from.followers_count, account_from.follows_count) == (0, 1)
+    assert (account_to.followers_count, account_to.follows_count) == (1, 0)
+    assert reconcile_following_counters() == 0
+
+
+def test_send_verification_email(user):
+    """The verification email is sent to the email of the user."""
+    assert send_verification_email(user.pk) == 1
+    [message] = mail.outbox
+    assert message.to == [user.email]
+    assert send_verification_email(0) == 0
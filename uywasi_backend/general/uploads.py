@@ -0,0 +1,188 @@
+"""
+Direct uploads of the images to the object storage.
+
+The clients create an upload session, send the image to the storage with
+the presigned POST of the session, and confirm it. The API only validates
+the stored image and sets its name to the field of the target, so the
+images do not pass through the workers.
+"""
+
+# Django
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from django.utils.translation import ugettext as _
+# Django Rest Framework
+from rest_framework.exceptions import PermissionDenied, ValidationError
+# Local cache
+from uywasi_backend.circles.cache import get_memberships
+# Utils
+from botocore.exceptions import ClientError
+from PIL import Image
+from urllib.parse import urlsplit, urlunsplit
+import mimetypes
+import posixpath
+import uuid
+
+# Model and image field of each target.
+UPLOAD_TARGETS = {
+    'post.photo_first': ('posts.Post', 'photo_first'),
+    'post.photo_second': ('posts.Post', 'photo_second'),
+    'post.photo_third': ('posts.Post', 'photo_third'),
+    'account.profile_photo': ('accounts.UserAccount', 'profile_photo'),
+    'circle.profile_photo': ('circles.Circle', 'profile_photo'),
+    'circle.cover_photo': ('circles.Circle', 'cover_photo'),
+}
+
+# Targets whose images can be uploaded before the instance is created.
+NEW_INSTANCE_TARGETS = ('post.photo_first', 'post.photo_second',
+                        'post.photo_third')
+
+
+def get_client():
+    """
+    get_client.
+
+    Return the S3 client of the default storage, or None if the storage
+    is not an object storage, in which case the direct uploads are not
+    available.
+    """
+    connection = getattr(default_storage, 'connection', None)
+    if connection is None:
+        return None
+    return connection.meta.client
+
+
+def get_object_key(name):
+    """Return the key in the bucket of a name of the default storage."""
+    location = getattr(default_storage, 'location', '')
+    return posixpath.join(location, name) if location else name
+
+
+def get_upload_name(target, content_type):
+    """Return a new random name for an image of a target."""
+    model, field_name = UPLOAD_TARGETS[target]
+    field = apps.get_model(model)._meta.get_field(field_name)
+    extension = mimetypes.guess_extension(content_type) or '.jpg'
+    if extension == '.jpe':
+        extension = '.jpg'
+    return posixpath.join(field.upload_to, uuid.uuid4().hex + extension)
+
+
+def get_target_instance(user, target, object_id):
+    """
+    get_target_instance.
+
+    Return the instance of a target which the user can change the image,
+    or raise PermissionDenied. The posts are changed by their owner, the
+    accounts by their user and the circles by their admins.
+    """
+    model, _field_name = UPLOAD_TARGETS[target]
+    instance = apps.get_model(model).objects.filter(pk=object_id).first()
+    if instance is None:
+        raise ValidationError(
+            {'object_id': _('The instance of the target does not exist.')})
+    if model == 'circles.Circle':
+        allowed = get_memberships(user).get(instance.pk) is True
+    else:
+        allowed = instance.user_id == user.pk
+    if not allowed:
+        raise PermissionDenied(
+            _('You can not change the images of this instance.'))
+    return instance
+
+
+def presign_upload(session):
+    """
+    presign_upload.
+
+    Return the url and the form fields of the presigned POST of a session.
+    The policy restricts the key, the content type and the size of the
+    image, and expires with the session. The url is rewritten to
+    UPLOADS_PUBLIC_ENDPOINT_URL when the storage is reached by the API
+    through another host, the signature of a POST does not cover it.
+    """
+    client = get_client()
+    presigned = client.generate_presigned_post(
+        Bucket=default_storage.bucket_name,
+        Key=get_object_key(session.key),
+        Fields={'Content-Type': session.content_type},
+        Conditions=[
+            {'Content-Type': session.content_type},
+            ['content-length-range', 1, session.size],
+        ],
+        ExpiresIn=int((session.expires - timezone.now()).total_seconds())
+    )
+    url = presigned['url']
+    if settings.UPLOADS_PUBLIC_ENDPOINT_URL:
+        public = urlsplit(settings.UPLOADS_PUBLIC_ENDPOINT_URL)
+        url = urlunsplit(urlsplit(url)._replace(
+            scheme=public.scheme, netloc=public.netloc))
+    return {'url': url, 'fields': presigned['fields']}
+
+
+def verify_upload(session):
+    """
+    verify_upload.
+
+    Check that the image of a session is stored, with the declared content
+    type and size, and that it is a valid image. The invalid images are
+    deleted from the storage.
+    """
+    client = get_client()
+    try:
+        stored = client.head_object(
+            Bucket=default_storage.bucket_name,
+            Key=get_object_key(session.key))
+    except ClientError:
+        raise ValidationError(_('The image has not been uploaded yet.'))
+
+    try:
+        if stored['ContentLength'] > session.size or \
+                stored['ContentType'] != session.content_type:
+            raise ValidationError(
+                _('The uploaded image does not match the session.'))
+        with default_storage.open(session.key, 'rb') as image:
+            try:
+                Image.open(image).verify()
+            except Exception:
+                raise ValidationError(
+                    _('The uploaded file is not a valid image.'))
+    except ValidationError:
+        default_storage.delete(session.key)
+        raise
+
+
+def attach_upload(session, instance):
+    """Set the image of a session to the field of its target instance."""
+    _model, field_name = UPLOAD_TARGETS[session.target]
+    setattr(instance, field_name, session.key)
+    instance.save(update_fields=(field_name, 'modified'))
+    session.object_id = instance.pk
+    session.save(update_fields=('object_id', 'modified'))
+
+
+def confirm_upload(session, user):
+    """
+    confirm_upload.
+
+    Validate the image of a session of the user and attach it to its
+    target, if he can still change it. The sessions without instance are
+    only confirmed, and their image is attached when the instance is
+    created with it.
+    """
+    if session.confirmed is not None:
+        raise ValidationError(_('The upload is already confirmed.'))
+    if session.expires < timezone.now():
+        raise ValidationError(_('The upload session has expired.'))
+    instance = None
+    if session.object_id is not None:
+        instance = get_target_instance(
+            user, session.target, session.object_id)
+    verify_upload(session)
+    session.confirmed = timezone.now()
+    session.save(update_fields=('confirmed', 'modified'))
+    if instance is not None:
+        attach_upload(session, instance)
+    return session
@@ -5,7 +5,7 @@ from django.urls import include, path
 # Django Rest Framework
 from rest_framework.routers import DefaultRouter
 # Local views
-from uywasi_backend.general.views import BreedViewSet
+from uywasi_backend.general.views import BreedViewSet, UploadSessionViewSet
 
 router = DefaultRouter()
 
@@ -15,6 +15,12 @@ router.register(
     basename='breeds'
 )
 
+router.register(
+    prefix=r'general/uploads',
+    viewset=UploadSessionViewSet,
+    basename='uploads'
+)
+
 app_name = 'general'
 
 urlpatterns = [
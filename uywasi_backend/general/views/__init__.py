@@ -1,3 +1,4 @@
 """General app views."""
 
 from .breeds import *
+from .uploads import *
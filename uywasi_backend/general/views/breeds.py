@@ -1,25 +1,42 @@
 """General app Breeds views."""
 
 # Django
-from django.shortcuts import render
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Max
+from django.utils.cache import (
+    get_conditional_response, patch_cache_control, quote_etag)
+from django.utils.http import http_date
 from django_filters.rest_framework import DjangoFilterBackend
 # Django Rest Framework
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 from rest_framework import viewsets, status, mixins
 # Local models
 from uywasi_backend.general.models import Breed
 # Local serializers
 from uywasi_backend.general.serializers import BreedModelSerializer
+# Utils
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
+from uywasi_backend.utils.cache import get_cache_version
+from hashlib import md5
+import json
 
 
-class BreedViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class BreedViewSet(SafeMethodsNonAtomicMixin,
+                   mixins.ListModelMixin, mixins.RetrieveModelMixin,
                    viewsets.GenericViewSet):
     """
     BreedViewSet.
 
     Allow list and retrieve the breeds registered into database. Includes
     filtering, ordering and search options.
+
+    The responses are cached until a breed is saved or deleted, and carry
+    the ETag and Last-Modified headers, so the clients can revalidate the
+    catalogue with conditional requests and receive a 304 response.
     """
 
     # Filtering, ordering and search options.
@@ -43,3 +60,54 @@ class BreedViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
         """Return all Breed instances as queryset."""
         if self.action in ('list', 'retrieve'):
             return Breed.objects.all()
+
+    def list(self, request, *args, **kwargs):
+        """List the breeds from cache."""
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve a breed from cache."""
+        return self.get_cached_response(
+            super().retrieve, request, *args, **kwargs)
+
+    def get_cached_response(self, action, request, *args, **kwargs):
+        """
+        get_cached_response.
+
+        Return the cached data of the request, or compute it with the action
+        and cache it. If the conditional headers of the request match the
+        ETag or Last-Modified of the data, return a 304 response instead.
+        """
+        version = get_cache_version('breeds')
+        url = request.build_absolute_uri().encode()
+        key = 'breeds:{}:{}'.format(version, md5(url).hexdigest())
+        cached = cache.get(key)
+        if cached is None:
+            response = action(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            content = json.dumps(response.data, cls=DjangoJSONEncoder,
+                                 sort_keys=True).encode()
+            last_modified = Breed.objects.aggregate(
+                last_modified=Max('modified'))['last_modified']
+            # The version changes on deletions, which do not move the
+            # modified date of the remaining breeds.
+            last_modified = max(
+                last_modified.timestamp() if last_modified else 0,
+                float(version))
+            cached = {
+                'data': response.data,
+                'etag': quote_etag(md5(content).hexdigest()),
+                'last_modified': int(last_modified)
+            }
+            cache.set(key, cached, timeout=settings.BREEDS_CACHE_TIMEOUT)
+
+        response = get_conditional_response(
+            request, etag=cached['etag'],
+            last_modified=cached['last_modified'])
+        if response is None:
+            response = Response(data=cached['data'], status=status.HTTP_200_OK)
+        response['ETag'] = cached['etag']
+        response['Last-Modified'] = http_date(cached['last_modified'])
+        patch_cache_control(response, no_cache=True)
+        return response
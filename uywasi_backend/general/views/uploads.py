@@ -0,0 +1,43 @@
+"""General app Uploads views."""
+
+# Django Rest Framework
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import mixins, status, viewsets
+# Local models
+from uywasi_backend.general.models import UploadSession
+# Local serializers
+from uywasi_backend.general.serializers import UploadSessionModelSerializer
+# Local uploads
+from uywasi_backend.general.uploads import confirm_upload
+# Utils
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
+
+
+class UploadSessionViewSet(SafeMethodsNonAtomicMixin,
+                           mixins.CreateModelMixin, mixins.RetrieveModelMixin,
+                           viewsets.GenericViewSet):
+    """
+    UploadSessionViewSet.
+
+    Allow create an upload session, which returns the presigned POST to
+    upload an image directly to the storage, retrieve it and confirm it
+    once the image is uploaded. The confirmation validates the image and
+    sets it to the field of the target.
+    """
+
+    serializer_class = UploadSessionModelSerializer
+    permission_classes = (IsAuthenticated,)
+    pagination_class = None
+
+    def get_queryset(self):
+        """Return the upload sessions of the user."""
+        return UploadSession.objects.filter(user=self.request.user)
+
+    @action(detail=True, methods=['post'])
+    def confirm(self, request, pk=None):
+        """Validate the uploaded image and attach it to its target."""
+        session = confirm_upload(self.get_object(), request.user)
+        serializer = self.get_serializer(session)
+        return Response(serializer.data, status=status.HTTP_200_OK)
@@ -12,3 +12,7 @@ class PostsConfig(AppConfig):
     """
 
     name = 'uywasi_backend.posts'
+
+    def ready(self):
+        """Register the signals of the app."""
+        import uywasi_backend.posts.signals  # noqa F401
@@ -0,0 +1,50 @@
+"""Posts app real-time events."""
+
+# Django
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+# Local serializers
+from uywasi_backend.posts.serializers import CirclePostSerializer
+# Utils
+import json
+import redis
+
+_client = None
+
+
+def get_events_redis():
+    """
+    get_events_redis.
+
+    Return the redis client of the events, or None if POSTS_EVENTS_REDIS_URL
+    is not set, in which case the events are not published.
+    """
+    global _client
+    if _client is None and settings.POSTS_EVENTS_REDIS_URL:
+        _client = redis.Redis.from_url(settings.POSTS_EVENTS_REDIS_URL)
+    return _client
+
+
+def get_post_event(post):
+    """
+    get_post_event.
+
+    Return the event of a new post: the post serialized as in the list of
+    the posts of a circle, and the slugname of its circle and its location,
+    which are used to select the websocket clients that receive it.
+    """
+    return {
+        'circle': post.circle.slugname if post.circle_id else None,
+        'latitude': post.latitude,
+        'longitude': post.longitude,
+        'post': CirclePostSerializer(post).data,
+    }
+
+
+def publish_post(post):
+    """Publish the event of a new post, return the number of receivers."""
+    client = get_events_redis()
+    if client is None:
+        return 0
+    message = json.dumps(get_post_event(post), cls=DjangoJSONEncoder)
+    return client.publish(settings.POSTS_EVENTS_CHANNEL, message)
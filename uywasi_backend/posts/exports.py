@@ -0,0 +1,100 @@
+"""Posts app streaming exports."""
+
+# Django
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+# Utils
+import csv
+import json
+
+# Exported columns and the field of the post that fills each one.
+EXPORT_FIELDS = (
+    ('id', 'id'),
+    ('name', 'name'),
+    ('information', 'information'),
+    ('tag', 'tag'),
+    ('state', 'state'),
+    ('animal', 'breed__animal'),
+    ('breed', 'breed__name'),
+    ('color_primary', 'color_primary'),
+    ('color_secondary', 'color_secondary'),
+    ('size', 'size'),
+    ('latitude', 'latitude'),
+    ('longitude', 'longitude'),
+    ('photo_first', 'photo_first'),
+    ('user', 'user__username'),
+    ('circle', 'circle__slugname'),
+    ('created', 'created'),
+)
+
+PHOTO_COLUMNS = ('photo_first',)
+
+EXPORT_TYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class Echo:
+    """Pseudo buffer that returns the written value instead of keep it."""
+
+    def write(self, value):
+        """Return the value."""
+        return value
+
+
+def iter_rows(queryset):
+    """
+    iter_rows.
+
+    Yield the exported columns of the posts as dicts. The posts are read
+    through a server-side cursor in chunks of POSTS_EXPORT_CHUNK_SIZE,
+    so the memory is constant whatever the number of posts. The query is
+    run on the first iteration, when the response is streamed after the
+    transaction of the request, so the cursor is held in autocommit.
+    """
+    columns = [column for column, _ in EXPORT_FIELDS]
+    rows = queryset.order_by('-created', '-id').values_list(
+        *(field for _, field in EXPORT_FIELDS)
+    ).iterator(chunk_size=settings.POSTS_EXPORT_CHUNK_SIZE)
+    for row in rows:
+        row = dict(zip(columns, row))
+        for column in PHOTO_COLUMNS:
+            if row[column]:
+                row[column] = default_storage.url(row[column])
+        yield row
+
+
+def stream_csv(queryset):
+    """Yield the lines of the CSV export of the posts."""
+    columns = [column for column, _ in EXPORT_FIELDS]
+    writer = csv.DictWriter(Echo(), fieldnames=columns)
+    yield writer.writeheader()
+    for row in iter_rows(queryset):
+        yield writer.writerow(row)
+
+
+def stream_ndjson(queryset):
+    """Yield the lines of the newline delimited JSON export of the posts."""
+    for row in iter_rows(queryset):
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def export_posts(queryset, export_type, filename):
+    """
+    export_posts.
+
+    Return a streaming response with the posts of the queryset as CSV or
+    newline delimited JSON, attached as filename with the extension of
+    the type. The database of the queryset is chosen here, while the
+    request is routed, so the export is read from a replica.
+    """
+    queryset = queryset.using(queryset.db)
+    stream = stream_csv if export_type == 'csv' else stream_ndjson
+    response = StreamingHttpResponse(
+        stream(queryset), content_type=EXPORT_TYPES[export_type])
+    response['Content-Disposition'] = 'attachment; filename="{}.{}"'.format(
+        filename, export_type)
+    return response
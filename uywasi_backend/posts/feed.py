@@ -0,0 +1,178 @@
+"""Posts app home feed."""
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+# Local models
+from uywasi_backend.accounts.models import Following
+from uywasi_backend.circles.models import Circle, Subscription
+from uywasi_backend.posts.models import Post
+
+POPULAR_CIRCLES_CACHE_KEY = 'feed:popular-circles'
+
+# Member stored in the empty inboxes, so they are not rebuilt on each read.
+EMPTY_INBOX_MEMBER = 0
+
+# Add a post to the inboxes that exist and trim them to the max size. The
+# expired inboxes are skipped, they are rebuilt from database when read.
+FAN_OUT_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('ZADD', key, ARGV[1], ARGV[2])
+        redis.call('ZREMRANGEBYRANK', key, 0, -tonumber(ARGV[3]) - 2)
+    end
+end
+return #KEYS
+"""
+
+
+def get_redis():
+    """
+    get_redis.
+
+    Return the redis client of the default cache, or None if the cache is
+    not backed by redis, in which case the feed is queried from database.
+    """
+    if not settings.CACHES['default']['BACKEND'].startswith('django_redis'):
+        return None
+    from django_redis import get_redis_connection
+    return get_redis_connection('default')
+
+
+def get_inbox_key(user_pk):
+    """Return the key of the sorted set of post ids of a user feed."""
+    return 'feed:inbox:{}'.format(user_pk)
+
+
+def get_popular_circles():
+    """
+    get_popular_circles.
+
+    Return the set of ids of the circles with so many subscriptions that
+    their posts are not written to the inboxes of the subscribers, but
+    read from database when the feed is requested.
+    """
+    circles = cache.get(POPULAR_CIRCLES_CACHE_KEY)
+    if circles is None:
+        circles = refresh_popular_circles()
+    return circles
+
+
+def refresh_popular_circles():
+    """Compute and cache the ids of the popular circles."""
+    circles = set(Circle.objects.filter(
+        subscriptions_count__gte=settings.FEED_POPULAR_CIRCLE_SUBSCRIPTIONS
+    ).values_list('pk', flat=True))
+    cache.set(POPULAR_CIRCLES_CACHE_KEY, circles,
+              timeout=settings.FEED_POPULAR_CIRCLES_TIMEOUT)
+    return circles
+
+
+def get_sources_filter(user, popular_circles=None):
+    """
+    get_sources_filter.
+
+    Return the condition that selects the posts of the feed of a user: his
+    own posts, the posts of the accounts that he follows and the posts of
+    the circles that he is subscribed to. If popular_circles is given,
+    those circles are excluded.
+    """
+    followed_users = Following.objects.filter(
+        user_account_from__user=user).values('user_account_to__user')
+    circles = Subscription.objects.filter(user=user)
+    if popular_circles is not None:
+        circles = circles.exclude(circle__in=popular_circles)
+    return (Q(user=user) | Q(user__in=followed_users) |
+            Q(circle__in=circles.values('circle')))
+
+
+def build_inbox(redis, user):
+    """
+    build_inbox.
+
+    Store the inbox of a user with the latest posts of the accounts that
+    he follows and the circles that he is subscribed to, except the
+    popular ones. Return the post ids of the inbox.
+    """
+    posts = Post.objects.filter(
+        get_sources_filter(user, get_popular_circles())
+    ).order_by('-created').values_list('pk', 'created')
+    mapping = {
+        pk: created.timestamp()
+        for pk, created in posts[:settings.FEED_INBOX_SIZE]
+    }
+    mapping[EMPTY_INBOX_MEMBER] = 0
+    key = get_inbox_key(user.pk)
+    pipeline = redis.pipeline()
+    pipeline.delete(key)
+    pipeline.zadd(key, mapping)
+    pipeline.expire(key, settings.FEED_INBOX_TIMEOUT)
+    pipeline.execute()
+    return [pk for pk in mapping if pk != EMPTY_INBOX_MEMBER]
+
+
+def get_inbox(redis, user):
+    """Return the post ids of the inbox of a user, building it if expired."""
+    key = get_inbox_key(user.pk)
+    pipeline = redis.pipeline()
+    pipeline.zrevrange(key, 0, -1)
+    pipeline.expire(key, settings.FEED_INBOX_TIMEOUT)
+    members, exists = pipeline.execute()
+    if not exists:
+        return build_inbox(redis, user)
+    return [int(pk) for pk in members if int(pk) != EMPTY_INBOX_MEMBER]
+
+
+def get_feed_queryset(user):
+    """
+    get_feed_queryset.
+
+    Return the posts of the feed of a user. With redis, the posts of the
+    normal accounts and circles are read from the inbox populated on write,
+    and only the posts of the popular circles are queried on read.
+    """
+    redis = get_redis()
+    if redis is None:
+        return Post.objects.filter(get_sources_filter(user))
+    popular_circles = Subscription.objects.filter(
+        user=user, circle__in=get_popular_circles()).values('circle')
+    return Post.objects.filter(
+        Q(pk__in=get_inbox(redis, user)) | Q(circle__in=popular_circles))
+
+
+def fan_out_post(post):
+    """
+    fan_out_post.
+
+    Add a post to the inboxes of its owner, the followers of the owner and
+    the subscribers of its circle, unless the circle is popular. Return
+    the number of inboxes written.
+    """
+    redis = get_redis()
+    if redis is None:
+        return 0
+    user_pks = {post.user_id}
+    user_pks.update(Following.objects.filter(
+        user_account_to__user=post.user_id
+    ).values_list('user_account_from__user', flat=True).iterator())
+    if post.circle_id and post.circle_id not in get_popular_circles():
+        user_pks.update(Subscription.objects.filter(
+            circle=post.circle_id
+        ).values_list('user', flat=True).iterator())
+
+    script = redis.register_script(FAN_OUT_SCRIPT)
+    keys = [get_inbox_key(user_pk) for user_pk in user_pks]
+    batch = settings.FEED_FAN_OUT_BATCH
+    for start in range(0, len(keys), batch):
+        script(keys=keys[start:start + batch],
+               args=[post.created.timestamp(), post.pk,
+                     settings.FEED_INBOX_SIZE])
+    return len(keys)
+
+
+def invalidate_inbox(*user_pks):
+    """Remove the inboxes of the users, they are rebuilt when read."""
+    redis = get_redis()
+    if redis is not None and user_pks:
+        redis.delete(*[get_inbox_key(user_pk) for user_pk in user_pks])
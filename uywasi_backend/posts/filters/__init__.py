@@ -0,0 +1,3 @@
+"""Posts app filters."""
+
+from .posts import *
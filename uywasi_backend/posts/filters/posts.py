@@ -0,0 +1,104 @@
+"""Posts app Posts filters."""
+
+# Django
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Q
+from django.utils.translation import ugettext as _
+# Django Rest Framework
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+# Local models
+from uywasi_backend.posts.models import SEARCH_CONFIG
+# Utils
+from uywasi_backend.utils.geo import bounding_box, haversine_expression
+
+
+class NearFilterBackend(BaseFilterBackend):
+    """
+    NearFilterBackend.
+
+    Filter the posts located inside a radius around a point, using the
+    query params near=<latitude>,<longitude> and radius_km=<kilometers>.
+    The bounding box of the circle is resolved by the latitude/longitude
+    index, and only the rows inside the box are refined with the Haversine
+    distance. The results are ordered by distance.
+    """
+
+    near_param = 'near'
+    radius_param = 'radius_km'
+    default_radius_km = 5.0
+    max_radius_km = 100.0
+
+    def get_point(self, request):
+        """Return the (latitude, longitude) tuple from the near param."""
+        try:
+            latitude, longitude = (
+                float(value) for value in
+                request.query_params[self.near_param].split(','))
+        except ValueError:
+            raise ValidationError({self.near_param: _(
+                'The location must have the format latitude,longitude.')})
+        if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+            raise ValidationError({self.near_param: _(
+                'The location is out of range.')})
+        return latitude, longitude
+
+    def get_radius(self, request):
+        """Return the radius in kilometers from the radius_km param."""
+        radius_km = request.query_params.get(
+            self.radius_param, self.default_radius_km)
+        try:
+            radius_km = float(radius_km)
+        except ValueError:
+            raise ValidationError({self.radius_param: _(
+                'The radius must be a number.')})
+        if not 0 < radius_km <= self.max_radius_km:
+            raise ValidationError({self.radius_param: _(
+                'The radius must be greater than 0 and less than or equal '
+                'to {} kilometers.').format(self.max_radius_km)})
+        return radius_km
+
+    def filter_queryset(self, request, queryset, view):
+        """Filter and order the queryset only if the near param is sent."""
+        if self.near_param not in request.query_params:
+            return queryset
+        latitude, longitude = self.get_point(request)
+        radius_km = self.get_radius(request)
+
+        min_latitude, max_latitude, min_longitude, max_longitude = \
+            bounding_box(latitude, longitude, radius_km)
+        box = Q(latitude__range=(min_latitude, max_latitude))
+        if min_longitude is not None:
+            if min_longitude <= max_longitude:
+                box &= Q(longitude__range=(min_longitude, max_longitude))
+            else:
+                box &= (Q(longitude__gte=min_longitude) |
+                        Q(longitude__lte=max_longitude))
+
+        return queryset.filter(box).annotate(
+            distance=haversine_expression(latitude, longitude)
+        ).filter(distance__lte=radius_km).order_by('distance', '-created')
+
+
+class PostSearchFilter(BaseFilterBackend):
+    """
+    PostSearchFilter.
+
+    Filter the posts that match the terms of the search query param in
+    the name of the pet, the name of the breed or the information. The
+    search vector is resolved by its GIN index, and the results are
+    ordered by rank, the name of the pet weighs more than the breed and
+    the breed more than the information.
+    """
+
+    search_param = 'search'
+
+    def filter_queryset(self, request, queryset, view):
+        """Filter and order the queryset only if the search param is sent."""
+        terms = request.query_params.get(self.search_param, '').strip()
+        if not terms:
+            return queryset
+        query = SearchQuery(terms, config=SEARCH_CONFIG)
+        return queryset.filter(search_vector=query).annotate(
+            rank=SearchRank(F('search_vector'), query)
+        ).order_by('-rank', '-created')
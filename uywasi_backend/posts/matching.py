@@ -0,0 +1,122 @@
+"""Posts app matching of lost and finded pets."""
+
+# Django
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+# Local models
+from uywasi_backend.posts.models import Match, Post, MATCH_CELL_DEGREES
+# Utils
+from uywasi_backend.utils.geo import grid_cells_around, haversine_km
+from datetime import timedelta
+
+# Tag of the posts that may be the same pet of a post with the key tag.
+OPPOSITE_TAGS = {'lost': 'finded', 'finded': 'lost'}
+
+# Weight of each feature in the score, they sum 1.
+SCORE_WEIGHTS = {
+    'breed': 0.30,
+    'colors': 0.25,
+    'size': 0.15,
+    'distance': 0.20,
+    'recency': 0.10,
+}
+
+SIZES = ('s', 'm', 'b')
+
+CANDIDATE_FIELDS = (
+    'id', 'breed_id', 'color_primary', 'color_secondary', 'size',
+    'latitude', 'longitude', 'created', 'match_bucket')
+
+
+def get_candidates(post):
+    """
+    get_candidates.
+
+    Return the open posts with the opposite tag that can be the same pet,
+    they are read only from the buckets of the animal of the post that
+    intersect the search radius, created within the search window, so the
+    query is resolved by the match bucket index instead of a full scan.
+    """
+    animal = post.match_bucket.split(':', 1)[0]
+    buckets = [
+        '{}:{}:{}'.format(animal, row, column)
+        for row, column in grid_cells_around(
+            post.latitude, post.longitude,
+            settings.MATCH_RADIUS_KM, MATCH_CELL_DEGREES)
+    ]
+    window = timedelta(days=settings.MATCH_WINDOW_DAYS)
+    return Post.objects.filter(
+        tag=OPPOSITE_TAGS[post.tag],
+        state='open',
+        match_bucket__in=buckets,
+        created__range=(post.created - window, post.created + window)
+    ).exclude(user_id=post.user_id).order_by('-created') \
+        .values(*CANDIDATE_FIELDS)
+
+
+def score_candidate(post, candidate):
+    """
+    score_candidate.
+
+    Return the (score, distance) of a candidate for the post, or None if
+    it is farther than the search radius. Each feature is scored from 0
+    to 1 and the score is their weighted sum.
+    """
+    distance = haversine_km(post.latitude, post.longitude,
+                            candidate['latitude'], candidate['longitude'])
+    if distance > settings.MATCH_RADIUS_KM:
+        return None
+
+    colors = {post.color_primary, post.color_secondary} - {None}
+    candidate_colors = {candidate['color_primary'],
+                        candidate['color_secondary']} - {None}
+    size_gap = abs(SIZES.index(post.size) - SIZES.index(candidate['size']))
+    days = abs((post.created - candidate['created']).total_seconds()) / 86400
+
+    features = {
+        'breed': float(post.breed_id == candidate['breed_id']),
+        'colors': (
+            0.6 * (post.color_primary == candidate['color_primary']) +
+            0.4 * len(colors & candidate_colors) /
+            len(colors | candidate_colors)
+        ),
+        'size': 1.0 - size_gap / 2,
+        'distance': 1.0 - distance / settings.MATCH_RADIUS_KM,
+        'recency': max(0.0, 1.0 - days / settings.MATCH_WINDOW_DAYS),
+    }
+    score = sum(SCORE_WEIGHTS[name] * value
+                for name, value in features.items())
+    return score, distance
+
+
+def find_matches(post):
+    """
+    find_matches.
+
+    Score the candidates of a lost or finded post and store the best ones
+    as matches of both posts. Return the number of matches of the post.
+    """
+    if post.tag not in OPPOSITE_TAGS or post.state != 'open':
+        return 0
+
+    scored = []
+    for candidate in get_candidates(post)[:settings.MATCH_MAX_CANDIDATES]:
+        result = score_candidate(post, candidate)
+        if result is not None and result[0] >= settings.MATCH_MIN_SCORE:
+            scored.append((result[0], result[1], candidate['id']))
+    scored.sort(reverse=True)
+    scored = scored[:settings.MATCH_MAX_RESULTS]
+
+    now = timezone.now()
+    matches = []
+    for score, distance, candidate_id in scored:
+        matches.append(Match(
+            post_id=post.pk, candidate_id=candidate_id,
+            score=score, distance=distance, created=now, modified=now))
+        matches.append(Match(
+            post_id=candidate_id, candidate_id=post.pk,
+            score=score, distance=distance, created=now, modified=now))
+    with transaction.atomic():
+        Match.objects.bulk_create(matches, ignore_conflicts=True)
+    return len(scored)
@@ -0,0 +1,17 @@
+# Generated by Django 3.0.10 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['latitude', 'longitude'], name='post_latitude_longitude_idx'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 3.0.10 on 2026-10-18 12:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from uywasi_backend.utils.geo import grid_cell
+
+
+def fill_match_buckets(apps, schema_editor):
+    """Compute the match bucket of the existing posts."""
+    Post = apps.get_model('posts', 'Post')
+    posts = Post.objects.values_list(
+        'pk', 'breed__animal', 'latitude', 'longitude')
+    for pk, animal, latitude, longitude in posts.iterator():
+        Post.objects.filter(pk=pk).update(match_bucket='{}:{}:{}'.format(
+            animal, *grid_cell(latitude, longitude, 0.5)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0003_created_id_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='match_bucket',
+            field=models.CharField(blank=True, editable=False, help_text='Bucket of the candidates for matching, formed by the animal and the location grid cell of the pet. It is computed when the post is saved.', max_length=32),
+        ),
+        migrations.RunPython(fill_match_buckets, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['tag', 'state', 'match_bucket', 'created'], name='post_match_bucket_idx'),
+        ),
+        migrations.CreateModel(
+            name='Match',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Date time on wich the object was created.')),
+                ('modified', models.DateTimeField(auto_now=True, help_text='Date time on wich the object was last modified.')),
+                ('score', models.FloatField(help_text='Similarity between the pets of both posts, from 0 to 1.')),
+                ('distance', models.FloatField(help_text='Distance in kilometers between the locations of both posts.')),
+                ('candidate', models.ForeignKey(help_text='This is the post that may be the same pet.', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='posts.Post')),
+                ('post', models.ForeignKey(help_text='This is the post which the match belongs.', on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='posts.Post')),
+            ],
+            options={
+                'ordering': ['-score'],
+                'get_latest_by': ['-created', '-modified'],
+                'abstract': False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['-created', '-id'], name='match_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['post', '-score'], name='match_post_score_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='match',
+            constraint=models.UniqueConstraint(fields=('post', 'candidate'), name='unique_post_candidate'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 3.0.10 on 2026-10-18 13:45
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# The search vector of a post is computed before it is inserted, or updated
+# with other name, information or breed. When a breed is renamed, its posts
+# are touched so their search vectors are computed again.
+CREATE_TRIGGERS = """
+CREATE FUNCTION posts_post_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('spanish', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('spanish', coalesce(
+            (SELECT name FROM general_breed WHERE id = NEW.breed_id), '')), 'B') ||
+        setweight(to_tsvector('spanish', coalesce(NEW.information, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER posts_post_search_vector_trigger
+BEFORE INSERT OR UPDATE OF name, information, breed_id ON posts_post
+FOR EACH ROW EXECUTE PROCEDURE posts_post_search_vector_update();
+
+CREATE FUNCTION general_breed_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    UPDATE posts_post SET breed_id = breed_id WHERE breed_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER general_breed_search_vector_trigger
+AFTER UPDATE OF name ON general_breed
+FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+EXECUTE PROCEDURE general_breed_search_vector_update();
+
+UPDATE posts_post SET name = name;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER general_breed_search_vector_trigger ON general_breed;
+DROP FUNCTION general_breed_search_vector_update();
+DROP TRIGGER posts_post_search_vector_trigger ON posts_post;
+DROP FUNCTION posts_post_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('general', '0002_created_id_indexes'),
+        ('posts', '0004_post_matching'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Text search document formed by the name of the pet, the name of the breed and the information. It is computed by a database trigger.', null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+        migrations.AddIndex(
+            model_name='post',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='post_search_vector_idx'),
+        ),
+    ]
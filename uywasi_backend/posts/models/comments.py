@@ -44,4 +44,9 @@ class Comment(StandardModel):
     class Meta(StandardModel.Meta):
         """Meta options. Extended from StandardModel.Meta."""
 
-        pass
+        indexes = StandardModel.Meta.indexes + (
+            models.Index(
+                fields=('post', '-created', '-id'),
+                name='comment_post_created_idx'
+            ),
+        )
@@ -0,0 +1,69 @@
+"""Posts app Matches models."""
+
+# Django
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+# Local models
+from uywasi_backend.general.models import StandardModel
+from uywasi_backend.posts.models import Post
+
+
+class Match(StandardModel):
+    """
+    Match.
+
+    Represent a possible match between a lost pet post and a finded pet
+    post. Each match is stored for both posts, so the matches of a post
+    are obtained filtering by post.
+    """
+
+    post = models.ForeignKey(
+        help_text=_('This is the post which the match belongs.'),
+        to=Post,
+        on_delete=models.CASCADE,
+        related_name='matches'
+    )
+
+    candidate = models.ForeignKey(
+        help_text=_('This is the post that may be the same pet.'),
+        to=Post,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+
+    score = models.FloatField(
+        help_text=_('Similarity between the pets of both posts, '
+                    'from 0 to 1.')
+    )
+
+    distance = models.FloatField(
+        help_text=_('Distance in kilometers between the locations '
+                    'of both posts.')
+    )
+
+    def __str__(self):
+        """
+        __str__.
+
+        Return a string representation formed by post, candidate
+        and score.
+        """
+        return '{} matches {} ({:.2f})'.format(
+            self.post_id, self.candidate_id, self.score)
+
+    class Meta(StandardModel.Meta):
+        """Meta options. Extended from StandardModel.Meta."""
+
+        ordering = ['-score']
+        indexes = StandardModel.Meta.indexes + (
+            models.Index(
+                fields=('post', '-score'),
+                name='match_post_score_idx'
+            ),
+        )
+        constraints = (
+            models.UniqueConstraint(
+                fields=('post', 'candidate'),
+                name='unique_post_candidate'
+            ),
+        )
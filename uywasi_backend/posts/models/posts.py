@@ -1,12 +1,22 @@
 """Posts app Posts models."""
 
 # Django
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 # Local models
 from uywasi_backend.general.models import StandardModel, Breed
 from uywasi_backend.accounts.models import User
 from uywasi_backend.circles.models import Circle
+# Utils
+from uywasi_backend.utils.geo import grid_cell
+
+# Size in degrees of the grid cells used to bucket the match candidates.
+MATCH_CELL_DEGREES = 0.5
+
+# Text search configuration of the search vector of the posts.
+SEARCH_CONFIG = 'spanish'
 
 
 class Post(StandardModel):
@@ -144,6 +154,57 @@ class Post(StandardModel):
         default=0.0
     )
 
+    match_bucket = models.CharField(
+        help_text=_('Bucket of the candidates for matching, formed by the '
+                    'animal and the location grid cell of the pet. It is '
+                    'computed when the post is saved.'),
+        max_length=32,
+        blank=True,
+        editable=False
+    )
+
+    search_vector = SearchVectorField(
+        help_text=_('Text search document formed by the name of the pet, '
+                    'the name of the breed and the information. It is '
+                    'computed by a database trigger.'),
+        null=True,
+        editable=False
+    )
+
+    def get_match_bucket(self):
+        """Return the match bucket of the post."""
+        return '{}:{}:{}'.format(self.breed.animal, *grid_cell(
+            self.latitude, self.longitude, MATCH_CELL_DEGREES))
+
+    def get_match_inputs(self):
+        """Return the fields from which the match bucket is computed."""
+        return (self.breed_id, self.latitude, self.longitude)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Keep the match inputs of the loaded post."""
+        instance = super().from_db(db, field_names, values)
+        instance._match_inputs = instance.get_match_inputs()
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        save.
+
+        Compute the match bucket before save the post, only if it is new or
+        its breed or location changed, because it reads the breed.
+        """
+        match_inputs = self.get_match_inputs()
+        if (not self.match_bucket or
+                match_inputs != getattr(self, '_match_inputs', None)):
+            self.match_bucket = self.get_match_bucket()
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = \
+                    set(update_fields) | {'match_bucket'}
+        super().save(*args, **kwargs)
+        self._match_inputs = match_inputs
+
     def __str__(self):
         """
         __str__.
@@ -157,4 +218,36 @@ class Post(StandardModel):
     class Meta(StandardModel.Meta):
         """Meta options. Extended from StandardModel.Meta."""
 
-        pass
+        indexes = StandardModel.Meta.indexes + (
+            models.Index(
+                fields=('latitude', 'longitude'),
+                name='post_latitude_longitude_idx'
+            ),
+            models.Index(
+                fields=('tag', 'state', 'match_bucket', 'created'),
+                name='post_match_bucket_idx'
+            ),
+            GinIndex(
+                fields=('search_vector',),
+                name='post_search_vector_idx'
+            ),
+            # Posts of a user or a circle, by keyset.
+            models.Index(
+                fields=('user', '-created', '-id'),
+                name='post_user_created_idx'
+            ),
+            models.Index(
+                fields=('circle', '-created', '-id'),
+                name='post_circle_created_idx'
+            ),
+            models.Index(
+                fields=('circle', 'state', 'tag', '-created'),
+                name='post_circle_state_tag_idx'
+            ),
+            # Open posts by tag, the finished and cancelled are not listed.
+            models.Index(
+                fields=('tag', '-created', '-id'),
+                name='post_open_tag_created_idx',
+                condition=models.Q(state='open')
+            ),
+        )
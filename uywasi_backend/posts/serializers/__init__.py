@@ -2,3 +2,5 @@
 
 from .posts import *
 from .comments import *
+from .matches import *
+from .bulk import *
@@ -0,0 +1,136 @@
+"""Posts app Bulk serializers."""
+
+# Django
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.utils.translation import ugettext as _
+# Django Rest Framework
+from rest_framework import serializers
+# Local models
+from uywasi_backend.circles.models import Circle
+from uywasi_backend.general.models import Breed
+from uywasi_backend.posts.models import Post
+# Local serializers
+from uywasi_backend.posts.serializers import PostModelSerializer
+# Local cache
+from uywasi_backend.circles.cache import get_memberships
+# Utils
+from uywasi_backend.utils.files import delete_files, save_many_files
+from uywasi_backend.utils.images import Base64ImageField
+
+
+class PostBulkListSerializer(serializers.ListSerializer):
+    """
+    PostBulkListSerializer.
+
+    Validate a batch of posts and insert them with a single bulk_create
+    in one transaction. The batch is limited to POSTS_BULK_MAX_SIZE posts,
+    and their breeds and circles are read with one query each for the
+    whole batch.
+    """
+
+    def validate(self, attrs):
+        """Check the size of the batch, and set the breeds and circles."""
+        if not attrs:
+            raise serializers.ValidationError(_('The batch is empty.'))
+        if len(attrs) > settings.POSTS_BULK_MAX_SIZE:
+            raise serializers.ValidationError(_(
+                'The batch can not have more than {} posts.').format(
+                settings.POSTS_BULK_MAX_SIZE))
+        breeds = Breed.objects.in_bulk({data['breed'] for data in attrs})
+        for data in attrs:
+            if data['breed'] not in breeds:
+                raise serializers.ValidationError(_(
+                    'Invalid pk "{}" - object does not exist.').format(
+                    data['breed']))
+            data['breed'] = breeds[data['breed']]
+        self.validate_circles(attrs)
+        return attrs
+
+    def validate_circles(self, attrs):
+        """
+        validate_circles.
+
+        Set the active circles of the posts, read by slugname, and check
+        the authenticated user is subscribed to them.
+        """
+        slugnames = {data['circle'] for data in attrs if data.get('circle')}
+        circles = Circle.objects.filter(is_active=True).in_bulk(
+            slugnames, field_name='slugname')
+        memberships = get_memberships(self.context['request'].user)
+        for data in attrs:
+            if not data.get('circle'):
+                continue
+            circle = circles.get(data['circle'])
+            if circle is None:
+                raise serializers.ValidationError(_(
+                    'Object with slugname={} does not exist.').format(
+                    data['circle']))
+            if circle.pk not in memberships:
+                raise serializers.ValidationError(
+                    _('Only the members circle can post on it.'))
+            data['circle'] = circle
+
+    def create(self, validated_data):
+        """
+        create.
+
+        Insert the posts of the batch, owned by the authenticated user.
+        The photos of the whole batch are stored concurrently first. The
+        post_save signals, not sent by bulk_create, are sent for each
+        post, so the matches, feeds and images are processed as usual.
+        """
+        from uywasi_backend.general.tasks import delete_orphan_files
+
+        stored_list = save_many_files(
+            Post, validated_data, PostModelSerializer.PHOTO_FIELDS)
+        posts = [Post(**data) for data in validated_data]
+        for post in posts:
+            post.match_bucket = post.get_match_bucket()
+        try:
+            with transaction.atomic():
+                posts = Post.objects.bulk_create(posts)
+                for post in posts:
+                    post_save.send(sender=Post, instance=post, created=True,
+                                   update_fields=None, raw=False,
+                                   using=Post.objects.db)
+        except Exception:
+            for stored in stored_list:
+                delete_files(Post, stored)
+            raise
+        delete_orphan_files.apply_async(
+            args=(Post._meta.label, [
+                (post.pk, stored) for post, stored in zip(posts, stored_list)
+            ]),
+            countdown=settings.STORAGE_ORPHAN_FILES_DELAY)
+        return posts
+
+
+class PostBulkSerializer(PostModelSerializer):
+    """
+    PostBulkSerializer.
+
+    Serialize the posts of a batch, sent as a JSON list with the photos
+    encoded as base64. The posts are owned by the authenticated user, and
+    they can be posted only on the circles where he is subscribed. The
+    breed is validated as a pk and the circle as a slugname, and both are
+    read by PostBulkListSerializer.
+    """
+
+    user = serializers.HiddenField(default=serializers.CurrentUserDefault())
+    breed = serializers.IntegerField(min_value=1)
+    circle = serializers.SlugField(required=False, allow_null=True)
+    photo_first = Base64ImageField()
+    photo_second = Base64ImageField(required=False, allow_null=True)
+    photo_third = Base64ImageField(required=False, allow_null=True)
+
+    class Meta(PostModelSerializer.Meta):
+        """Meta options. Extended from PostModelSerializer.Meta."""
+
+        # The upload sessions are attached by PostModelSerializer.create,
+        # which is not used by the bulk creation.
+        fields = tuple(
+            field for field in PostModelSerializer.Meta.fields
+            if not field.endswith('_upload'))
+        list_serializer_class = PostBulkListSerializer
@@ -0,0 +1,31 @@
+"""Posts app Matches serializers."""
+
+# Django Rest Framework
+from rest_framework import serializers
+# Local models
+from uywasi_backend.posts.models import Match
+# Local serializers
+from uywasi_backend.posts.serializers import CirclePostSerializer
+
+
+class MatchModelSerializer(serializers.ModelSerializer):
+    """
+    MatchModelSerializer.
+
+    Serialize a match of a post, using CirclePostSerializer for the
+    candidate post, so its user is serialized too for contact.
+    """
+
+    candidate = CirclePostSerializer(read_only=True)
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load the candidate, its user and his account in the same query."""
+        return queryset.select_related('candidate__user__useraccount')
+
+    class Meta:
+        """Meta options."""
+
+        model = Match
+        fields = ('id', 'candidate', 'score', 'distance', 'created')
+        read_only_fields = fields
@@ -1,15 +1,28 @@
 """Posts app Posts serializers."""
 
+# Django
+from django.conf import settings
+from django.db import transaction
+from django.utils.translation import ugettext as _
 # Django Rest Framework
 from rest_framework import serializers
 # Local models
+from uywasi_backend.general.models import UploadSession
 from uywasi_backend.posts.models import Post
 from uywasi_backend.circles.models import Circle
 from uywasi_backend.accounts.models import User
 # Local serializers
-from uywasi_backend.accounts.serializers import UserModelSerializer
-from uywasi_backend.circles.serializers import CircleModelSerializer
-from uywasi_backend.general.serializers import BreedModelSerializer
+from uywasi_backend.accounts.serializers import (
+    UserModelSerializer, UserValuesSerializer)
+from uywasi_backend.circles.serializers import (
+    CircleModelSerializer, CircleValuesSerializer)
+from uywasi_backend.general.serializers import (
+    BreedModelSerializer, BreedValuesSerializer, UploadSessionField)
+# Utils
+from uywasi_backend.utils.files import delete_files, save_files
+from uywasi_backend.utils.images import ImageVariantField
+from uywasi_backend.utils.values import (
+    ImageValueField, NestedValueField, ValuesSerializer)
 
 
 class PostModelSerializer(serializers.ModelSerializer):
@@ -18,8 +31,12 @@ class PostModelSerializer(serializers.ModelSerializer):
 
     Serialize the most important fields of a Post, using SlugRelatedField
     for user and circle with the fields username and slugname respectively.
+    The photos can be sent as files, or as the ids of confirmed upload
+    sessions of the images uploaded directly to the storage.
     """
 
+    PHOTO_FIELDS = ('photo_first', 'photo_second', 'photo_third')
+
     user = serializers.SlugRelatedField(
         slug_field='username',
         queryset=User.objects.all()
@@ -30,6 +47,90 @@ class PostModelSerializer(serializers.ModelSerializer):
         queryset=Circle.objects.all()
     )
 
+    photo_first_upload = UploadSessionField(
+        target='post.photo_first', write_only=True, required=False)
+    photo_second_upload = UploadSessionField(
+        target='post.photo_second', write_only=True, required=False)
+    photo_third_upload = UploadSessionField(
+        target='post.photo_third', write_only=True, required=False)
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load the related fields serialized by slug in the same query."""
+        return queryset.select_related('user', 'circle')
+
+    def validate(self, data):
+        """
+        validate.
+
+        Set the images of the upload sessions to their photo fields, and
+        check the post has its first photo.
+        """
+        self.upload_sessions = []
+        for field_name in self.PHOTO_FIELDS:
+            session = data.pop('{}_upload'.format(field_name), None)
+            if session is not None:
+                data[field_name] = session.key
+                self.upload_sessions.append(session.pk)
+        if self.instance is None and not data.get('photo_first'):
+            raise serializers.ValidationError(
+                {'photo_first': _('This field is required.')})
+        return data
+
+    def create(self, validated_data):
+        """Create the post, and attach to it its upload sessions."""
+        return self.save_post(validated_data)
+
+    def update(self, instance, validated_data):
+        """Update the post, and attach to it its upload sessions."""
+        return self.save_post(validated_data, instance)
+
+    def save_post(self, validated_data, instance=None):
+        """
+        save_post.
+
+        Store the uploaded photos concurrently before saving the post with
+        their names. They are deleted if the post is not saved, and checked
+        later by delete_orphan_files in case the transaction of the request
+        is rolled back after. The upload sessions are claimed in the same
+        transaction as the post, so a session is attached to one post only.
+        """
+        from uywasi_backend.general.tasks import delete_orphan_files
+
+        stored = save_files(Post, validated_data, self.PHOTO_FIELDS)
+        try:
+            with transaction.atomic():
+                if instance is None:
+                    post = super().create(validated_data)
+                else:
+                    post = super().update(instance, validated_data)
+                self.claim_upload_sessions(post)
+        except Exception:
+            delete_files(Post, stored)
+            raise
+        if stored:
+            delete_orphan_files.apply_async(
+                args=(Post._meta.label, [(post.pk, stored)]),
+                countdown=settings.STORAGE_ORPHAN_FILES_DELAY)
+        return post
+
+    def claim_upload_sessions(self, post):
+        """
+        claim_upload_sessions.
+
+        Attach the upload sessions to the post only if they are still not
+        attached, or raise a ValidationError if another request claimed
+        any of them first.
+        """
+        if not self.upload_sessions:
+            return
+        claimed = UploadSession.objects.filter(
+            pk__in=self.upload_sessions, object_id=None
+        ).update(object_id=post.pk)
+        if claimed != len(self.upload_sessions):
+            raise serializers.ValidationError(
+                _('The uploaded images are already attached to a post.'))
+
     class Meta:
         """Meta options."""
 
@@ -37,7 +138,10 @@ class PostModelSerializer(serializers.ModelSerializer):
         fields = ('id', 'name', 'information', 'tag',
                   'state', 'color_primary', 'color_secondary', 'size',
                   'photo_first', 'photo_second', 'photo_third', 'latitude',
-                  'longitude', 'breed', 'user', 'circle')
+                  'longitude', 'breed', 'user', 'circle',
+                  'photo_first_upload', 'photo_second_upload',
+                  'photo_third_upload')
+        extra_kwargs = {'photo_first': {'required': False}}
 
 
 class CirclePostSerializer(PostModelSerializer):
@@ -50,12 +154,20 @@ class CirclePostSerializer(PostModelSerializer):
     """
 
     user = UserModelSerializer(read_only=True)
+    photo_first_thumbnail = ImageVariantField(
+        source='photo_first', variant='thumbnail')
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load the user and his account in the same query."""
+        return queryset.select_related('user__useraccount')
 
     class Meta(PostModelSerializer.Meta):
         """Meta options. Extended from PostModelSerializer.Meta."""
 
         fields = ('id', 'name', 'information', 'tag',
-                  'state', 'photo_first', 'user', 'created')
+                  'state', 'photo_first', 'photo_first_thumbnail', 'user',
+                  'created')
 
 
 class UserPostSerializer(PostModelSerializer):
@@ -68,12 +180,20 @@ class UserPostSerializer(PostModelSerializer):
     """
 
     circle = serializers.StringRelatedField()
+    photo_first_thumbnail = ImageVariantField(
+        source='photo_first', variant='thumbnail')
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load the circle in the same query."""
+        return queryset.select_related('circle')
 
     class Meta(PostModelSerializer.Meta):
         """Meta options. Extended from PostModelSerializer.Meta."""
 
         fields = ('id', 'name', 'information', 'tag',
-                  'state', 'photo_first', 'created', 'circle')
+                  'state', 'photo_first', 'photo_first_thumbnail', 'created',
+                  'circle')
 
 
 class PostDetailSerializer(PostModelSerializer):
@@ -88,8 +208,48 @@ class PostDetailSerializer(PostModelSerializer):
     user = UserModelSerializer(read_only=True)
     circle = CircleModelSerializer(read_only=True)
     breed = BreedModelSerializer(read_only=True)
+    photo_first_thumbnail = ImageVariantField(
+        source='photo_first', variant='thumbnail')
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        setup_eager_loading.
+
+        Load the user, his account, the breed and the circle in the same
+        query, so a page of posts costs the same queries whatever its size.
+        """
+        return queryset.select_related('user__useraccount', 'breed', 'circle')
 
     class Meta(PostModelSerializer.Meta):
         """Meta options. Extended from PostModelSerializer.Meta."""
 
-        pass
+        fields = PostModelSerializer.Meta.fields + ('photo_first_thumbnail',)
+
+
+class PostDetailValuesSerializer(ValuesSerializer):
+    """
+    PostDetailValuesSerializer.
+
+    Serialize the rows of the posts as PostDetailSerializer, with the
+    user, circle and breed read in the same query. It is used for list
+    the posts.
+    """
+
+    photo_first = ImageValueField()
+    photo_second = ImageValueField()
+    photo_third = ImageValueField()
+    photo_first_thumbnail = ImageValueField(
+        source='photo_first', variant='thumbnail')
+    user = NestedValueField(UserValuesSerializer)
+    circle = NestedValueField(CircleValuesSerializer)
+    breed = NestedValueField(BreedValuesSerializer)
+
+    class Meta:
+        """Meta options."""
+
+        fields = ('id', 'name', 'information', 'tag',
+                  'state', 'color_primary', 'color_secondary', 'size',
+                  'photo_first', 'photo_second', 'photo_third', 'latitude',
+                  'longitude', 'breed', 'user', 'circle',
+                  'photo_first_thumbnail')
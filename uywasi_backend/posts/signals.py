@@ -0,0 +1,74 @@
+"""Posts app signals."""
+
+# Django
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+# Local models
+from uywasi_backend.accounts.models import Following, UserAccount
+from uywasi_backend.posts.models import Post
+# Local signals
+from uywasi_backend.accounts.signals import invalidate_owner_profile
+from uywasi_backend.general.signals import dispatch_image_variants
+# Local feed
+from uywasi_backend.posts.feed import invalidate_inbox
+# Local matching
+from uywasi_backend.posts.matching import OPPOSITE_TAGS
+
+
+@receiver(post_save, sender=Post)
+def dispatch_post_matching(sender, instance, created, **kwargs):
+    """
+    dispatch_post_matching.
+
+    Search the matches of a lost or finded post in a worker, once the
+    transaction that creates the post is committed.
+    """
+    from uywasi_backend.general.tasks import find_post_matches
+
+    if not created or instance.tag not in OPPOSITE_TAGS:
+        return
+    transaction.on_commit(lambda: find_post_matches.delay(instance.pk))
+
+
+@receiver(post_save, sender=Post)
+def dispatch_post_fan_out(sender, instance, created, **kwargs):
+    """Add a new post to the feeds in a worker once it is committed."""
+    from uywasi_backend.general.tasks import fan_out_post_to_feeds
+
+    if created:
+        transaction.on_commit(
+            lambda: fan_out_post_to_feeds.delay(instance.pk))
+
+
+@receiver(post_save, sender=Post)
+def dispatch_post_event(sender, instance, created, **kwargs):
+    """Publish a new post to the websocket clients once it is committed."""
+    from uywasi_backend.general.tasks import publish_post_created
+
+    if created:
+        transaction.on_commit(
+            lambda: publish_post_created.delay(instance.pk))
+
+
+@receiver(post_save, sender=Following)
+@receiver(post_delete, sender=Following)
+def invalidate_follower_feed(sender, instance, **kwargs):
+    """Rebuild the feed of a user that follows or unfollows an account."""
+    invalidate_inbox(*UserAccount.objects.filter(
+        pk=instance.user_account_from_id).values_list('user_id', flat=True))
+
+
+@receiver(post_save, sender='circles.Subscription')
+@receiver(post_delete, sender='circles.Subscription')
+def invalidate_subscriber_feed(sender, instance, **kwargs):
+    """Rebuild the feed of a user that subscribes or unsubscribes a circle."""
+    invalidate_inbox(instance.user_id)
+
+
+# The profiles show the posts of their user.
+post_save.connect(invalidate_owner_profile, sender=Post)
+post_delete.connect(invalidate_owner_profile, sender=Post)
+
+# The images of the posts have variants.
+post_save.connect(dispatch_image_variants, sender=Post)
@@ -0,0 +1,53 @@
+"""Posts app factories."""
+
+# Factory boy
+import factory
+from factory.django import DjangoModelFactory
+# Local models
+from uywasi_backend.posts.models import Comment, Post
+# Local factories
+from uywasi_backend.accounts.tests.factories import UserFactory
+from uywasi_backend.general.tests.factories import BreedFactory
+
+
+class PostFactory(DjangoModelFactory):
+    """
+    PostFactory.
+
+    Build an open post of a pet without circle, located around Quito.
+    """
+
+    breed = factory.SubFactory(BreedFactory)
+    user = factory.SubFactory(UserFactory)
+    name = factory.Faker('first_name')
+    information = factory.Faker('paragraph')
+    tag = factory.Iterator(('lost', 'finded', 'adoption'))
+    state = 'open'
+    color_primary = factory.Iterator(('black', 'white', 'gray', 'brown'))
+    color_secondary = factory.Iterator((None, 'white', 'brown'))
+    size = factory.Iterator(('s', 'm', 'b'))
+    photo_first = factory.django.ImageField(width=64, height=64)
+    latitude = factory.Faker('pyfloat', min_value=-0.35, max_value=-0.05)
+    longitude = factory.Faker('pyfloat', min_value=-78.6, max_value=-78.4)
+
+    class Meta:
+        """Meta options."""
+
+        model = Post
+
+
+class CommentFactory(DjangoModelFactory):
+    """
+    CommentFactory.
+
+    Build a comment of a new user on a new post.
+    """
+
+    post = factory.SubFactory(PostFactory)
+    user = factory.SubFactory(UserFactory)
+    content = factory.Faker('sentence')
+
+    class Meta:
+        """Meta options."""
+
+        model = Comment
@@ -0,0 +1,119 @@
+"""Posts app bulk creation tests."""
+
+# Django
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+# Django Rest Framework
+from rest_framework.test import APIClient
+# Local models
+from uywasi_backend.circles.models import Circle
+from uywasi_backend.general.models import Breed
+from uywasi_backend.posts.models import Post
+# Local factories
+from uywasi_backend.circles.tests.factories import (
+    CircleFactory, SubscriptionFactory)
+from uywasi_backend.general.tests.factories import BreedFactory
+# Utils
+from io import BytesIO
+from PIL import Image
+import base64
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def get_image():
+    """Return a small PNG image encoded as base64."""
+    content = BytesIO()
+    Image.new('RGB', (8, 8)).save(content, format='PNG')
+    return base64.b64encode(content.getvalue()).decode()
+
+
+def get_batch(size, breeds):
+    """Return a batch of posts of the breeds, in turns."""
+    image = get_image()
+    return [{
+        'breed': breeds[index % len(breeds)].pk,
+        'name': 'Pet {}'.format(index),
+        'information': 'Seen near the park.',
+        'tag': 'lost',
+        'state': 'open',
+        'color_primary': 'black',
+        'size': 'm',
+        'photo_first': image,
+        'latitude': -0.2,
+        'longitude': -78.5,
+    } for index in range(size)]
+
+
+def test_bulk_reads_the_breeds_once(user):
+    """The posts are owned by the user, and the breeds read with a query."""
+    client = APIClient()
+    client.force_authenticate(user)
+    breeds = BreedFactory.create_batch(3)
+    url = reverse('posts:posts-bulk')
+
+    for size in (2, 6):
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(url, get_batch(size, breeds),
+                                   format='json')
+        assert response.status_code == 201, response.data
+        breed_queries = [query for query in context.captured_queries
+                         if Breed._meta.db_table in query['sql'] and
+                         query['sql'].startswith('SELECT')]
+        assert len(breed_queries) == 1
+
+    posts = Post.objects.filter(user=user)
+    assert posts.count() == 8
+    assert all(post.match_bucket for post in posts)
+
+
+def test_bulk_rejects_an_unknown_breed(user):
+    """A batch with a breed that does not exist is not created."""
+    client = APIClient()
+    client.force_authenticate(user)
+    batch = get_batch(2, BreedFactory.create_batch(1))
+    batch[1]['breed'] = 999999
+
+    response = client.post(reverse('posts:posts-bulk'), batch, format='json')
+    assert response.status_code == 400
+    assert not Post.objects.filter(user=user).exists()
+
+
+def test_bulk_reads_the_circles_once(user):
+    """The circles of the posts are read with a query for the whole batch."""
+    client = APIClient()
+    client.force_authenticate(user)
+    breeds = BreedFactory.create_batch(1)
+    circles = CircleFactory.create_batch(3)
+    for circle in circles:
+        SubscriptionFactory(user=user, circle=circle)
+    url = reverse('posts:posts-bulk')
+
+    for size in (2, 6):
+        batch = get_batch(size, breeds)
+        for index, data in enumerate(batch):
+            data['circle'] = circles[index % len(circles)].slugname
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(url, batch, format='json')
+        assert response.status_code == 201, response.data
+        circle_queries = [query for query in context.captured_queries
+                          if query['sql'].startswith(
+                              'SELECT "{}"'.format(Circle._meta.db_table))]
+        assert len(circle_queries) == 1
+
+    assert set(Post.objects.filter(user=user).values_list(
+        'circle', flat=True)) == {circle.pk for circle in circles}
+
+
+def test_bulk_rejects_a_circle_of_other_members(user):
+    """A batch with a circle where the user is not subscribed is rejected."""
+    client = APIClient()
+    client.force_authenticate(user)
+    batch = get_batch(2, BreedFactory.create_batch(1))
+    batch[1]['circle'] = CircleFactory().slugname
+
+    response = client.post(reverse('posts:posts-bulk'), batch, format='json')
+    assert response.status_code == 400
+    assert not Post.objects.filter(user=user).exists()
@@ -0,0 +1,22 @@
+"""Posts app commands tests."""
+
+# Django
+from django.core.management import call_command
+# Local factories
+from uywasi_backend.posts.tests.factories import PostFactory
+# Utils
+from io import StringIO
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def test_explain_hot_queries_reports_the_execution_times():
+    """The plans of the hot queries are read as JSON."""
+    PostFactory.create_batch(2)
+    out = StringIO()
+    call_command('explain_hot_queries', '--query', 'posts.list',
+                 '--query', 'posts.user', '--verbose-plans', stdout=out)
+    output = out.getvalue()
+    assert 'posts.list: ' in output and ' ms' in output
+    assert '"Node Type"' in output
@@ -0,0 +1,108 @@
+"""Posts app real-time events tests."""
+
+# Local
+from config.websocket import Consumer, PostsHub
+from uywasi_backend.posts import events
+# Local factories
+from uywasi_backend.circles.tests.factories import CircleFactory
+from uywasi_backend.posts.tests.factories import PostFactory
+# Utils
+import json
+import pytest
+import redis
+
+pytestmark = pytest.mark.django_db
+
+
+class RecordingRedis:
+    """Redis client that records the published messages."""
+
+    def __init__(self):
+        """Start without messages."""
+        self.messages = []
+
+    def publish(self, channel, message):
+        """Record a message, as received by one process."""
+        self.messages.append((channel, message))
+        return 1
+
+
+class DroppingPubSub:
+    """Pubsub whose connection drops on the first subscription."""
+
+    subscriptions = 0
+
+    def subscribe(self, **channels):
+        """Fail the first subscription, as if redis were unavailable."""
+        DroppingPubSub.subscriptions += 1
+        if DroppingPubSub.subscriptions == 1:
+            raise redis.ConnectionError('Connection refused.')
+
+    def run_in_thread(self, **kwargs):
+        """Return a worker thread, alive until the connection drops."""
+        return DroppingThread(self)
+
+    def close(self):
+        """Close the connection."""
+
+
+class DroppingThread:
+    """Worker thread of the pubsub, stopped by setting alive to False."""
+
+    def __init__(self, pubsub):
+        """Start alive."""
+        self.pubsub = pubsub
+        self.alive = True
+
+    def is_alive(self):
+        """Return whether the connection is alive."""
+        return self.alive
+
+
+def test_hub_subscribes_again_when_the_connection_drops(
+        settings, monkeypatch):
+    """The channel is subscribed again once redis is available again."""
+    settings.POSTS_EVENTS_REDIS_URL = 'redis://localhost:6379/0'
+    monkeypatch.setattr(DroppingPubSub, 'subscriptions', 0)
+    monkeypatch.setattr(redis.Redis, 'pubsub',
+                        lambda self, **kwargs: DroppingPubSub())
+    hub = PostsHub()
+
+    hub.start()
+    assert hub.thread is None
+
+    hub.start()
+    thread = hub.thread
+    hub.start()
+    assert hub.thread is thread and DroppingPubSub.subscriptions == 2
+
+    thread.alive = False
+    hub.start()
+    assert hub.thread is not thread and DroppingPubSub.subscriptions == 3
+
+
+def test_post_event_is_dispatched_to_the_circle_subscribers(
+        settings, monkeypatch):
+    """A published post reaches the consumers subscribed to its circle."""
+    client = RecordingRedis()
+    monkeypatch.setattr(events, '_client', client)
+    post = PostFactory(circle=CircleFactory(slugname='quito'))
+
+    assert events.publish_post(post) == 1
+    [(channel, message)] = client.messages
+    assert channel == settings.POSTS_EVENTS_CHANNEL
+
+    hub, consumer = PostsHub(), Consumer()
+    hub.subscribe_circle(consumer, 'quito')
+    hub.dispatch(message)
+    event = json.loads(consumer.queue.get_nowait())
+    assert event['type'] == 'post'
+    assert event['post']['id'] == post.pk
+    assert event['post']['user']['username'] == post.user.username
+
+
+def test_post_event_is_not_published_without_redis(settings, monkeypatch):
+    """The events are disabled while POSTS_EVENTS_REDIS_URL is not set."""
+    settings.POSTS_EVENTS_REDIS_URL = None
+    monkeypatch.setattr(events, '_client', None)
+    assert events.publish_post(PostFactory()) == 0
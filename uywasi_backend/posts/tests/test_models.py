@@ -0,0 +1,30 @@
+"""Posts app models tests."""
+
+# Local models
+from uywasi_backend.posts.models import Post
+# Local factories
+from uywasi_backend.general.tests.factories import BreedFactory
+from uywasi_backend.posts.tests.factories import PostFactory
+# Utils
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def test_match_bucket_is_not_recomputed_without_changes(
+        django_assert_num_queries):
+    """Save a loaded post without changing its breed or location."""
+    post = Post.objects.get(pk=PostFactory().pk)
+    post.name = 'Other'
+    with django_assert_num_queries(1):
+        post.save(update_fields=['name'])
+
+
+def test_match_bucket_is_recomputed_when_the_breed_changes():
+    """Save a loaded post with another breed and location."""
+    post = Post.objects.get(pk=PostFactory(breed__animal='dog').pk)
+    post.breed = BreedFactory(animal='cat')
+    post.latitude, post.longitude = 10.2, 20.7
+    post.save(update_fields=['breed', 'latitude', 'longitude'])
+    post.refresh_from_db()
+    assert post.match_bucket == 'cat:20:41'
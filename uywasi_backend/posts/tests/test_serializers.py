@@ -0,0 +1,53 @@
+"""Posts app serializers tests."""
+
+# Django
+from django.utils import timezone
+# Django Rest Framework
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+# Local models
+from uywasi_backend.general.models import UploadSession
+from uywasi_backend.posts.models import Post
+# Local serializers
+from uywasi_backend.posts.serializers import PostModelSerializer
+# Local factories
+from uywasi_backend.circles.tests.factories import CircleFactory
+from uywasi_backend.general.tests.factories import BreedFactory
+# Utils
+from datetime import timedelta
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def test_upload_session_is_claimed_by_one_post(user):
+    """A session validated by two requests is attached to the first one."""
+    now = timezone.now()
+    session = UploadSession.objects.create(
+        user=user, target='post.photo_first', key='posts/uploaded.png',
+        content_type='image/png', size=1024,
+        expires=now + timedelta(hours=1), confirmed=now)
+    request = Request(APIRequestFactory().post('/api/posts/'))
+    request.user = user
+    data = {
+        'name': 'Pet', 'information': 'Seen near the park.', 'tag': 'lost',
+        'state': 'open', 'color_primary': 'black', 'size': 'm',
+        'latitude': -0.2, 'longitude': -78.5,
+        'breed': BreedFactory().pk, 'user': user.username,
+        'circle': CircleFactory().slugname,
+        'photo_first_upload': str(session.pk),
+    }
+    first, second = (
+        PostModelSerializer(data=data, context={'request': request})
+        for _ in range(2))
+    assert first.is_valid(), first.errors
+    assert second.is_valid(), second.errors
+
+    post = first.save()
+    with pytest.raises(ValidationError):
+        second.save()
+
+    session.refresh_from_db()
+    assert session.object_id == post.pk
+    assert list(Post.objects.filter(user=user)) == [post]
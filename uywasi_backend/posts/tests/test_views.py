@@ -0,0 +1,116 @@
+"""Posts app views tests."""
+
+# Django
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+# Django Rest Framework
+from rest_framework.test import APIClient
+# Local models
+from uywasi_backend.posts.models import Post
+# Local serializers
+from uywasi_backend.posts.serializers import PostDetailSerializer
+# Local factories
+from uywasi_backend.accounts.tests.factories import (
+    UserAccountFactory)
+from uywasi_backend.circles.tests.factories import CircleFactory
+from uywasi_backend.posts.tests.factories import PostFactory
+# Utils
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+def test_post_detail_is_cached(api_client, django_assert_num_queries):
+    """The detail of a post is served from cache once it is retrieved."""
+    post = PostFactory(user=UserAccountFactory().user)
+    url = reverse('posts:posts-detail', kwargs={'pk': post.pk})
+
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response.data['id'] == post.pk
+    assert response.data['user']['biography'] == post.user.useraccount.biography
+
+    with django_assert_num_queries(0):
+        cached = api_client.get(url)
+    assert cached.data == response.data
+
+
+@pytest.fixture
+def posts():
+    """Return posts of different users, breeds and circles."""
+    circles = CircleFactory.create_batch(2)
+    return [
+        PostFactory(user=UserAccountFactory().user,
+                    circle=circles[index % len(circles)])
+        for index in range(6)
+    ]
+
+
+def count_queries(function):
+    """Return the number of queries run by a function, and its result."""
+    with CaptureQueriesContext(connection) as context:
+        result = function()
+    return len(context.captured_queries), result
+
+
+def test_post_list_queries_do_not_grow_with_the_page(api_client, posts):
+    """The posts list costs the same queries for 2 or 6 posts."""
+    url = reverse('posts:posts-list')
+    small, response = count_queries(lambda: api_client.get(url, {'limit': 2}))
+    assert len(response.data['results']) == 2
+    large, response = count_queries(lambda: api_client.get(url, {'limit': 6}))
+    assert len(response.data['results']) == 6
+    assert small == large
+
+
+def test_only_the_post_lists_are_paginated_by_cursor(api_client, posts):
+    """The posts list has cursors, and the other lists keep their count."""
+    response = api_client.get(reverse('posts:posts-list'), {'limit': 2})
+    assert 'count' not in response.data
+    assert 'cursor=' in response.data['next']
+
+    response = api_client.get(reverse('circles:circles-list'), {'limit': 1})
+    assert response.data['count'] == 2
+    assert 'offset=1' in response.data['next']
+
+
+def test_post_detail_serializer_queries_do_not_grow_with_the_page(posts):
+    """PostDetailSerializer loads the relations of any page at once."""
+    queryset = PostDetailSerializer.setup_eager_loading(
+        Post.objects.order_by('pk'))
+    small, data = count_queries(
+        lambda: PostDetailSerializer(queryset[:2], many=True).data)
+    assert len(data) == 2
+    large, data = count_queries(
+        lambda: PostDetailSerializer(queryset[:6], many=True).data)
+    assert len(data) == 6
+    assert data[0]['circle']['number_of_subscriptions'] is not None
+    assert small == large
+
+
+def test_circle_posts_queries_do_not_grow_with_the_page(api_client, posts):
+    """The posts of a circle cost the same queries for 1 or 3 posts."""
+    url = reverse('circles:posts-list', kwargs={
+        'circle_slugname': posts[0].circle.slugname})
+    small, response = count_queries(lambda: api_client.get(url, {'limit': 1}))
+    assert len(response.data['results']) == 1
+    large, response = count_queries(lambda: api_client.get(url, {'limit': 3}))
+    assert len(response.data['results']) == 3
+    assert small == large
+
+
+def test_profiled_list_times_its_serialization(settings, posts):
+    """The profiling reports the serializer time of the values list."""
+    settings.PROFILING_ENABLED = True
+    settings.DEBUG = True
+    response = APIClient().get(reverse('posts:posts-list'))
+    timing = dict(part.split(';dur=')
+                  for part in response['Server-Timing'].split(', '))
+    assert 0 < float(timing['serializer']) <= float(timing['total'])
+    assert int(response['X-Query-Count']) > 0
@@ -5,7 +5,8 @@ from django.urls import path, include
 # Django Rest Framework
 from rest_framework.routers import DefaultRouter
 # Local views
-from uywasi_backend.posts.views import PostViewSet, CommentViewSet
+from uywasi_backend.posts.views import (
+    PostViewSet, CommentViewSet, FeedViewSet)
 
 router = DefaultRouter()
 
@@ -20,6 +21,12 @@ router.register(
     viewset=CommentViewSet,
     basename='comments')
 
+router.register(
+    prefix=r'feed',
+    viewset=FeedViewSet,
+    basename='feed'
+)
+
 app_name = 'posts'
 
 urlpatterns = [
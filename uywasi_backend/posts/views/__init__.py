@@ -2,3 +2,4 @@
 
 from .posts import *
 from .comments import *
+from .feed import *
@@ -5,9 +5,12 @@ from rest_framework import mixins, viewsets
 from rest_framework.generics import get_object_or_404
 # Local models
 from uywasi_backend.posts.models import Post, Comment
+# Utils
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
 
 
-class CommentViewSet(mixins.CreateModelMixin, mixins.DestroyModelMixin,
+class CommentViewSet(SafeMethodsNonAtomicMixin,
+                     mixins.CreateModelMixin, mixins.DestroyModelMixin,
                      mixins.ListModelMixin, viewsets.GenericViewSet):
     """
     CommentViewSet.
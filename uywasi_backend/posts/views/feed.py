@@ -0,0 +1,32 @@
+"""Posts app Feed views."""
+
+# Django Rest Framework
+from rest_framework import mixins, viewsets
+from rest_framework.permissions import IsAuthenticated
+# Local serializers
+from uywasi_backend.posts.serializers import PostDetailSerializer
+# Local feed
+from uywasi_backend.posts.feed import get_feed_queryset
+# Utils
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
+from uywasi_backend.utils.pagination import KeysetPagination
+
+
+class FeedViewSet(SafeMethodsNonAtomicMixin,
+                  mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    FeedViewSet.
+
+    List the home feed of the authenticated user, formed by his own posts,
+    the posts of the accounts that he follows and the posts of the circles
+    that he is subscribed to, the newest first.
+    """
+
+    serializer_class = PostDetailSerializer
+    permission_classes = (IsAuthenticated,)
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        """Return the posts of the feed of the authenticated user."""
+        return PostDetailSerializer.setup_eager_loading(
+            get_feed_queryset(self.request.user))
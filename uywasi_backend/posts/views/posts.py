@@ -1,27 +1,57 @@
 """Posts app Posts views."""
 
 # Django Rest Framework
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+# Local filters
+from uywasi_backend.posts.filters import NearFilterBackend, PostSearchFilter
 # Local models
-from uywasi_backend.posts.models import Post
+from uywasi_backend.posts.models import Post, Match
 # Local serializers
-from uywasi_backend.posts.serializers import PostModelSerializer, PostDetailSerializer
+from uywasi_backend.posts.serializers import (
+    PostModelSerializer, PostDetailSerializer, MatchModelSerializer,
+    PostBulkSerializer, PostDetailValuesSerializer)
+# Utils
+from uywasi_backend.utils.cache import CachedRetrieveMixin
+from uywasi_backend.utils.db import SafeMethodsNonAtomicMixin
+from uywasi_backend.utils.pagination import KeysetPagination
+from uywasi_backend.utils.values import ValuesListMixin
 
 
-class PostViewSet(viewsets.ModelViewSet):
+class PostViewSet(SafeMethodsNonAtomicMixin, CachedRetrieveMixin,
+                  ValuesListMixin, viewsets.ModelViewSet):
     """
     PostViewSet.
 
-    Allow handle CRUD actions over Post model.
+    Allow handle CRUD actions over Post model. The list can be restricted
+    to the posts around a location with ?near=<latitude>,<longitude> and
+    &radius_km=<kilometers>, and searched with ?search=<terms>. The
+    possible matches of a lost or finded post are listed in
+    /posts/<id>/matches, and a batch of posts is created in /posts/bulk.
+    The detail of a post is cached until it changes, and the list is
+    serialized from the values of the posts.
     """
 
+    values_serializer_class = PostDetailValuesSerializer
+    pagination_class = KeysetPagination
+
+    # Filtering options.
+
+    filter_backends = (NearFilterBackend, PostSearchFilter)
+
     def get_queryset(self):
         """
         get_queryset.
 
-        Return all post instances in database.
+        Return all post instances in database, with the related fields
+        loaded as needed by the serializer of the action.
         """
-        return Post.objects.all()
+        queryset = Post.objects.all()
+        if self.action in ('list', 'retrieve'):
+            return PostDetailSerializer.setup_eager_loading(queryset)
+        return queryset
 
     def get_serializer_class(self):
         """
@@ -29,10 +59,14 @@ class PostViewSet(viewsets.ModelViewSet):
 
         Define the serializer_class to use based on action.
         """
-        if self.action == 'list':
+        if self.action in ('list', 'retrieve'):
             return PostDetailSerializer
         elif self.action == 'create':
             return PostModelSerializer
+        elif self.action == 'matches':
+            return MatchModelSerializer
+        elif self.action == 'bulk':
+            return PostBulkSerializer
 
     def get_permissions(self):
         """
@@ -40,4 +74,25 @@ class PostViewSet(viewsets.ModelViewSet):
 
         Define the permissions to use based on action.
         """
+        if self.action == 'bulk':
+            return [IsAuthenticated()]
         return []
+
+    @action(detail=True, methods=['get'], filter_backends=())
+    def matches(self, request, pk=None):
+        """List the possible matches of a post, the best ones first."""
+        post = self.get_object()
+        queryset = MatchModelSerializer.setup_eager_loading(
+            Match.objects.filter(post=post).order_by('-score', '-id'))
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """Create a batch of posts of the authenticated user."""
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        posts = serializer.save()
+        data = PostModelSerializer(posts, many=True).data
+        return Response(data=data, status=status.HTTP_201_CREATED)
@@ -0,0 +1,145 @@
+"""Cache helpers shared by the apps."""
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+# Django Rest Framework
+from rest_framework.response import Response
+# Utils
+from uywasi_backend.utils.db import use_primary
+from uywasi_backend.utils.profiling import profile_serialization
+import time
+
+# Seconds between the reads of a key computed by another process.
+CACHE_LOCK_POLL_INTERVAL = 0.05
+
+
+def get_cache_version(namespace):
+    """
+    get_cache_version.
+
+    Return the current version of a cache namespace. The keys built with
+    the version are invalidated all at once by bump_cache_version. The
+    version is the timestamp of the last change of the namespace, so it
+    can be used as a last modified date too.
+    """
+    key = 'version:{}'.format(namespace)
+    version = cache.get(key)
+    if version is None:
+        version = '{:.6f}'.format(time.time())
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_cache_version(namespace):
+    """Invalidate the keys built with the current version of a namespace."""
+    cache.set('version:{}'.format(namespace),
+              '{:.6f}'.format(time.time()), timeout=None)
+
+
+def reset_cache_versions(*namespaces):
+    """
+    reset_cache_versions.
+
+    Invalidate the keys of the namespaces as bump_cache_version, but
+    removing their versions, so nothing is stored for the namespaces that
+    are never read. The next read starts a new version.
+    """
+    cache.delete_many(['version:{}'.format(namespace)
+                       for namespace in namespaces])
+
+
+def get_object_cache_namespace(model, field_name, value):
+    """Return the cache namespace of an object of a model by a unique field."""
+    return 'objects:{}:{}:{}'.format(model._meta.label_lower, field_name, value)
+
+
+def get_object_cache_namespaces(instance):
+    """
+    get_object_cache_namespaces.
+
+    Return the cache namespaces of an instance by each of its unique
+    fields, which are reset to invalidate the objects cached under any
+    lookup of it.
+    """
+    return [
+        get_object_cache_namespace(
+            type(instance), field.name, field.value_from_object(instance))
+        for field in instance._meta.concrete_fields if field.unique
+    ]
+
+
+def get_or_set_locked(key, default, timeout):
+    """
+    get_or_set_locked.
+
+    Return the value of a key, or compute it with the default callable and
+    set it. Only one process computes a missing value at a time, the other
+    ones wait for it until the lock expires, so a hot key that expires is
+    not computed by all its readers at once. The errors of the default are
+    raised and nothing is set.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+    lock = '{}:lock'.format(key)
+    lock_timeout = settings.CACHE_LOCK_TIMEOUT
+    deadline = time.monotonic() + lock_timeout
+    locked = cache.add(lock, 1, timeout=lock_timeout)
+    while not locked and time.monotonic() < deadline:
+        time.sleep(CACHE_LOCK_POLL_INTERVAL)
+        value = cache.get(key)
+        if value is not None:
+            return value
+        locked = cache.add(lock, 1, timeout=lock_timeout)
+    try:
+        value = default()
+        cache.set(key, value, timeout=timeout)
+    finally:
+        if locked:
+            cache.delete(lock)
+    return value
+
+
+class CachedRetrieveMixin:
+    """
+    CachedRetrieveMixin.
+
+    Cache the serialized data of the retrieve action under the version of
+    the object looked up, which is bumped when it is saved or deleted, see
+    get_object_cache_namespaces. The data is served without querying the
+    object, so it is only for the objects readable by anyone. The related
+    data nested in it is refreshed after retrieve_cache_timeout seconds.
+    The data is read from the primary, because the version is bumped when
+    the primary commits, before the replicas have the change.
+    """
+
+    retrieve_cache_timeout = None
+
+    def get_retrieve_cache_key(self):
+        """Return the cache key of the current data of the object."""
+        model = self.get_queryset().model
+        field_name = self.lookup_field
+        if field_name == 'pk':
+            field_name = model._meta.pk.name
+        value = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        namespace = get_object_cache_namespace(model, field_name, value)
+        return 'retrieve:{}:{}:{}'.format(
+            type(self).__name__, namespace, get_cache_version(namespace))
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return the cached data of the object, or serialize it."""
+        timeout = self.retrieve_cache_timeout
+        if timeout is None:
+            timeout = settings.RETRIEVE_CACHE_TIMEOUT
+
+        def serialize():
+            with use_primary():
+                instance = self.get_object()
+                with profile_serialization():
+                    return self.get_serializer(instance).data
+
+        data = get_or_set_locked(
+            self.get_retrieve_cache_key(), serialize, timeout)
+        return Response(data)
@@ -0,0 +1,162 @@
+"""Routing of the reads to the database replicas."""
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+# Django Rest Framework
+from rest_framework.permissions import SAFE_METHODS
+# Utils
+from contextlib import contextmanager
+from functools import wraps
+from hashlib import sha1
+import random
+import threading
+
+PIN_COOKIE_NAME = 'db_pinned'
+
+# State of the request handled by the current thread.
+_local = threading.local()
+
+
+def use_replicas():
+    """Return True if the reads of the current thread can use a replica."""
+    return getattr(_local, 'read_only', False) and \
+        not getattr(_local, 'written', False)
+
+
+@contextmanager
+def use_primary():
+    """
+    use_primary.
+
+    Send the reads of the block to the primary, even in a read only
+    request, e.g. to fill a cache that is invalidated when the primary
+    commits, which a lagging replica would fill with the old data.
+    """
+    read_only = getattr(_local, 'read_only', False)
+    _local.read_only = False
+    try:
+        yield
+    finally:
+        _local.read_only = read_only
+
+
+class ReplicaRouter:
+    """
+    ReplicaRouter.
+
+    Send the reads of the safe requests to a random replica of
+    DATABASE_REPLICAS, and everything else to the primary. The requests
+    are marked by ReplicaMiddleware, so the reads of the unsafe requests,
+    the tasks and the commands always see the primary. Once a request
+    writes, its following reads go to the primary too.
+    """
+
+    def db_for_read(self, model, **hints):
+        """Return a replica if the current request is read only."""
+        if settings.DATABASE_REPLICAS and use_replicas():
+            return random.choice(settings.DATABASE_REPLICAS)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        """Return the primary, and pin the reads of the request to it."""
+        _local.written = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Allow the relations between the primary and the replicas."""
+        aliases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        return obj1._state.db in aliases and obj2._state.db in aliases
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Migrate the primary only, the replicas are copies of it."""
+        return db == DEFAULT_DB_ALIAS
+
+
+def get_pin_key(request):
+    """
+    get_pin_key.
+
+    Return the cache key that pins the client of a request to the primary,
+    or None for the anonymous clients. The clients are identified by the
+    authorization header, so the token is never stored in the cache.
+    """
+    authorization = request.META.get('HTTP_AUTHORIZATION')
+    if not authorization:
+        return None
+    return 'db:pinned:{}'.format(sha1(authorization.encode()).hexdigest())
+
+
+def is_pinned(request):
+    """Return True if the client of a request wrote in the last seconds."""
+    if PIN_COOKIE_NAME in request.COOKIES:
+        return True
+    key = get_pin_key(request)
+    return key is not None and cache.get(key) is not None
+
+
+def pin(request, response):
+    """Pin the client of a request to the primary for some seconds."""
+    timeout = settings.DATABASE_REPLICAS_PIN_SECONDS
+    key = get_pin_key(request)
+    if key is not None:
+        cache.set(key, 1, timeout=timeout)
+    response.set_cookie(PIN_COOKIE_NAME, '1', max_age=timeout,
+                        httponly=True, samesite='Lax')
+
+
+class ReplicaMiddleware:
+    """
+    ReplicaMiddleware.
+
+    Mark the requests with a safe method as read only, so ReplicaRouter
+    sends their reads to the replicas. The clients that wrote in the last
+    DATABASE_REPLICAS_PIN_SECONDS read from the primary, so they read their
+    own writes while the replicas catch up. They are pinned with a cookie,
+    and by authorization header for the clients without cookies.
+    """
+
+    def __init__(self, get_response):
+        """Keep the next handler."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Route the reads of the request, and pin the clients that write."""
+        read_only = bool(settings.DATABASE_REPLICAS) and \
+            request.method in SAFE_METHODS and not is_pinned(request)
+        _local.read_only = read_only
+        _local.written = False
+        try:
+            response = self.get_response(request)
+            if _local.written:
+                pin(request, response)
+        finally:
+            _local.read_only = False
+            _local.written = False
+        return response
+
+
+class SafeMethodsNonAtomicMixin:
+    """
+    SafeMethodsNonAtomicMixin.
+
+    Run the requests with a safe method of a view out of the transaction
+    of ATOMIC_REQUESTS, so the reads do not open a transaction on the
+    primary when they are served by a replica. The other requests run in
+    a transaction on the primary as before.
+    """
+
+    @classmethod
+    def as_view(cls, *args, **kwargs):
+        """Wrap the view in a transaction for the unsafe methods only."""
+        view = super().as_view(*args, **kwargs)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method in SAFE_METHODS:
+                return view(request, *args, **kwargs)
+            with transaction.atomic(using=DEFAULT_DB_ALIAS):
+                return view(request, *args, **kwargs)
+
+        return transaction.non_atomic_requests(using=DEFAULT_DB_ALIAS)(wrapper)
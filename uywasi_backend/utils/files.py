@@ -0,0 +1,84 @@
+"""Concurrent writes of the uploaded files to the storage."""
+
+# Django
+from django.conf import settings
+from django.core.files.base import File
+# Utils
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    get_executor.
+
+    Return the thread pool of the storage writes of the process, bounded
+    to STORAGE_WRITE_WORKERS threads. The threads live with the process,
+    so each one keeps the connection of the storage, which is kept by
+    thread, and reuses it across requests.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.STORAGE_WRITE_WORKERS,
+                    thread_name_prefix='storage-write')
+    return _executor
+
+
+def save_files(model, data, field_names):
+    """
+    save_files.
+
+    Store concurrently the uploaded files of the data for the file fields
+    of a model, and replace them in the data by their stored names, so the
+    instance is saved without writing them again. Return the stored names
+    by field. If a write fails, the files already stored are deleted and
+    the error is raised.
+    """
+    return save_many_files(model, [data], field_names)[0]
+
+
+def save_many_files(model, data_list, field_names):
+    """Store concurrently the files of a list of data, as save_files."""
+    pending = []
+    for data in data_list:
+        futures = {}
+        for field_name in field_names:
+            value = data.get(field_name)
+            if not isinstance(value, File):
+                continue
+            field = model._meta.get_field(field_name)
+            name = field.generate_filename(None, value.name)
+            futures[field_name] = get_executor().submit(
+                field.storage.save, name, value, max_length=field.max_length)
+        pending.append(futures)
+
+    stored_list, error = [], None
+    for futures in pending:
+        stored = {}
+        for field_name, future in futures.items():
+            try:
+                stored[field_name] = future.result()
+            except Exception as exception:
+                error = error or exception
+        stored_list.append(stored)
+    if error is not None:
+        for stored in stored_list:
+            delete_files(model, stored)
+        raise error
+    for data, stored in zip(data_list, stored_list):
+        data.update(stored)
+    return stored_list
+
+
+def delete_files(model, names):
+    """Delete the stored names by field of a model, if they exist."""
+    for field_name, name in names.items():
+        storage = model._meta.get_field(field_name).storage
+        if storage.exists(name):
+            storage.delete(name)
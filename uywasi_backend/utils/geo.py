@@ -0,0 +1,105 @@
+"""Geographic helpers used for location based queries."""
+
+# Django
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import (
+    ASin, Cos, Least, Power, Radians, Sin, Sqrt)
+# Utils
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """
+    bounding_box.
+
+    Return the (min_latitude, max_latitude, min_longitude, max_longitude)
+    box that contains the circle of radius_km around the given point.
+    The longitude range is None when the box covers a pole, and it may
+    wrap around the antimeridian (min_longitude > max_longitude).
+    """
+    delta_latitude = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_latitude = max(latitude - delta_latitude, -90.0)
+    max_latitude = min(latitude + delta_latitude, 90.0)
+    if min_latitude <= -90.0 or max_latitude >= 90.0:
+        return min_latitude, max_latitude, None, None
+
+    delta_longitude = math.degrees(
+        radius_km / (EARTH_RADIUS_KM * math.cos(math.radians(latitude))))
+    if delta_longitude >= 180.0:
+        return min_latitude, max_latitude, None, None
+    min_longitude = longitude - delta_longitude
+    max_longitude = longitude + delta_longitude
+    if min_longitude < -180.0:
+        min_longitude += 360.0
+    if max_longitude > 180.0:
+        max_longitude -= 360.0
+    return min_latitude, max_latitude, min_longitude, max_longitude
+
+
+def haversine_km(latitude_from, longitude_from, latitude_to, longitude_to):
+    """Return the great circle distance in kilometers between two points."""
+    phi_from = math.radians(latitude_from)
+    phi_to = math.radians(latitude_to)
+    delta_phi = phi_to - phi_from
+    delta_lambda = math.radians(longitude_to - longitude_from)
+    a = (math.sin(delta_phi / 2) ** 2 +
+         math.cos(phi_from) * math.cos(phi_to) *
+         math.sin(delta_lambda / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def haversine_expression(latitude, longitude,
+                         latitude_field='latitude',
+                         longitude_field='longitude'):
+    """
+    haversine_expression.
+
+    Return a database expression that computes the distance in kilometers
+    from the given point to the point stored in the latitude and longitude
+    fields of each row.
+    """
+    phi = math.radians(latitude)
+    delta_phi = (Radians(F(latitude_field)) - phi) / 2
+    delta_lambda = (Radians(F(longitude_field)) - math.radians(longitude)) / 2
+    a = (Power(Sin(delta_phi), 2) +
+         math.cos(phi) * Cos(Radians(F(latitude_field))) *
+         Power(Sin(delta_lambda), 2))
+    # Rounding may push the root slightly above 1, outside of ASIN domain.
+    root = Least(Sqrt(a), Value(1.0), output_field=FloatField())
+    return 2 * EARTH_RADIUS_KM * ASin(root, output_field=FloatField())
+
+
+def grid_cell(latitude, longitude, size):
+    """Return the (row, column) of the grid cell of size degrees of a point."""
+    # The longitude 180 is the same meridian than -180.
+    longitude = (longitude + 180.0) % 360.0 - 180.0
+    return int(math.floor(latitude / size)), int(math.floor(longitude / size))
+
+
+def grid_cells_around(latitude, longitude, radius_km, size):
+    """
+    grid_cells_around.
+
+    Return the set of (row, column) grid cells of size degrees that
+    intersect the bounding box of the circle of radius_km around a point.
+    """
+    min_latitude, max_latitude, min_longitude, max_longitude = \
+        bounding_box(latitude, longitude, radius_km)
+    columns_count = int(math.ceil(360.0 / size))
+    first_column = -columns_count // 2
+    if min_longitude is None:
+        columns = range(first_column, first_column + columns_count)
+    else:
+        start = int(math.floor(min_longitude / size))
+        stop = int(math.floor(max_longitude / size))
+        if stop < start:
+            stop += columns_count
+        columns = [
+            (column - first_column) % columns_count + first_column
+            for column in range(start, stop + 1)
+        ]
+    rows = range(int(math.floor(min_latitude / size)),
+                 int(math.floor(max_latitude / size)) + 1)
+    return {(row, column) for row in rows for column in columns}
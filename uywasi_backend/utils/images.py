@@ -0,0 +1,143 @@
+"""Helpers for the uploaded images and their resized variants."""
+
+# Django
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils.translation import ugettext_lazy as _
+# Django Rest Framework
+from rest_framework import serializers
+# Utils
+from io import BytesIO
+from PIL import Image, ImageOps
+import base64
+import binascii
+import os
+import uuid
+
+# Image fields of each model whose variants are generated on upload.
+IMAGE_VARIANT_FIELDS = {
+    'accounts.UserAccount': ('profile_photo',),
+    'circles.Circle': ('profile_photo', 'cover_photo'),
+    'general.Breed': ('photo',),
+    'posts.Post': ('photo_first', 'photo_second', 'photo_third'),
+}
+
+
+def get_variant_name(name, variant):
+    """
+    get_variant_name.
+
+    Return the name of a variant of an image, it is stored alongside the
+    original, e.g. posts/pets/photos/dog.jpg -> posts/pets/photos/dog.
+    thumbnail.webp, so the url of the variant is known without query it.
+    """
+    root, extension = os.path.splitext(name)
+    return '{}.{}.webp'.format(root, variant)
+
+
+def generate_variants(field_file, overwrite=False):
+    """
+    generate_variants.
+
+    Store the WebP variants of the image of a field file, each one fitted
+    in the square of IMAGE_VARIANTS side. The variants already stored are
+    skipped unless overwrite is True. Return the names of stored variants.
+    """
+    storage = field_file.storage
+    pending = {
+        variant: get_variant_name(field_file.name, variant)
+        for variant in settings.IMAGE_VARIANTS
+    }
+    if not overwrite:
+        pending = {variant: name for variant, name in pending.items()
+                   if not storage.exists(name)}
+    if not pending:
+        return []
+
+    with field_file.open('rb') as opened:
+        image = Image.open(opened)
+        image.load()
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info
+                              else 'RGB')
+
+    stored = []
+    for variant, name in pending.items():
+        side = settings.IMAGE_VARIANTS[variant]
+        resized = image.copy()
+        resized.thumbnail((side, side), Image.LANCZOS)
+        content = BytesIO()
+        resized.save(content, format='WEBP',
+                     quality=settings.IMAGE_VARIANTS_QUALITY, method=4)
+        # The storage does not overwrite files, the name must be kept.
+        if storage.exists(name):
+            storage.delete(name)
+        stored.append(storage.save(name, ContentFile(content.getvalue())))
+    return stored
+
+
+class ImageVariantField(serializers.ReadOnlyField):
+    """
+    ImageVariantField.
+
+    Serialize the url of a variant of an image field, e.g.
+    ImageVariantField(source='photo_first', variant='thumbnail').
+    The url is built from the name of the original, without query
+    the storage, so it should be used beside the original field for
+    the clients that fall back to it while the variant is generated.
+    """
+
+    def __init__(self, variant, **kwargs):
+        """Keep the name of the variant to serialize."""
+        assert variant in settings.IMAGE_VARIANTS, (
+            'Unknown image variant {}.'.format(variant))
+        self.variant = variant
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        """Return the absolute url of the variant, or None without image."""
+        if not value:
+            return None
+        url = value.storage.url(get_variant_name(value.name, self.variant))
+        request = self.context.get('request')
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
+
+class Base64ImageField(serializers.ImageField):
+    """
+    Base64ImageField.
+
+    Deserialize an image sent as a base64 string, with or without the
+    data:image/<type>;base64, prefix, so the images can be sent in JSON
+    requests. The image is validated as the images of ImageField.
+    """
+
+    default_error_messages = {
+        'invalid_base64': _('The image must be a base64 encoded string.'),
+    }
+
+    def to_internal_value(self, data):
+        """Decode the image into a file with a random name."""
+        if not isinstance(data, str):
+            self.fail('invalid_base64')
+        if data.startswith('data:') and ';base64,' in data:
+            data = data.split(';base64,', 1)[1]
+        try:
+            content = base64.b64decode(data, validate=True)
+        except (binascii.Error, ValueError):
+            self.fail('invalid_base64')
+        name = '{}.{}'.format(uuid.uuid4().hex, self.get_extension(content))
+        return super().to_internal_value(ContentFile(content, name=name))
+
+    @staticmethod
+    def get_extension(content):
+        """Return the extension of the format of the image, jpg by default."""
+        try:
+            image_format = Image.open(BytesIO(content)).format or 'jpeg'
+        except OSError:
+            image_format = 'jpeg'
+        return 'jpg' if image_format.lower() == 'jpeg' \
+            else image_format.lower()
@@ -0,0 +1,208 @@
+"""Pagination classes shared by the list endpoints."""
+
+# Django
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import ugettext_lazy as _
+# Django Rest Framework
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination, LimitOffsetPagination, _positive_int)
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+# Utils
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from datetime import datetime
+import binascii
+import json
+
+
+class KeysetPagination(BasePagination):
+    """
+    KeysetPagination.
+
+    Paginate the querysets over the (created, id) keyset of StandardModel,
+    so every page is resolved by the composite index with a WHERE clause
+    instead of an OFFSET, and page N costs the same as page 1. The cursors
+    are opaque and allow move to the next and previous pages. It is used by
+    the lists of posts, while the other lists keep LimitOffsetPagination.
+
+    The requests that send the offset param, the querysets ordered by other
+    fields (e.g. ordering or near filters) and the models without the keyset
+    fields are paginated with LimitOffsetPagination.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = 'limit'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    ordering = ('-created', '-id')
+    fallback_class = LimitOffsetPagination
+    invalid_cursor_message = _('Invalid cursor.')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return a page of the queryset, or None if it is not paginated."""
+        self.fallback = None
+        if self.use_fallback(queryset, request):
+            self.fallback = self.fallback_class()
+            return self.fallback.paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        queryset = queryset.order_by(
+            *(self.flip(field) if reverse else field
+              for field in self.ordering))
+        if position is not None:
+            queryset = queryset.filter(self.keyset_filter(position, reverse))
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        self.next_position = self.previous_position = None
+        if results and (has_more if not reverse else True):
+            self.next_position = self.get_position(results[-1])
+        if results and (has_more if reverse else position is not None):
+            self.previous_position = self.get_position(results[0])
+        return results
+
+    def get_paginated_response(self, data):
+        """Return the page with the links to the next and previous pages."""
+        if self.fallback is not None:
+            return self.fallback.get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        """Return the schema of the paginated response."""
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def use_fallback(self, queryset, request):
+        """Return True if the queryset cannot be paginated by keyset."""
+        if self.fallback_class.offset_query_param in request.query_params:
+            return True
+        order_by = tuple(queryset.query.order_by)
+        if order_by and order_by != self.ordering:
+            return True
+        try:
+            for field in self.ordering:
+                queryset.model._meta.get_field(field.lstrip('-'))
+        except FieldDoesNotExist:
+            return True
+        return False
+
+    def get_page_size(self, request):
+        """Return the page size, limited by max_page_size."""
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def keyset_filter(self, position, reverse):
+        """
+        keyset_filter.
+
+        Return the lexicographic condition that selects the rows located
+        after the position following the ordering, or before it if the
+        page is reversed.
+        """
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            step = Q(**{'{}__{}'.format(name, 'lt' if descending else 'gt'):
+                        position[index]})
+            for previous, value in zip(self.ordering[:index], position):
+                step &= Q(**{previous.lstrip('-'): value})
+            condition |= step
+        return condition
+
+    def get_position(self, item):
+        """Return the values of the ordering fields of a result."""
+        position = []
+        for field in self.ordering:
+            name = field.lstrip('-')
+            value = item[name] if isinstance(item, dict) \
+                else getattr(item, name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            position.append(value)
+        return position
+
+    def decode_cursor(self, request):
+        """Return the position and the direction encoded in the cursor."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            cursor = json.loads(b64decode(encoded.encode('ascii')).decode())
+            position, reverse = cursor['p'], bool(cursor['r'])
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or \
+                len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return self.parse_position(position), reverse
+
+    def parse_position(self, position):
+        """
+        parse_position.
+
+        Return the created date and the id of a position decoded from a
+        cursor, or raise NotFound if they are not a date and an integer,
+        so the tampered cursors do not reach the database.
+        """
+        created, pk = position
+        try:
+            created = parse_datetime(created) if isinstance(created, str) \
+                else None
+        except ValueError:
+            created = None
+        if created is None or type(pk) is not int:
+            raise NotFound(self.invalid_cursor_message)
+        return [created, pk]
+
+    def encode_cursor(self, position, reverse):
+        """Return the url of the page that starts at the position."""
+        cursor = json.dumps({'p': position, 'r': int(reverse)})
+        encoded = b64encode(cursor.encode()).decode('ascii')
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        """Return the url of the next page."""
+        if self.next_position is None:
+            return None
+        return self.encode_cursor(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        """Return the url of the previous page."""
+        if self.previous_position is None:
+            return None
+        return self.encode_cursor(self.previous_position, reverse=True)
+
+    @staticmethod
+    def flip(field):
+        """Return the field with the opposite ordering direction."""
+        return field[1:] if field.startswith('-') else '-' + field
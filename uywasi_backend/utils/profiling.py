@@ -0,0 +1,277 @@
+"""Profiling of the requests by view and action."""
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import Http404, HttpResponse
+# Utils
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+import random
+import threading
+import time
+
+# Upper bounds in seconds of the buckets of the latency histogram.
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+METRICS = (
+    ('queries', 'Number of database queries', 1),
+    ('db_seconds', 'Time spent in database queries', 1e-6),
+    ('serializer_seconds', 'Time spent serializing the responses', 1e-6),
+)
+
+ENDPOINTS_CACHE_KEY = 'profiling:endpoints'
+
+# Profile of the request handled by the current thread.
+_local = threading.local()
+
+# Metrics of this process not flushed to the cache yet.
+_pending = Counter()
+_pending_lock = threading.Lock()
+_flushed_at = time.monotonic()
+_known_endpoints = set()
+
+
+class RequestProfile:
+    """
+    RequestProfile.
+
+    Collect the database and serializer time of a request, in seconds.
+    """
+
+    def __init__(self):
+        """Start the profile empty."""
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        """Execute a query, and count it and its time."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+
+
+@contextmanager
+def profile_serialization():
+    """
+    profile_serialization.
+
+    Add the time of the block to the serializer time of the profiled
+    request of the thread, without the time of its queries. It wraps the
+    serialization of the shared list and retrieve mixins.
+    """
+    profile = getattr(_local, 'profile', None)
+    if profile is None:
+        yield
+        return
+    start, db_time = time.perf_counter(), profile.db_time
+    try:
+        yield
+    finally:
+        profile.serializer_time += time.perf_counter() - start - \
+            (profile.db_time - db_time)
+
+
+def get_endpoint(request):
+    """
+    get_endpoint.
+
+    Return the name of the view that handled a request, with the action
+    of the viewsets, e.g. PostViewSet.list, or None if it was not resolved.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None
+    view = getattr(match.func, 'cls', None)
+    if view is None:
+        return match.view_name or match._func_path
+    actions = getattr(match.func, 'actions', None) or {}
+    action = actions.get(request.method.lower(), request.method.lower())
+    return '{}.{}'.format(view.__name__, action)
+
+
+def record(endpoint, profile, duration):
+    """
+    record.
+
+    Add the metrics of a request to the pending metrics of the process,
+    and flush them to the cache once per PROFILING_FLUSH_INTERVAL, so the
+    profiled requests do not write the cache each one.
+    """
+    global _flushed_at
+    sample = {
+        'requests': 1,
+        'queries': profile.queries,
+        'db_seconds': int(profile.db_time * 1e6),
+        'serializer_seconds': int(profile.serializer_time * 1e6),
+        'seconds': int(duration * 1e6),
+    }
+    bucket = next((str(bound) for bound in LATENCY_BUCKETS
+                   if duration <= bound), '+Inf')
+    sample['bucket:{}'.format(bucket)] = 1
+    with _pending_lock:
+        for name, value in sample.items():
+            _pending['profiling:{}:{}'.format(endpoint, name)] += value
+        _known_endpoints.add(endpoint)
+        if time.monotonic() - _flushed_at < \
+                settings.PROFILING_FLUSH_INTERVAL:
+            return
+        pending = dict(_pending)
+        _pending.clear()
+        _flushed_at = time.monotonic()
+        endpoints = set(_known_endpoints)
+    flush(pending, endpoints)
+
+
+def flush(pending, endpoints):
+    """Add the pending metrics of the process to the cache."""
+    registered = cache.get(ENDPOINTS_CACHE_KEY, set())
+    if not endpoints <= registered:
+        cache.set(ENDPOINTS_CACHE_KEY, registered | endpoints, timeout=None)
+    for key, value in pending.items():
+        if not value:
+            continue
+        try:
+            cache.incr(key, value)
+        except ValueError:
+            if not cache.add(key, value, timeout=None):
+                cache.incr(key, value)
+
+
+class ProfilingMiddleware:
+    """
+    ProfilingMiddleware.
+
+    Record the number of queries, the database time, the serializer time
+    and the total time of a sample of the requests by view and action.
+    The serializer time is the time of the blocks of profile_serialization
+    and of the rendering of the response. In DEBUG, every request is
+    profiled and the metrics are added to the response headers. The
+    aggregated metrics are served by metrics_view. It is enabled with the
+    PROFILING_ENABLED setting.
+    """
+
+    def __init__(self, get_response):
+        """Keep the next handler if the profiling is enabled."""
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Profile the request if it is sampled."""
+        if not settings.DEBUG and \
+                random.random() >= settings.PROFILING_SAMPLE_RATE:
+            return self.get_response(request)
+
+        profile = RequestProfile()
+        _local.profile = profile
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile))
+                response = self.get_response(request)
+        finally:
+            _local.profile = None
+        duration = time.perf_counter() - start
+
+        endpoint = get_endpoint(request)
+        if endpoint is not None:
+            record(endpoint, profile, duration)
+        if settings.DEBUG:
+            response['X-Query-Count'] = str(profile.queries)
+            response['Server-Timing'] = ', '.join((
+                'db;dur={:.1f}'.format(profile.db_time * 1000),
+                'serializer;dur={:.1f}'.format(profile.serializer_time * 1000),
+                'total;dur={:.1f}'.format(duration * 1000),
+            ))
+        return response
+
+    def process_template_response(self, request, response):
+        """Add the rendering of a profiled response to its serializer time."""
+        profile = getattr(_local, 'profile', None)
+        if profile is not None:
+            start = time.perf_counter()
+
+            def rendered(response):
+                profile.serializer_time += time.perf_counter() - start
+
+            response.add_post_render_callback(rendered)
+        return response
+
+
+def metrics_view(request):
+    """
+    metrics_view.
+
+    Return the aggregated metrics of the profiled requests in the text
+    format of Prometheus. It is available in DEBUG, for the staff users,
+    and for the requests with the PROFILING_METRICS_TOKEN as bearer token.
+    """
+    token = settings.PROFILING_METRICS_TOKEN
+    authorized = (
+        settings.DEBUG or
+        getattr(request, 'user', None) is not None and request.user.is_staff or
+        token and request.META.get('HTTP_AUTHORIZATION') ==
+        'Bearer {}'.format(token)
+    )
+    if not settings.PROFILING_ENABLED or not authorized:
+        raise Http404()
+
+    endpoints = sorted(cache.get(ENDPOINTS_CACHE_KEY, set()))
+    keys = [
+        'profiling:{}:{}'.format(endpoint, name)
+        for endpoint in endpoints
+        for name in ['requests', 'seconds'] +
+        [metric for metric, _, _ in METRICS] + ['bucket:{}'.format(bound) for bound in LATENCY_BUCKETS + ('+Inf',)]
+    ]
+    values = cache.get_many(keys)
+
+    def value(endpoint, name):
+        return values.get('profiling:{}:{}'.format(endpoint, name), 0)
+
+    lines = [
+        '# HELP uywasi_requests_total Number of profiled requests.',
+        '# TYPE uywasi_requests_total counter',
+    ]
+    lines += [
+        'uywasi_requests_total{{endpoint="{}"}} {}'.format(
+            endpoint, value(endpoint, 'requests'))
+        for endpoint in endpoints
+    ]
+    for metric, description, scale in METRICS:
+        lines += [
+            '# HELP uywasi_request_{}_total {}.'.format(metric, description),
+            '# TYPE uywasi_request_{}_total counter'.format(metric),
+        ]
+        lines += [
+            'uywasi_request_{}_total{{endpoint="{}"}} {:g}'.format(
+                metric, endpoint, value(endpoint, metric) * scale)
+            for endpoint in endpoints
+        ]
+    lines += [
+        '# HELP uywasi_request_duration_seconds Latency of the requests.',
+        '# TYPE uywasi_request_duration_seconds histogram',
+    ]
+    for endpoint in endpoints:
+        cumulative = 0
+        for bound in LATENCY_BUCKETS + ('+Inf',):
+            cumulative += value(endpoint, 'bucket:{}'.format(bound))
+            lines.append(
+                'uywasi_request_duration_seconds_bucket'
+                '{{endpoint="{}",le="{}"}} {}'.format(
+                    endpoint, bound, cumulative))
+        lines.append(
+            'uywasi_request_duration_seconds_sum{{endpoint="{}"}} {:g}'.format(
+                endpoint, value(endpoint, 'seconds') * 1e-6))
+        lines.append(
+            'uywasi_request_duration_seconds_count{{endpoint="{}"}} {}'.format(
+                endpoint, value(endpoint, 'requests')))
+    return HttpResponse('\n'.join(lines) + '\n',
+                        content_type='text/plain; version=0.0.4')
@@ -0,0 +1,221 @@
+"""
+Read-only serializers of the rows of .values() querysets.
+
+The list endpoints serialize many rows with the same fields, and DRF
+spends most of their time building the fields of each nested serializer
+and resolving the attributes of each instance. A ValuesSerializer reads
+the fields from the dicts of queryset.values(), following the relations
+in the same query, and prepares once per request a function by field, so
+each row costs one call by field. Its output has the same shape as the
+ModelSerializer that it replaces.
+"""
+
+# Django
+from django.core.files.storage import default_storage
+# Django Rest Framework
+from rest_framework.response import Response
+# Utils
+from uywasi_backend.utils.images import get_variant_name
+from uywasi_backend.utils.profiling import profile_serialization
+from operator import itemgetter
+
+
+class ValueField:
+    """
+    ValueField.
+
+    Serialize the value of a lookup of the row as it is, which is the
+    representation of the char, text, number, boolean and choice fields.
+    The lookup is the name of the field by default, e.g.
+    ValueField(source='useraccount__phone').
+    """
+
+    def __init__(self, source=None):
+        """Keep the lookup of the field."""
+        self.source = source
+
+    def get_lookups(self, name, prefix):
+        """Return the lookups of the field to read in .values()."""
+        return [prefix + (self.source or name)]
+
+    def get_accessor(self, name, prefix, context):
+        """Return the function that serializes the field of a row."""
+        return itemgetter(prefix + (self.source or name))
+
+
+class ChoiceDisplayValueField(ValueField):
+    """
+    ChoiceDisplayValueField.
+
+    Serialize the display of the choice of a row, as get_<field>_display,
+    e.g. ChoiceDisplayValueField(source='animal', choices=field.choices).
+    """
+
+    def __init__(self, choices, source=None):
+        """Keep the choices of the field."""
+        self.choices = choices
+        super().__init__(source)
+
+    def get_accessor(self, name, prefix, context):
+        """Return the function that displays the choice of a row."""
+        get = super().get_accessor(name, prefix, context)
+        displays = {value: str(display) for value, display in self.choices}
+
+        def accessor(row):
+            value = get(row)
+            return displays.get(value, value)
+        return accessor
+
+
+class ImageValueField(ValueField):
+    """
+    ImageValueField.
+
+    Serialize the absolute url of the stored name of an image, as
+    ImageField, or the url of one of its variants as ImageVariantField,
+    e.g. ImageValueField(source='photo_first', variant='thumbnail').
+    """
+
+    def __init__(self, source=None, variant=None):
+        """Keep the variant of the image, if any."""
+        self.variant = variant
+        super().__init__(source)
+
+    def get_accessor(self, name, prefix, context):
+        """
+        get_accessor.
+
+        Return the function that builds the url of the image of a row. The
+        root of the request is built once, instead of by url.
+        """
+        get = super().get_accessor(name, prefix, context)
+        variant, url = self.variant, default_storage.url
+        request = context.get('request')
+        root = request.build_absolute_uri('/')[:-1] if request else ''
+
+        def accessor(row):
+            value = get(row)
+            if not value:
+                return None
+            if variant is not None:
+                value = get_variant_name(value, variant)
+            location = url(value)
+            return root + location if location.startswith('/') else location
+        return accessor
+
+
+class NestedValueField(ValueField):
+    """
+    NestedValueField.
+
+    Serialize the related row of a foreign key with another
+    ValuesSerializer, from the lookups prefixed by the field, e.g.
+    NestedValueField(UserValuesSerializer). A null key is serialized as
+    None.
+    """
+
+    def __init__(self, serializer_class, source=None):
+        """Keep the serializer of the related rows."""
+        self.serializer_class = serializer_class
+        super().__init__(source)
+
+    def get_lookups(self, name, prefix):
+        """Return the key and the lookups of the related serializer."""
+        key = prefix + (self.source or name)
+        return [key] + self.serializer_class.get_lookups(key + '__')
+
+    def get_accessor(self, name, prefix, context):
+        """Return the function that serializes the related row of a row."""
+        key = prefix + (self.source or name)
+        accessors = self.serializer_class.get_accessors(key + '__', context)
+
+        def accessor(row):
+            if row[key] is None:
+                return None
+            return {field: get(row) for field, get in accessors}
+        return accessor
+
+
+class ValuesSerializer:
+    """
+    ValuesSerializer.
+
+    Read-only serializer of the rows of .values(). The fields are listed
+    in Meta.fields, in the order of the output, and the fields that are not
+    declared as attributes are ValueField of the field with the same name.
+    """
+
+    def __init__(self, context=None):
+        """Prepare the accessors of the fields for the context."""
+        self.context = context or {}
+        self.accessors = self.get_accessors('', self.context)
+
+    @classmethod
+    def get_fields(cls):
+        """Return the pairs of name and field, in the order of the output."""
+        fields = []
+        for name in cls.Meta.fields:
+            field = getattr(cls, name, None)
+            if not isinstance(field, ValueField):
+                field = ValueField()
+            fields.append((name, field))
+        return fields
+
+    @classmethod
+    def get_lookups(cls, prefix=''):
+        """Return the lookups to read in .values() for the fields."""
+        lookups = []
+        for name, field in cls.get_fields():
+            lookups += field.get_lookups(name, prefix)
+        return lookups
+
+    @classmethod
+    def get_accessors(cls, prefix, context):
+        """Return the pairs of name and accessor of the fields."""
+        return [(name, field.get_accessor(name, prefix, context))
+                for name, field in cls.get_fields()]
+
+    def values(self, queryset, *lookups):
+        """Return the rows of the queryset, with other lookups if needed."""
+        lookups = self.get_lookups() + list(lookups)
+        return queryset.values(*dict.fromkeys(lookups))
+
+    def to_representation(self, row):
+        """Return the serialized data of a row."""
+        return {name: get(row) for name, get in self.accessors}
+
+    def serialize(self, rows):
+        """Return the serialized data of the rows."""
+        accessors = self.accessors
+        return [{name: get(row) for name, get in accessors} for row in rows]
+
+
+class ValuesListMixin:
+    """
+    ValuesListMixin.
+
+    List the queryset of a viewset with its values_serializer_class
+    instead of its serializer. The rows keep the keyset fields of the
+    pagination, so they are paginated as the instances.
+    """
+
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        """List the filtered queryset from its values."""
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.values_serializer_class(
+            context=self.get_serializer_context())
+        model_fields = {
+            field.name for field in queryset.model._meta.concrete_fields}
+        ordering = getattr(self.paginator, 'ordering', None) or ()
+        rows = serializer.values(queryset, *(
+            field.lstrip('-') for field in ordering
+            if field.lstrip('-') in model_fields))
+
+        page = self.paginate_queryset(rows)
+        with profile_serialization():
+            data = serializer.serialize(page if page is not None else rows)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)